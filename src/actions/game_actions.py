@@ -1,9 +1,16 @@
+from __future__ import annotations
+
 import asyncio
+import time
 from pathlib import Path
-from typing import Optional
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from typing import TYPE_CHECKING, Optional
 from utils.logger import write_log
-from utils.response_tracker import on_response
+from utils.action_latency import mark_action, pending_action
+from utils.latency_history import get_timeouts, record_latency, record_timeout
+from utils.spans import span
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 
 async def capture_game_screenshot(
@@ -13,9 +20,20 @@ async def capture_game_screenshot(
     try:
         write_log(f"🌐 Loading game page: {game['gameUrl']}")
 
-        response = await page.goto(
-            game["gameUrl"], wait_until="networkidle", timeout=100_000
-        )
+        timeouts = get_timeouts(page)
+        load_start = time.perf_counter()
+        try:
+            with span("navigate"):
+                response = await page.goto(
+                    game["gameUrl"],
+                    wait_until="networkidle",
+                    timeout=timeouts["goto_timeout"],
+                )
+        except Exception:
+            if time.perf_counter() - load_start >= timeouts["goto_timeout"] / 1000:
+                record_timeout(page, "load", timeouts["goto_timeout"])
+            raise
+        load_time = time.perf_counter() - load_start
 
         if response is None:
             write_log("⚠️ No response received")
@@ -25,16 +43,25 @@ async def capture_game_screenshot(
             write_log(f"⚠️ Bad response status: {response.status}")
             return None
 
+        record_latency(page, "load", load_time)
+
         try:
-            await page.wait_for_selector("body", timeout=15_000)
-            await asyncio.sleep(2)  # Give game time to load
+            ready_start = time.perf_counter()
+            with span("ready"):
+                await page.wait_for_selector("body", timeout=timeouts["ready_timeout"])
+            record_latency(page, "ready", time.perf_counter() - ready_start)
+            with span("settle"):
+                await asyncio.sleep(2)  # Give game time to load
         except Exception:
+            if time.perf_counter() - ready_start >= timeouts["ready_timeout"] / 1000:
+                record_timeout(page, "ready", timeouts["ready_timeout"])
             write_log("⚠️ Timeout waiting for content, proceeding anyway")
 
         save_dir.mkdir(parents=True, exist_ok=True)
         screenshot_path = save_dir / f"{game['gameCode']}_{game['language']}.png"
 
-        await page.screenshot(path=str(screenshot_path), full_page=True)
+        with span("screenshot"):
+            await page.screenshot(path=str(screenshot_path), full_page=True)
 
         if screenshot_path.exists() and screenshot_path.stat().st_size > 1000:
             write_log(f"📸 Screenshot saved: {screenshot_path}")
@@ -52,36 +79,49 @@ async def click_by_coord(
     page: Page,
     position: tuple[int, int],
     max_attempts: int = 5,
-    idle_timeout: int = 2000,  # milliseconds
-    response_timeout: int = 5000,  # milliseconds
-    settle_delay: float = 4.0,
+    idle_timeout: Optional[int] = None,  # milliseconds
+    response_timeout: Optional[int] = None,  # milliseconds
+    settle_delay: Optional[float] = None,
     number_click: int = 3,
     click_delay: float = 0.2,  # seconds between clicks
 ) -> str:
     x, y = position
 
-    if not hasattr(page, "_response_tracked"):
-        try:
-            if "on_response" in globals():
-                page.on("response", on_response)
-            page._response_tracked = True
-
-        except Exception as e:
-            write_log(f"⚠️ Failed to enable response tracking: {e}")
+    # Unset timeouts are learned from this game's latency history
+    timeouts = get_timeouts(page)
+    idle_timeout = idle_timeout or timeouts["idle_timeout"]
+    response_timeout = response_timeout or timeouts["response_timeout"]
+    if settle_delay is None:
+        settle_delay = timeouts["settle_delay"]
 
     for attempt in range(1, max_attempts + 1):
         try:
-            for i in range(number_click):
-                await page.mouse.click(x, y)
-                if click_delay > 0 and i < number_click - 1:
-                    await asyncio.sleep(click_delay)
-
-            await asyncio.wait_for(
-                page.wait_for_load_state("networkidle", timeout=idle_timeout / 1000),
-                timeout=response_timeout / 1000,
-            )
-
-            await asyncio.sleep(settle_delay)
+            mark_action(page)
+            with span("click", f"attempt {attempt}"):
+                for i in range(number_click):
+                    await page.mouse.click(x, y)
+                    if click_delay > 0 and i < number_click - 1:
+                        await asyncio.sleep(click_delay)
+
+            # The click sample is the action's first response, recorded by the
+            # response tracker; networkidle right after a click is nearly instant
+            try:
+                with span("response"):
+                    await asyncio.wait_for(
+                        page.wait_for_load_state("networkidle", timeout=idle_timeout),
+                        timeout=response_timeout / 1000,
+                    )
+            except Exception:
+                # An action still unanswered at either budget is a censored sample
+                waited = pending_action(page)
+                if waited is not None and waited * 1000 >= min(
+                    idle_timeout, response_timeout
+                ):
+                    record_timeout(page, "click", waited * 1000)
+                raise
+
+            with span("settle"):
+                await asyncio.sleep(settle_delay)
             return "success"
 
         except asyncio.TimeoutError:
@@ -104,13 +144,15 @@ async def click_multiple_times(
 ) -> str:
     x, y = position
 
-    for i in range(times):
-        try:
-            await page.mouse.click(x, y)
-            if delay > 0:
-                await asyncio.sleep(delay)
-        except Exception as e:
-            return f"Error during click #{i+1} at ({x},{y}): {e}"
+    mark_action(page)
+    with span("click", f"x{times}"):
+        for i in range(times):
+            try:
+                await page.mouse.click(x, y)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            except Exception as e:
+                return f"Error during click #{i+1} at ({x},{y}): {e}"
 
     return "success"
 
@@ -118,7 +160,8 @@ async def click_multiple_times(
 async def capture_screenshot(page: Page, output_path: Path, mode: str) -> Path | None:
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        await page.screenshot(path=str(output_path), full_page=True)
+        with span("artifact", output_path.name):
+            await page.screenshot(path=str(output_path), full_page=True)
 
         return output_path
 
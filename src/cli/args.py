@@ -0,0 +1,265 @@
+import argparse
+from typing import List, Optional
+from core.context_pool import DEFAULT_MAX_MEMORY_MB, DEFAULT_RECYCLE_AFTER
+from core.watchdog import DEFAULT_DEADLINES
+from core.change_detector import DEFAULT_DRIFT_SAMPLE
+from utils.catalog_cache import DEFAULT_CATALOG_TTL
+from utils.logger import LOG_LEVELS
+from utils.run_analytics import DEFAULT_SINCE_DAYS
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options; interactive prompts still drive the run itself."""
+    parser = argparse.ArgumentParser(
+        prog="main.py", description="Capture and check game screenshots"
+    )
+
+    cache_group = parser.add_argument_group("asset cache")
+    cache_group.add_argument(
+        "--asset-cache",
+        action="store_true",
+        help="serve static game assets from the shared on-disk cache",
+    )
+    cache_group.add_argument(
+        "--asset-cache-size",
+        type=int,
+        default=1024,
+        metavar="MB",
+        help="maximum asset cache size before LRU eviction (default: 1024)",
+    )
+    cache_group.add_argument(
+        "--warm-cache",
+        nargs="?",
+        const="",
+        metavar="URLS_FILE",
+        help="prefetch asset URLs (one per line) into the cache and exit; "
+        "without a file, refetch entries missing from disk",
+    )
+    cache_group.add_argument(
+        "--export-cache-manifest",
+        metavar="FILE",
+        help="write the URLs currently in the asset cache to FILE and exit",
+    )
+
+    browser_group = parser.add_argument_group("browser")
+    browser_group.add_argument(
+        "--headed",
+        action="store_true",
+        help="show the browser window (default: headless)",
+    )
+    browser_group.add_argument(
+        "--chrome-path",
+        metavar="PATH",
+        help="use an installed Chrome instead of Playwright's bundled Chromium "
+        "(also read from $CHROME_PATH)",
+    )
+    browser_group.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of games checked in parallel, one warm context each (default: 1)",
+    )
+    browser_group.add_argument(
+        "--recycle-after",
+        type=int,
+        default=DEFAULT_RECYCLE_AFTER,
+        metavar="N",
+        help=f"replace a context after N games (default: {DEFAULT_RECYCLE_AFTER}, 0 = never)",
+    )
+    browser_group.add_argument(
+        "--max-context-memory",
+        type=int,
+        default=DEFAULT_MAX_MEMORY_MB,
+        metavar="MB",
+        help="replace a context once its JS heap exceeds MB "
+        f"(default: {DEFAULT_MAX_MEMORY_MB}, 0 = never)",
+    )
+
+    deadline_group = parser.add_argument_group("watchdog deadlines (seconds, 0 = off)")
+    for deadline_class, help_text in (
+        ("load", "page load and first screenshot"),
+        ("mode", "each check mode (clicks, settles and screenshots)"),
+        ("game", "the whole game, all modes included"),
+    ):
+        deadline_group.add_argument(
+            f"--{deadline_class}-deadline",
+            type=float,
+            default=DEFAULT_DEADLINES[deadline_class],
+            metavar="SEC",
+            help=f"budget for {help_text} "
+            f"(default: {DEFAULT_DEADLINES[deadline_class]:.0f})",
+        )
+
+    load_group = parser.add_argument_group(
+        "load generation (non-interactive, intended for sandbox)"
+    )
+    load_group.add_argument(
+        "--load",
+        metavar="GAME_CODE",
+        help="drive concurrent spinning sessions of one game instead of checks",
+    )
+    load_group.add_argument(
+        "--sessions",
+        type=int,
+        default=5,
+        metavar="K",
+        help="concurrent browser contexts, each with its own player token (default: 5)",
+    )
+    load_group.add_argument(
+        "--spin-rate",
+        type=float,
+        default=0.5,
+        metavar="R",
+        help="target spins per second per session (default: 0.5)",
+    )
+    load_group.add_argument(
+        "--duration", type=float, default=60, metavar="SEC", help="default: 60"
+    )
+    load_group.add_argument(
+        "--ramp-up",
+        type=float,
+        default=0,
+        metavar="SEC",
+        help="spread session starts over SEC seconds (default: 0)",
+    )
+    load_group.add_argument("--env", default="sandbox", help="default: sandbox")
+    load_group.add_argument("--oc", default="ppdemo", help="default: ppdemo")
+    load_group.add_argument("--language", default="en", help="default: en")
+    load_group.add_argument("--currency", default="USD", help="default: USD")
+    load_group.add_argument(
+        "--game-url",
+        metavar="TEMPLATE",
+        help="override the config's pp URL template, e.g. a local stand-in server",
+    )
+    load_group.add_argument(
+        "--operator-target",
+        metavar="URL",
+        help="override the config's operator API used for player tokens",
+    )
+
+    catalog_group = parser.add_argument_group("game catalog")
+    catalog_group.add_argument(
+        "--catalog-ttl",
+        type=float,
+        default=DEFAULT_CATALOG_TTL,
+        metavar="SEC",
+        help="serve the cached catalog for SEC seconds before revalidating it "
+        f"(default: {DEFAULT_CATALOG_TTL})",
+    )
+    catalog_group.add_argument(
+        "--refresh-catalog",
+        action="store_true",
+        help="revalidate the game catalog before the run instead of in the background",
+    )
+
+    parser.add_argument(
+        "--log-level",
+        choices=list(LOG_LEVELS),
+        help="drop log lines below this level (default: $LOG_LEVEL, the env "
+        "config's logLevel, or debug)",
+    )
+    parser.add_argument(
+        "--reuse-positions",
+        action="store_true",
+        help="reuse button positions found for a game in another language, "
+        "verified in a small region around them, instead of a full template search",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print an import-time breakdown and the time to first prompt, then exit",
+    )
+
+    parser.add_argument(
+        "--plan",
+        metavar="FILE",
+        help="run every env/oc/language/currency combination of a JSON run plan "
+        "in one process instead of prompting",
+    )
+
+    daemon_group = parser.add_argument_group("daemon")
+    daemon_group.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep the browser and templates warm and run jobs (run plans) "
+        "sent over a Unix socket",
+    )
+    daemon_group.add_argument(
+        "--submit",
+        metavar="FILE",
+        help="send a JSON run plan to the running daemon and stream its results",
+    )
+    daemon_group.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="daemon socket (default: .cache/daemon.sock)",
+    )
+
+    resume_group = parser.add_argument_group("resuming runs")
+    resume_group.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip checks the last interrupted run of the same env, OC, currency "
+        "and language already completed",
+    )
+    resume_group.add_argument(
+        "--start-from",
+        type=int,
+        default=1,
+        metavar="N",
+        help="start at the Nth game of the catalog (default: 1)",
+    )
+    resume_group.add_argument(
+        "--only-failed",
+        action="store_true",
+        help="only rerun checks whose latest stored result is not a pass",
+    )
+    resume_group.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only check games that are new or whose catalog entry or main bundle "
+        "changed since they last passed, plus a drift sample of the rest",
+    )
+    resume_group.add_argument(
+        "--drift-sample",
+        type=float,
+        default=DEFAULT_DRIFT_SAMPLE,
+        metavar="FRACTION",
+        help="share of unchanged games still checked by --incremental runs "
+        f"(default: {DEFAULT_DRIFT_SAMPLE})",
+    )
+
+    results_group = parser.add_argument_group("stored results")
+    results_group.add_argument(
+        "--results-history",
+        metavar="GAME_CODE",
+        help="print a game's latest check results across runs and exit",
+    )
+    results_group.add_argument(
+        "--analytics",
+        choices=["dev", "sandbox", "production"],
+        help="write trend, flake and latency summaries (Markdown and HTML) "
+        "of an environment's stored runs to _output-reports/analytics and exit",
+    )
+    results_group.add_argument(
+        "--since-days",
+        type=float,
+        default=DEFAULT_SINCE_DAYS,
+        metavar="DAYS",
+        help=f"analytics window (default: {DEFAULT_SINCE_DAYS})",
+    )
+
+    har_group = parser.add_argument_group("HAR record/replay")
+    har_group.add_argument(
+        "--har",
+        choices=["record", "replay"],
+        help="record each game's traffic to HAR archives, or replay them offline",
+    )
+    har_group.add_argument(
+        "--har-dir",
+        metavar="DIR",
+        help="directory holding HAR archives (default: .cache/har)",
+    )
+
+    return parser.parse_args(argv)
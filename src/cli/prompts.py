@@ -1,7 +1,8 @@
 from typing import Any, Dict, Literal, Optional, List
-import questionary
 import asyncio
-from questionary import Choice
+from utils.lazy_import import lazy_module
+
+questionary = lazy_module("questionary")
 
 
 def ask_environment() -> str:
@@ -20,7 +21,7 @@ def ask_games(
         return None
 
     choices = [
-        Choice(title=f"{p['gameName']} (oc: {oc})", value=oc)
+        questionary.Choice(title=f"{p['gameName']} (oc: {oc})", value=oc)
         for oc, p in providers.items()
     ]
 
@@ -39,7 +40,9 @@ def ask_language(
     if not language:
         return None
 
-    choices = [Choice(title=p["name"], value=code) for code, p in language.items()]
+    choices = [
+        questionary.Choice(title=p["name"], value=code) for code, p in language.items()
+    ]
 
     default_choice = next((c for c in choices if c.value == default_language), None)
 
@@ -0,0 +1,81 @@
+import itertools
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+from utils.mapping_utils import MODE_CHECK_MAP, reverse_mode_check
+
+
+ENVIRONMENTS = ["dev", "sandbox", "production"]
+CHECK_MODES = list(MODE_CHECK_MAP.values()) + ["all"]
+
+# Plan key -> job key; every plan key takes one value or a list of them
+PLAN_KEYS = {
+    "environments": "env",
+    "providers": "oc",
+    "languages": "language",
+    "currencies": "currency",
+}
+
+
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def load_run_plan(
+    plan_path: Path,
+    providers: Dict[str, Any],
+    languages: Dict[str, Any],
+    currencies: List[str],
+) -> List[Dict[str, Any]]:
+    with open(plan_path, "r", encoding="utf-8") as f:
+        plan = json.load(f)
+    return expand_run_plan(plan, providers, languages, currencies, source=plan_path)
+
+
+def expand_run_plan(
+    plan: Dict[str, Any],
+    providers: Dict[str, Any],
+    languages: Dict[str, Any],
+    currencies: List[str],
+    source: Any = "run plan",
+) -> List[Dict[str, Any]]:
+    """Expand a run plan into one job per env/oc/language/currency combination.
+
+    Example plan:
+
+        {
+            "environments": ["sandbox", "production"],
+            "providers": ["ppdemo", "rddemo"],
+            "languages": ["en", "fr"],
+            "currencies": "USD",
+            "modes": ["spin", "setting"]
+        }
+
+    An optional "games" list of game codes limits every job to those games.
+    Jobs are ordered by environment first, so each env's config loads once.
+    """
+    allowed = {
+        "environments": ENVIRONMENTS,
+        "providers": list(providers),
+        "languages": list(languages),
+        "currencies": currencies,
+        "modes": CHECK_MODES,
+    }
+    values = {}
+    for key, choices in allowed.items():
+        if key not in plan:
+            raise ValueError(f"{source} is missing '{key}'")
+        values[key] = _as_list(plan[key])
+        unknown = [value for value in values[key] if value not in choices]
+        if unknown or not values[key]:
+            raise ValueError(
+                f"{source}: invalid {key} {unknown or '[]'}, "
+                f"expected some of {choices}"
+            )
+
+    modes = reverse_mode_check(values["modes"])
+    games = _as_list(plan["games"]) if plan.get("games") else None
+    return [
+        dict(zip(PLAN_KEYS.values(), combination), modes=modes, games=games)
+        for combination in itertools.product(*(values[key] for key in PLAN_KEYS))
+    ]
@@ -0,0 +1,300 @@
+import asyncio
+import hashlib
+import json
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from rich.console import Console
+from utils.lazy_import import lazy_module
+from utils.logger import write_log
+from utils.paths import ASSET_CACHE_DIR
+from utils.response_tracker import TRACKED_ENDPOINTS
+
+requests = lazy_module("requests")
+
+
+CACHEABLE_TYPES = ("script", "stylesheet", "image", "font", "media")
+DEFAULT_MAX_SIZE_MB = 1024
+
+# Headers that no longer describe the (already decoded) body we store
+DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+# Headers a 304 revalidation may update on a stored entry
+FRESHNESS_HEADERS = ("cache-control", "etag", "last-modified", "expires")
+
+MAX_AGE_RE = re.compile(r"(?:^|[,\s])max-age=(\d+)")
+
+
+def max_age(headers: Dict[str, str]) -> int:
+    """Seconds a response stays fresh; 0 means revalidate before every use"""
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-cache" in cache_control:
+        return 0
+    match = MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+def validators(headers: Dict[str, str]) -> Dict[str, str]:
+    """Conditional request headers revalidating a stored response"""
+    conditional = {}
+    if headers.get("etag"):
+        conditional["if-none-match"] = headers["etag"]
+    if headers.get("last-modified"):
+        conditional["if-modified-since"] = headers["last-modified"]
+    return conditional
+
+
+class AssetCache:
+    """Content-addressed on-disk store for static game assets, shared across runs"""
+
+    def __init__(
+        self,
+        cache_dir: Path = ASSET_CACHE_DIR,
+        max_size_mb: int = DEFAULT_MAX_SIZE_MB,
+        cacheable_types: Iterable[str] = CACHEABLE_TYPES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.blob_dir = self.cache_dir / "blobs"
+        self.index_file = self.cache_dir / "index.json"
+        self.max_size = max_size_mb * 1024 * 1024
+        self.cacheable_types = tuple(cacheable_types)
+
+        # url -> {"digest", "size", "status", "headers", "last_used", "expires_at"}
+        self.index: Dict[str, Dict[str, Any]] = {}
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "evicted": 0,
+            "revalidated": 0,
+            "hit_bytes": 0,
+            "miss_bytes": 0,
+        }
+
+    def load(self):
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError) as e:
+                write_log(f"⚠️ Asset cache index unreadable, starting empty: {e}")
+                self.index = {}
+        write_log(
+            f"✅ Asset cache loaded: {len(self.index)} entries, "
+            f"{self.total_size() / 1e6:.1f} MB"
+        )
+
+    def save(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+        tmp_file.replace(self.index_file)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+
+    def total_size(self) -> int:
+        blobs = {entry["digest"]: entry["size"] for entry in self.index.values()}
+        return sum(blobs.values())
+
+    def is_cacheable(self, request) -> bool:
+        if request.method != "GET" or request.resource_type not in self.cacheable_types:
+            return False
+        return not any(endpoint in request.url for endpoint in TRACKED_ENDPOINTS)
+
+    def _write_blob(self, digest: str, body: bytes):
+        blob_path = self._blob_path(digest)
+        if blob_path.exists():
+            return
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent stores of the same asset must not share a temp file
+        tmp_path = blob_path.with_name(f"{digest}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_bytes(body)
+        tmp_path.replace(blob_path)
+
+    def _read_blob(self, digest: str) -> Optional[bytes]:
+        try:
+            return self._blob_path(digest).read_bytes()
+        except OSError:
+            return None
+
+    def _unlink_blobs(self, digests: Iterable[str]):
+        for digest in digests:
+            self._blob_path(digest).unlink(missing_ok=True)
+
+    def _add_entry(
+        self, url: str, status: int, headers: Dict[str, str], digest: str, size: int
+    ) -> List[str]:
+        """Index a stored body, returns digests of blobs evicted to make room"""
+        now = time.time()
+        self.index[url] = {
+            "digest": digest,
+            "size": size,
+            "status": status,
+            "headers": {
+                k: v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS
+            },
+            "last_used": now,
+            "expires_at": now + max_age(headers),
+        }
+        self.stats["stored"] += 1
+        return self._evict()
+
+    def _evict(self) -> List[str]:
+        """Drop least recently used entries until the store fits its size limit
+
+        Returns the digests of blobs no longer referenced, for the caller to delete.
+        """
+        total = self.total_size()
+        if total <= self.max_size:
+            return []
+
+        refs: Dict[str, int] = {}
+        for entry in self.index.values():
+            refs[entry["digest"]] = refs.get(entry["digest"], 0) + 1
+
+        orphans = []
+        for url, entry in sorted(self.index.items(), key=lambda e: e[1]["last_used"]):
+            if total <= self.max_size:
+                break
+            del self.index[url]
+            self.stats["evicted"] += 1
+            refs[entry["digest"]] -= 1
+            if refs[entry["digest"]] == 0:
+                orphans.append(entry["digest"])
+                total -= entry["size"]
+        return orphans
+
+    async def _store(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        if "no-store" in headers.get("cache-control", ""):
+            return
+        digest = hashlib.sha256(body).hexdigest()
+        # Only blob I/O runs in threads; the index is only touched on the loop
+        await asyncio.to_thread(self._write_blob, digest, body)
+        orphans = self._add_entry(url, status, headers, digest, len(body))
+        if orphans:
+            await asyncio.to_thread(self._unlink_blobs, orphans)
+
+    async def _cached_body(self, url: str, entry: Dict[str, Any]) -> Optional[bytes]:
+        body = await asyncio.to_thread(self._read_blob, entry["digest"])
+        if body is None:
+            # Blob deleted behind our back (or evicted meanwhile): drop the entry
+            if self.index.get(url) is entry:
+                del self.index[url]
+            return None
+        entry["last_used"] = time.time()
+        return body
+
+    async def _fulfill_cached(self, route, entry: Dict[str, Any], body: bytes):
+        self.stats["hits"] += 1
+        self.stats["hit_bytes"] += len(body)
+        await route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+
+    async def handle_route(self, route, request):
+        if not self.is_cacheable(request):
+            await route.fallback()
+            return
+
+        url = request.url
+        entry = self.index.get(url)
+        conditional = {}
+        if entry:
+            if time.time() < entry.get("expires_at", 0):
+                body = await self._cached_body(url, entry)
+                if body is not None:
+                    await self._fulfill_cached(route, entry, body)
+                    return
+            else:
+                conditional = validators(entry["headers"])
+
+        try:
+            if conditional:
+                response = await route.fetch(headers={**request.headers, **conditional})
+            else:
+                response = await route.fetch()
+            if conditional and response.status == 304:
+                self.stats["revalidated"] += 1
+                entry["headers"].update(
+                    {
+                        k: v
+                        for k, v in response.headers.items()
+                        if k in FRESHNESS_HEADERS
+                    }
+                )
+                entry["expires_at"] = time.time() + max_age(response.headers)
+                body = await self._cached_body(url, entry)
+                if body is not None:
+                    await self._fulfill_cached(route, entry, body)
+                    return
+                response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            write_log(f"⚠️ Asset cache fetch failed for {url}: {e}")
+            await route.fallback()
+            return
+
+        self.stats["misses"] += 1
+        self.stats["miss_bytes"] += len(body)
+        if response.status == 200:
+            await self._store(url, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    def warm(self, urls: Iterable[str], timeout: int = 10) -> int:
+        """Prefetch asset URLs into the store, returns the number of new entries"""
+        warmed = 0
+        with requests.Session() as session:
+            for url in urls:
+                if (
+                    url in self.index
+                    and self._blob_path(self.index[url]["digest"]).exists()
+                ):
+                    continue
+                try:
+                    response = session.get(url, timeout=timeout)
+                    response.raise_for_status()
+                except requests.RequestException as e:
+                    write_log(f"⚠️ Failed to warm {url}: {e}")
+                    continue
+
+                headers = {k.lower(): v for k, v in response.headers.items()}
+                if "no-store" in headers.get("cache-control", ""):
+                    continue
+                body = response.content
+                digest = hashlib.sha256(body).hexdigest()
+                self._write_blob(digest, body)
+                orphans = self._add_entry(
+                    url, response.status_code, headers, digest, len(body)
+                )
+                self._unlink_blobs(orphans)
+                warmed += 1
+
+        self.save()
+        write_log(f"🔥 Asset cache warmed with {warmed} new entries")
+        return warmed
+
+    def export_manifest(self, manifest_path: Path):
+        """Write cached URLs (one per line) so another machine can warm from them"""
+        manifest_path.write_text("\n".join(sorted(self.index)), encoding="utf-8")
+
+    def hit_ratio(self) -> float:
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+    def print_report(self, console: Console):
+        console.print(f"\n[bold blue]💾 Asset Cache Report:[/bold blue]")
+        console.print(
+            f"Hits: [green]{self.stats['hits']}[/green] "
+            f"({self.stats['hit_bytes'] / 1e6:.1f} MB from disk) / "
+            f"Misses: [red]{self.stats['misses']}[/red] "
+            f"({self.stats['miss_bytes'] / 1e6:.1f} MB from network) "
+            f"→ hit ratio {self.hit_ratio() * 100:.1f}%"
+        )
+        console.print(
+            f"Stored: {self.stats['stored']}, evicted: {self.stats['evicted']}, "
+            f"revalidated: {self.stats['revalidated']}, "
+            f"size: {self.total_size() / 1e6:.1f}/{self.max_size / 1e6:.0f} MB"
+        )
+        write_log(f"💾 Asset cache stats: {self.stats}")
@@ -0,0 +1,176 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from rich.console import Console
+from config import Config
+from core.browser_manager import BrowserManager
+from core.context_pool import ContextPool
+from core.har_archive import HarArchive
+from core.process_screenshot import load_all_templates
+from utils.catalog_cache import CatalogCache
+from utils.http_utils import get_token_by_operator_target
+from utils.logger import write_log, set_log_path
+from utils.token_pool import TokenPool
+
+
+class StartupTimer:
+    """Start offset and duration of each startup stage, plus time-to-first-game"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.stages: Dict[str, Tuple[float, float]] = {}
+        self.first_game_at: Optional[float] = None
+
+    async def track(self, stage: str, awaitable):
+        start_time = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.stages[stage] = (
+                start_time - self.started_at,
+                time.perf_counter() - start_time,
+            )
+
+    def mark_first_game(self):
+        if self.first_game_at is None:
+            self.first_game_at = time.perf_counter() - self.started_at
+
+    @property
+    def ready_at(self) -> float:
+        return max(
+            (offset + duration for offset, duration in self.stages.values()),
+            default=0.0,
+        )
+
+    def print_report(self, console: Console):
+        console.print(f"\n[bold blue]⏱️ Startup Timing:[/bold blue]")
+        for stage, (offset, duration) in sorted(
+            self.stages.items(), key=lambda item: item[1][0]
+        ):
+            console.print(f"{stage:<10} started +{offset:.2f}s, took {duration:.2f}s")
+
+        serial_time = sum(duration for _, duration in self.stages.values())
+        console.print(
+            f"Ready after {self.ready_at:.2f}s (stages add up to {serial_time:.2f}s)"
+        )
+        if self.first_game_at is not None:
+            console.print(f"Time to first game: {self.first_game_at:.2f}s")
+
+    def log_stages(self):
+        write_log(
+            "⏱️ Startup stages: "
+            + ", ".join(
+                f"{stage}={duration:.2f}s"
+                for stage, (_, duration) in self.stages.items()
+            )
+            + f", ready after {self.ready_at:.2f}s"
+        )
+
+
+async def _start_browser(browser_manager: BrowserManager, pool: ContextPool):
+    await browser_manager.launch()
+    await pool.start()
+
+
+def _fetch_catalog(catalog: CatalogCache, force_refresh: bool) -> List[Dict[str, Any]]:
+    catalog.get_games(force_refresh=force_refresh)
+    return catalog.latest_games()
+
+
+async def bootstrap(
+    timer: StartupTimer,
+    env: str,
+    oc: str,
+    language: str,
+    currency: str,
+    modes: List[str],
+    browser_manager: BrowserManager,
+    pool: ContextPool,
+    har_archive: Optional[HarArchive] = None,
+    catalog_options: Optional[Dict[str, Any]] = None,
+    console: Optional[Console] = None,
+    templates_store: Optional[Dict[Tuple[str, str], List[Dict]]] = None,
+    token_pool: Optional[TokenPool] = None,
+) -> Optional[Tuple[str, List[Dict[str, Any]], Dict[str, List[Dict]]]]:
+    """Get the token and catalog, load templates and warm the browser concurrently.
+
+    A browser that is already running is reused. With a `templates_store`,
+    each oc's templates are loaded once per mode and kept there. With a
+    `token_pool`, the token is taken from those pre-created in the background.
+
+    Returns (token, games, templates_cache), or None when startup failed.
+    """
+    console = console or Console()
+    catalog_options = dict(catalog_options or {})
+    force_refresh = catalog_options.pop("force_refresh", False)
+    game_config = Config.get("game")
+
+    manifest = None
+    if har_archive and har_archive.mode == "replay":
+        # Replay runs fully offline: token and catalog come from the recording
+        try:
+            manifest = har_archive.load_manifest()
+        except FileNotFoundError as e:
+            write_log(f"❌ {e}")
+            return None
+
+    stages = {}
+    if browser_manager.browser is None:
+        stages["browser"] = _start_browser(browser_manager, pool)
+    store = templates_store if templates_store is not None else {}
+    templates_cache = {mode: store[oc, mode] for mode in modes if (oc, mode) in store}
+    missing_modes = [mode for mode in modes if mode not in templates_cache]
+    if missing_modes:
+        stages["templates"] = asyncio.to_thread(load_all_templates, oc, missing_modes)
+
+    catalog = None
+    if manifest is None:
+        catalog = CatalogCache(
+            env, oc, game_config.get("serviceGameClientTarget"), **catalog_options
+        )
+        if token_pool:
+            stages["token"] = asyncio.to_thread(token_pool.get, currency, language)
+        else:
+            stages["token"] = asyncio.to_thread(
+                get_token_by_operator_target,
+                operator_target=game_config.get("operatorTarget"),
+                currency=currency,
+                language=language,
+            )
+        stages["catalog"] = asyncio.to_thread(_fetch_catalog, catalog, force_refresh)
+
+    results = await asyncio.gather(
+        *(timer.track(stage, awaitable) for stage, awaitable in stages.items()),
+        return_exceptions=True,
+    )
+    results = dict(zip(stages, results))
+    timer.log_stages()
+
+    for stage, result in results.items():
+        if isinstance(result, Exception):
+            write_log(f"❌ Startup stage '{stage}' failed: {result}")
+            return None
+
+    for mode, templates in results.get("templates", {}).items():
+        templates_cache[mode] = store[oc, mode] = templates
+    if not any(templates_cache.values()):
+        write_log("❌ No templates loaded for any mode, exiting")
+        return None
+
+    if manifest is not None:
+        token, games = manifest["token"], manifest["games"]
+        set_log_path(token, language)
+        write_log(f"📼 Replaying {len(games)} games from {har_archive.archive_dir}")
+        return token, games, templates_cache
+
+    token, games = results["token"], results["catalog"]
+    if not token:
+        write_log("⚠️ Failed to obtain player token!")
+        return None
+
+    set_log_path(token, language)
+    catalog.print_diff(console)
+    if har_archive:
+        har_archive.save_manifest(token, games)
+
+    return token, games, templates_cache
@@ -1,13 +1,52 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
 from pathlib import Path
-from typing import Optional, Union
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from typing import TYPE_CHECKING, Optional, Union
 from utils.logger import write_log
+from utils.response_tracker import on_response, on_request_finished
+from core.request_policy import RequestPolicy
+from core.asset_cache import AssetCache
+from core.har_archive import HarArchive
+from core.change_detector import ChangeDetector
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
+
+def _default_profile_dir() -> Path:
+    if sys.platform == "darwin":
+        return Path.home() / "Library/Application Support/Google/Chrome"
+    if sys.platform.startswith("win"):
+        return Path(os.environ.get("LOCALAPPDATA", "")) / "Google/Chrome/User Data"
+    return Path.home() / ".config/google-chrome"
 
 
 class BrowserManager:
-    def __init__(self, headless: bool = True, use_profile: bool = False, **kwargs):
+    def __init__(
+        self,
+        headless: bool = True,
+        use_profile: bool = False,
+        request_policy: Optional[RequestPolicy] = None,
+        asset_cache: Optional[AssetCache] = None,
+        har_archive: Optional[HarArchive] = None,
+        change_detector: Optional[ChangeDetector] = None,
+        track_bundles: bool = False,
+        executable_path: Optional[str] = None,
+        **kwargs,
+    ):
         self.headless = headless
         self.use_profile = use_profile
+        # None means Playwright's bundled Chromium, which works on any platform
+        self.executable_path = executable_path or os.environ.get("CHROME_PATH")
+        self.request_policy = request_policy
+        self.asset_cache = asset_cache
+        self.har_archive = har_archive
+        self.change_detector = change_detector
+        # Batch runs set a detector per combination on contexts created earlier
+        self.track_bundles = track_bundles or change_detector is not None
         self.browser_options = {
             "headless": headless,
             "args": [
@@ -20,37 +59,96 @@ class BrowserManager:
         self.playwright = None
         self.browser: Optional[Union[Browser, BrowserContext]] = None
         self.is_persistent = False
+        self.launch_time = 0.0
 
     async def launch(self) -> Union[Browser, BrowserContext]:
         try:
+            start_time = time.perf_counter()
+            # Imported on first launch, runs without a browser never pay for it
+            from playwright.async_api import async_playwright
+
             self.playwright = await async_playwright().start()
-            chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+            browser_name = (
+                "Google Chrome" if self.executable_path else "Bundled Chromium"
+            )
 
             if self.use_profile:
-                user_data_dir = str(
-                    Path.home() / "Library/Application Support/Google/Chrome"
-                )
                 self.browser = await self.playwright.chromium.launch_persistent_context(
-                    user_data_dir=user_data_dir,
-                    executable_path=chrome_path,
+                    user_data_dir=str(_default_profile_dir()),
+                    executable_path=self.executable_path,
                     **self.browser_options,
                 )
                 self.is_persistent = True
-                write_log("✅ Google Chrome launched with real user profile")
+                await self._setup_context(self.browser)
+                write_log(f"✅ {browser_name} launched with real user profile")
             else:
                 self.browser = await self.playwright.chromium.launch(
-                    executable_path=chrome_path,
+                    executable_path=self.executable_path,
                     **self.browser_options,
                 )
                 self.is_persistent = False
-                write_log("✅ Google Chrome launched (fresh instance)")
+                write_log(f"✅ {browser_name} launched (fresh instance)")
 
+            self.launch_time = time.perf_counter() - start_time
+            write_log(
+                f"⏱️ Browser launch took {self.launch_time:.2f}s "
+                f"(headless={self.headless})"
+            )
             return self.browser
 
         except Exception as e:
-            write_log(f"❌ Error launching Chrome: {str(e)}")
+            write_log(f"❌ Error launching browser: {str(e)}")
             raise
 
+    async def _setup_context(self, context: BrowserContext):
+        """Install request routing on a freshly created context"""
+        context.on("response", on_response)
+        context.on("requestfinished", on_request_finished)
+        if self.track_bundles:
+            context.on("response", self._on_game_response)
+
+        # Playwright runs the most recently registered route first: replay is
+        # the last resort, and the cache only sees requests the policy allowed
+        if self.har_archive and self.har_archive.mode == "replay":
+            await context.route("**/*", self.har_archive.handle_route)
+            write_log("📼 HAR replay routing enabled")
+        elif self.har_archive:
+            context.on("requestfinished", self.har_archive.on_request_finished)
+            write_log("📼 HAR recording enabled")
+
+        if self.asset_cache:
+            await context.route("**/*", self.asset_cache.handle_route)
+            write_log("💾 Asset cache routing enabled")
+
+        if self.request_policy and self.request_policy.enabled:
+            await context.route("**/*", self.request_policy.handle_route)
+            context.on("requestfinished", self.request_policy.on_request_finished)
+            write_log("🚦 Request policy routing enabled")
+
+    async def _on_game_response(self, response):
+        # Looked up per response: batch runs swap the detector between combinations
+        if self.change_detector:
+            await self.change_detector.on_response(response)
+
+    def start_game(self, page: Page, game_code: str):
+        """Attribute the page's upcoming traffic to a game"""
+        if self.request_policy:
+            self.request_policy.start_game(page, game_code)
+        if self.har_archive:
+            self.har_archive.start_game(page, game_code)
+        if self.change_detector:
+            self.change_detector.start_game(page, game_code)
+
+    def record_load_time(self, page: Page, load_time: float):
+        if self.request_policy:
+            self.request_policy.finish_game(page, load_time)
+
+    def finish_game(self, page: Page):
+        if self.har_archive:
+            self.har_archive.finish_game(page)
+        if self.change_detector:
+            self.change_detector.finish_game(page)
+
     async def new_page(self) -> Page:
         if not self.browser:
             raise RuntimeError("Browser not launched")
@@ -59,13 +157,24 @@ class BrowserManager:
             page = await self.browser.new_page()
         else:
             context = await self.browser.new_context()
+            await self._setup_context(context)
             page = await context.new_page()
 
         write_log("✅ New page created")
         return page
 
+    async def close_page(self, page: Page):
+        """Close a page together with its context (unless the context is shared)"""
+        if self.is_persistent:
+            await page.close()
+        else:
+            await page.context.close()
+
     async def close(self):
         try:
+            if self.asset_cache:
+                self.asset_cache.save()
+
             if self.browser:
                 await self.browser.close()
                 write_log("✅ Browser closed")
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from rich.console import Console
+from utils.csv_logger import now_utc_iso
+from utils.http_utils import probe_asset
+from utils.logger import write_log
+from utils.paths import FINGERPRINT_DIR
+
+
+DEFAULT_DRIFT_SAMPLE = 0.1  # share of unchanged games still checked each run
+PROBE_WORKERS = 8
+PROBE_TIMEOUT = 10  # seconds per bundle probe
+VALIDATORS = ("etag", "last_modified", "content_length")
+
+
+def catalog_fingerprint(game: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(game, sort_keys=True).encode()).hexdigest()
+
+
+def _normalize(validator: Optional[str]) -> Optional[str]:
+    # Servers weaken ETags of compressed responses
+    return validator.removeprefix("W/") if validator else validator
+
+
+class ChangeDetector:
+    """Schedules only new or changed games, from catalog entries and main bundles
+
+    The fingerprints of every game that passed all its checks are stored per
+    env and oc. A game's main bundle is the largest script its page loads; the
+    next run probes it with a conditional request instead of loading the game.
+    """
+
+    def __init__(
+        self,
+        env: str,
+        oc: str,
+        drift_sample: float = DEFAULT_DRIFT_SAMPLE,
+        store_dir: Path = FINGERPRINT_DIR,
+    ):
+        self.drift_sample = drift_sample
+        self.store_file = store_dir / f"{env}_{oc}.json"
+
+        self.fingerprints: Dict[str, Dict[str, Any]] = {}
+        self._page_games: Dict[Any, str] = {}
+        self._started: Dict[str, float] = {}
+        self._bundles: Dict[str, Dict[str, Any]] = {}
+        self._durations: Dict[str, float] = {}
+        self._failed: Set[str] = set()
+        self.plan_stats = {
+            "new": 0,
+            "catalog": 0,
+            "bundle": 0,
+            "drift": 0,
+            "skipped": 0,
+        }
+        self.time_saved = 0.0
+        self.probe_time = 0.0
+
+    def load(self):
+        if not self.store_file.exists():
+            return
+        try:
+            with open(self.store_file, "r", encoding="utf-8") as f:
+                self.fingerprints = json.load(f)
+        except (OSError, ValueError) as e:
+            write_log(f"⚠️ Game fingerprints unreadable, checking every game: {e}")
+
+    def save(self, games: List[Dict[str, Any]]):
+        """Store fingerprints of the games that passed every check this run"""
+        for game in games:
+            code = game.get("code")
+            if code in self._failed:
+                # Never skip a game whose last check failed
+                self.fingerprints.pop(code, None)
+            elif code in self._bundles:
+                self.fingerprints[code] = {
+                    "catalog": catalog_fingerprint(game),
+                    "bundle": self._bundles[code],
+                    "duration": self._durations.get(code, 0.0),
+                    "checked_at": now_utc_iso(),
+                }
+
+        self.store_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.store_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.fingerprints, f)
+        tmp_file.replace(self.store_file)
+
+    def _bundle_changed(self, bundle: Dict[str, Any]) -> bool:
+        try:
+            current = probe_asset(bundle["url"], bundle, timeout=PROBE_TIMEOUT)
+        except Exception as e:
+            write_log(f"⚠️ Bundle probe failed, rechecking game: {e}")
+            return True
+        # Compare the strongest validator recorded; content length last, as it
+        # depends on the encoding the browser negotiated
+        for name in VALIDATORS:
+            if bundle.get(name):
+                return _normalize(bundle[name]) != _normalize(current.get(name))
+        return True
+
+    def plan(self, games: List[Dict[str, Any]]) -> Set[str]:
+        """Codes of the games to check: new, changed and a drift sample of the rest"""
+        start_time = time.perf_counter()
+        scheduled: Set[str] = set()
+        candidates = []
+        for game in games:
+            code = game.get("code")
+            record = self.fingerprints.get(code)
+            if record is None:
+                self.plan_stats["new"] += 1
+                scheduled.add(code)
+            elif record["catalog"] != catalog_fingerprint(game):
+                self.plan_stats["catalog"] += 1
+                scheduled.add(code)
+            else:
+                candidates.append(code)
+
+        with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+            changed = executor.map(
+                lambda code: self._bundle_changed(self.fingerprints[code]["bundle"]),
+                candidates,
+            )
+            unchanged = []
+            for code, bundle_changed in zip(candidates, changed):
+                if bundle_changed:
+                    self.plan_stats["bundle"] += 1
+                    scheduled.add(code)
+                else:
+                    unchanged.append(code)
+
+        # The games checked longest ago are sampled first, so drift checks rotate
+        unchanged.sort(key=lambda code: self.fingerprints[code]["checked_at"])
+        sample_size = math.ceil(len(unchanged) * self.drift_sample)
+        scheduled.update(unchanged[:sample_size])
+        skipped = unchanged[sample_size:]
+
+        self.plan_stats["drift"] = sample_size
+        self.plan_stats["skipped"] = len(skipped)
+        self.time_saved = sum(self.fingerprints[code]["duration"] for code in skipped)
+        self.probe_time = time.perf_counter() - start_time
+        write_log(f"🧬 Incremental plan: {self.plan_stats}")
+        return scheduled
+
+    def start_game(self, page, game_code: str):
+        self._page_games[page] = game_code
+        self._started[game_code] = time.monotonic()
+        self._bundles.pop(game_code, None)
+
+    def finish_game(self, page):
+        game_code = self._page_games.pop(page, None)
+        if game_code in self._started:
+            self._durations[game_code] = time.monotonic() - self._started.pop(game_code)
+
+    def mark_done(self, game_code: str, mode: str, status: str):
+        if status != "success":
+            self._failed.add(game_code)
+
+    async def on_response(self, response):
+        try:
+            game_code = self._page_games.get(response.frame.page)
+            if not game_code or response.request.resource_type != "script":
+                return
+            # The body size as transferred, as content-length is missing on
+            # chunked responses; unlike body() this doesn't copy the script over
+            size = (await response.request.sizes())["responseBodySize"]
+            headers = response.headers
+            bundle = {
+                "url": response.url,
+                "etag": headers.get("etag"),
+                "last_modified": headers.get("last-modified"),
+                "content_length": headers.get("content-length"),
+                "size": size,
+            }
+            current = self._bundles.get(game_code)
+            if current is None or size > current["size"]:
+                self._bundles[game_code] = bundle
+        except Exception as e:
+            write_log(f"⚠️ Error fingerprinting bundle: {e}")
+
+    def print_report(self, console: Console):
+        stats = self.plan_stats
+        console.print(f"\n[bold blue]🧬 Incremental Run:[/bold blue]")
+        console.print(
+            f"Checked: {stats['new']} new, {stats['catalog']} catalog changes, "
+            f"{stats['bundle']} bundle changes, {stats['drift']} drift samples"
+        )
+        console.print(
+            f"Skipped unchanged: {stats['skipped']} games, "
+            f"~{self.time_saved / 60:.1f} min saved "
+            f"(bundle probes took {self.probe_time:.1f}s)"
+        )
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, List, Optional
+from rich.console import Console
+from core.browser_manager import BrowserManager
+from utils.logger import write_log
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+DEFAULT_RECYCLE_AFTER = 25  # games
+DEFAULT_MAX_MEMORY_MB = 1024
+CLOSE_TIMEOUT = 10  # seconds
+CREATE_ATTEMPTS = 3  # when replacing a recycled context
+CREATE_RETRY_DELAY = 2  # seconds
+
+
+class PoolExhausted(Exception):
+    """Every context failed to be replaced, so no game can run anymore"""
+
+
+class PooledPage:
+    """A warm page with its own context, plus bookkeeping for recycling"""
+
+    def __init__(self, slot_id: int, page: Page):
+        self.slot_id = slot_id
+        self.page = page
+        self.created_at = time.perf_counter()
+        self.games = 0
+
+
+class ContextPool:
+    """Keeps warm browser contexts and recycles them after N games or on memory growth"""
+
+    def __init__(
+        self,
+        browser_manager: BrowserManager,
+        size: int = 1,
+        recycle_after: int = DEFAULT_RECYCLE_AFTER,
+        max_memory_mb: int = DEFAULT_MAX_MEMORY_MB,
+    ):
+        self.browser_manager = browser_manager
+        self.size = size
+        self.recycle_after = recycle_after
+        self.max_memory = max_memory_mb * 1024 * 1024
+
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self.lifetimes: List[float] = []
+        self.games_per_context: List[int] = []
+        self.recycles = Counter()
+
+    async def start(self):
+        slots = await asyncio.gather(
+            *(self._create(slot_id) for slot_id in range(self.size))
+        )
+        for slot in slots:
+            self._idle.put_nowait(slot)
+        write_log(f"✅ Context pool ready with {self.size} warm context(s)")
+
+    async def _create(self, slot_id: int) -> PooledPage:
+        page = await self.browser_manager.new_page()
+        return PooledPage(slot_id, page)
+
+    async def acquire(self) -> PooledPage:
+        slot = await self._idle.get()
+        if slot is None:
+            # Pass the marker on, so every waiting worker learns it too
+            self._idle.put_nowait(None)
+            raise PoolExhausted("no browser context left in the pool")
+        return slot
+
+    async def release(self, slot: PooledPage, broken: bool = False):
+        """Return a slot to the pool, replacing its context if it is due for recycling"""
+        slot.games += 1
+
+        reason = None
+        if broken:
+            reason = "broken"
+        elif self.recycle_after and slot.games >= self.recycle_after:
+            reason = "game_limit"
+        elif self.max_memory and await self._memory_usage(slot.page) > self.max_memory:
+            reason = "memory_limit"
+
+        if reason:
+            slot = await self.recycle(slot, reason)
+        if slot is not None:
+            await self._idle.put(slot)
+            return
+
+        self.size -= 1
+        write_log(f"⚠️ Context pool shrunk to {self.size} context(s)")
+        if self.size == 0:
+            await self._idle.put(None)
+
+    async def recycle(self, slot: PooledPage, reason: str) -> Optional[PooledPage]:
+        """Replace a slot's context; None when no new context could be created"""
+        self._retire(slot)
+        self.recycles[reason] += 1
+        write_log(
+            f"♻️ Recycling context #{slot.slot_id} after {slot.games} games ({reason})"
+        )
+        try:
+            # A hung page can also hang its teardown
+            await asyncio.wait_for(
+                self.browser_manager.close_page(slot.page), CLOSE_TIMEOUT
+            )
+        except Exception as e:
+            write_log(f"⚠️ Error closing recycled context: {e}")
+
+        for attempt in range(1, CREATE_ATTEMPTS + 1):
+            try:
+                return await self._create(slot.slot_id)
+            except Exception as e:
+                write_log(
+                    f"⚠️ Creating context #{slot.slot_id} failed "
+                    f"(attempt {attempt}/{CREATE_ATTEMPTS}): {e}"
+                )
+                if attempt < CREATE_ATTEMPTS:
+                    await asyncio.sleep(CREATE_RETRY_DELAY)
+        write_log(f"❌ Dropping context #{slot.slot_id} from the pool")
+        return None
+
+    def _retire(self, slot: PooledPage):
+        self.lifetimes.append(time.perf_counter() - slot.created_at)
+        self.games_per_context.append(slot.games)
+
+    async def _memory_usage(self, page: Page) -> int:
+        """JS heap used by the page in bytes (0 when not measurable)"""
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            try:
+                await cdp.send("Performance.enable")
+                result = await cdp.send("Performance.getMetrics")
+            finally:
+                await cdp.detach()
+        except Exception:
+            return 0
+
+        metrics = {m["name"]: m["value"] for m in result.get("metrics", [])}
+        return int(metrics.get("JSHeapUsedSize", 0))
+
+    async def close(self):
+        while not self._idle.empty():
+            slot = self._idle.get_nowait()
+            if slot is None:
+                continue
+            self._retire(slot)
+            try:
+                await self.browser_manager.close_page(slot.page)
+            except Exception:
+                pass
+
+    def print_report(self, console: Optional[Console] = None):
+        console = console or Console()
+        console.print(f"\n[bold blue]🧭 Browser Pool Metrics:[/bold blue]")
+        console.print(
+            f"Launch time: {self.browser_manager.launch_time:.2f}s, "
+            f"pool size: {self.size}, contexts retired: {len(self.lifetimes)}"
+        )
+        if self.lifetimes:
+            avg_lifetime = sum(self.lifetimes) / len(self.lifetimes)
+            avg_games = sum(self.games_per_context) / len(self.games_per_context)
+            console.print(
+                f"Context lifetime: avg {avg_lifetime:.1f}s, max {max(self.lifetimes):.1f}s "
+                f"({avg_games:.1f} games per context)"
+            )
+        recycles = ", ".join(f"{k}={v}" for k, v in self.recycles.items()) or "none"
+        console.print(f"Recycles: {sum(self.recycles.values())} ({recycles})")
+        write_log(
+            f"🧭 Pool metrics: launch={self.browser_manager.launch_time:.2f}s "
+            f"lifetimes={self.lifetimes} recycles={dict(self.recycles)}"
+        )
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import socket
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator
+from utils.logger import write_log
+from utils.mapping_utils import map_mode_check_display
+from utils.paths import DAEMON_SOCKET
+
+Event = Dict[str, Any]
+Emit = Callable[[Event], Awaitable[None]]
+JobHandler = Callable[[Dict[str, Any], Emit], Awaitable[None]]
+
+
+class JobServer:
+    """Accepts JSON jobs on a Unix socket and streams their events back as JSON lines
+
+    A client sends one job per connection as a single JSON line and reads events
+    until the connection closes. Jobs share one browser, so they run one at a time.
+    """
+
+    def __init__(self, handler: JobHandler, socket_path: Path = DAEMON_SOCKET):
+        self.handler = handler
+        self.socket_path = Path(socket_path)
+        self.jobs_run = 0
+        self._lock = asyncio.Lock()
+
+    async def serve(self):
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(
+            self._handle_client, path=str(self.socket_path)
+        )
+        write_log(f"🛰️ Daemon listening on {self.socket_path}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.socket_path.unlink(missing_ok=True)
+
+    async def _handle_client(self, reader, writer):
+        async def emit(event: Event):
+            # A caller that hung up doesn't stop its job
+            if writer.is_closing():
+                return
+            writer.write((json.dumps(event) + "\n").encode())
+            try:
+                # Wait for a slow client rather than buffering without limit
+                await writer.drain()
+            except (ConnectionError, OSError):
+                pass
+
+        try:
+            job = json.loads(await reader.readline())
+            if not isinstance(job, dict):
+                raise ValueError("a job must be a JSON object")
+        except ValueError as e:
+            await emit({"event": "error", "message": f"Invalid job: {e}"})
+        else:
+            if self._lock.locked():
+                await emit({"event": "queued"})
+            async with self._lock:
+                await self._run(job, emit)
+
+        try:
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+    async def _run(self, job: Dict[str, Any], emit: Emit):
+        start_time = time.perf_counter()
+        await emit({"event": "started"})
+        try:
+            await self.handler(job, emit)
+        except Exception as e:
+            write_log(f"❌ Daemon job failed: {e}")
+            await emit({"event": "error", "message": str(e)})
+        else:
+            await emit({"event": "done", "elapsed": time.perf_counter() - start_time})
+        finally:
+            self.jobs_run += 1
+
+
+def submit_job(
+    job: Dict[str, Any], socket_path: Path = DAEMON_SOCKET
+) -> Iterator[Event]:
+    """Send a job to a running daemon and yield its events as they arrive"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall((json.dumps(job) + "\n").encode())
+        with client.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                yield json.loads(line)
+
+
+class ResultStream:
+    """Result observer forwarding every recorded check to a daemon client
+
+    Results arrive in batches, as they are flushed to the results store.
+    They are recorded synchronously, so their events are queued and sent in
+    order by one task; `flush` waits until the client has received them all.
+    """
+
+    def __init__(self, emit: Emit, **labels: Any):
+        self.emit = emit
+        self.labels = labels
+        self._events = deque()
+        self._sender = None
+
+    def mark_done(self, game_code: str, mode: str, status: str):
+        self._events.append(
+            {
+                "event": "result",
+                **self.labels,
+                "game": game_code,
+                "mode": map_mode_check_display(mode),
+                "status": status,
+            }
+        )
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.get_running_loop().create_task(self._send())
+
+    async def _send(self):
+        while self._events:
+            await self.emit(self._events.popleft())
+
+    async def flush(self):
+        if self._sender is not None:
+            await self._sender
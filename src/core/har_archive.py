@@ -0,0 +1,207 @@
+import base64
+import json
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Literal
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from rich.console import Console
+from utils.logger import write_log
+from utils.paths import HAR_DIR
+
+
+HarMode = Literal["record", "replay"]
+
+# Query parameters that change between loads without changing the response
+VOLATILE_QUERY_PARAMS = ("_", "ts", "timestamp", "nocache", "rnd")
+
+
+def normalize_url(url: str) -> str:
+    parsed = urlparse(url)
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if k not in VOLATILE_QUERY_PARAMS
+    ]
+    return urlunparse(parsed._replace(query=urlencode(sorted(query)), fragment=""))
+
+
+def _header_list(headers: Dict[str, str]) -> List[Dict[str, str]]:
+    return [{"name": k, "value": v} for k, v in headers.items()]
+
+
+class HarArchive:
+    """Per-game HAR recording and offline replay through Playwright routing"""
+
+    def __init__(
+        self, mode: HarMode, env: str, oc: str, language: str, har_dir: Path = HAR_DIR
+    ):
+        self.mode = mode
+        self.archive_dir = Path(har_dir) / env / f"{oc}_{language}"
+
+        self._page_games: Dict[Any, str] = {}
+        self._entries: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._replay: Dict[Any, Dict[tuple, Deque[Dict[str, Any]]]] = {}
+        self.stats = {"recorded": 0, "replayed": 0, "missed": 0}
+
+    def _har_path(self, game_code: str) -> Path:
+        return self.archive_dir / f"{game_code}.har"
+
+    def _manifest_path(self) -> Path:
+        return self.archive_dir / "manifest.json"
+
+    def save_manifest(self, token: str, games: List[Dict[str, Any]]):
+        """Store what replay needs instead of the token and catalog API calls"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._manifest_path(), "w", encoding="utf-8") as f:
+            json.dump({"token": token, "games": games}, f, ensure_ascii=False)
+
+    def load_manifest(self) -> Dict[str, Any]:
+        manifest_path = self._manifest_path()
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No HAR manifest found: {manifest_path}")
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def start_game(self, page, game_code: str):
+        self._page_games[page] = game_code
+
+        if self.mode == "record":
+            self._entries[game_code] = []
+            return
+
+        replay: Dict[tuple, Deque[Dict[str, Any]]] = defaultdict(deque)
+        har_path = self._har_path(game_code)
+        if har_path.exists():
+            with open(har_path, "r", encoding="utf-8") as f:
+                for entry in json.load(f)["log"]["entries"]:
+                    request = entry["request"]
+                    key = (request["method"], normalize_url(request["url"]))
+                    replay[key].append(entry)
+        else:
+            write_log(f"⚠️ No HAR archive for game {game_code}: {har_path}")
+        self._replay[page] = replay
+
+    def finish_game(self, page):
+        game_code = self._page_games.pop(page, None)
+        self._replay.pop(page, None)
+        if self.mode != "record" or not game_code:
+            return
+
+        entries = self._entries.pop(game_code, [])
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        har = {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "automation-framework", "version": "0.1.0"},
+                "entries": entries,
+            }
+        }
+        with open(self._har_path(game_code), "w", encoding="utf-8") as f:
+            json.dump(har, f)
+        write_log(f"📼 HAR saved for {game_code}: {len(entries)} entries")
+
+    async def on_request_finished(self, request):
+        try:
+            game_code = self._page_games.get(request.frame.page)
+            if not game_code:
+                return
+            response = await request.response()
+            if response is None:
+                return
+            body = await response.body()
+        except Exception:
+            return
+
+        timing = request.timing
+        started = datetime.fromtimestamp(timing["startTime"] / 1000, timezone.utc)
+        wait = max(timing["responseStart"] - timing["requestStart"], 0)
+        receive = max(timing["responseEnd"] - timing["responseStart"], 0)
+
+        request_entry = {
+            "method": request.method,
+            "url": request.url,
+            "httpVersion": "HTTP/1.1",
+            "headers": _header_list(request.headers),
+            "queryString": [],
+            "headersSize": -1,
+            "bodySize": len(request.post_data_buffer or b""),
+        }
+        if request.post_data is not None:
+            request_entry["postData"] = {
+                "mimeType": request.headers.get("content-type", ""),
+                "text": request.post_data,
+            }
+
+        self._entries[game_code].append(
+            {
+                "startedDateTime": started.isoformat(),
+                "time": wait + receive,
+                "request": request_entry,
+                "response": {
+                    "status": response.status,
+                    "statusText": response.status_text,
+                    "httpVersion": "HTTP/1.1",
+                    "headers": _header_list(response.headers),
+                    "content": {
+                        "size": len(body),
+                        "mimeType": response.headers.get("content-type", ""),
+                        "text": base64.b64encode(body).decode("ascii"),
+                        "encoding": "base64",
+                    },
+                    "redirectURL": "",
+                    "headersSize": -1,
+                    "bodySize": len(body),
+                },
+                "cache": {},
+                "timings": {"send": 0, "wait": wait, "receive": receive},
+            }
+        )
+        self.stats["recorded"] += 1
+
+    async def handle_route(self, route, request):
+        """Serve a recorded response; never touches the network"""
+        try:
+            replay = self._replay.get(request.frame.page)
+        except Exception:
+            replay = None
+
+        key = (request.method, normalize_url(request.url))
+        queue = replay.get(key) if replay else None
+        if not queue:
+            self.stats["missed"] += 1
+            await route.abort("internetdisconnected")
+            return
+
+        # Repeated calls (e.g. spins) are answered in recorded order, then
+        # the last recorded response is reused
+        entry = queue.popleft() if len(queue) > 1 else queue[0]
+        response = entry["response"]
+        content = response["content"]
+        body = (
+            base64.b64decode(content["text"])
+            if content.get("encoding") == "base64"
+            else content.get("text", "").encode("utf-8")
+        )
+        headers = {
+            h["name"]: h["value"]
+            for h in response["headers"]
+            if h["name"].lower() not in ("content-encoding", "content-length")
+        }
+        self.stats["replayed"] += 1
+        await route.fulfill(status=response["status"], headers=headers, body=body)
+
+    def print_report(self, console: Console):
+        console.print(
+            f"\n[bold blue]📼 HAR {self.mode.capitalize()} Report:[/bold blue]"
+        )
+        if self.mode == "record":
+            console.print(
+                f"Recorded {self.stats['recorded']} requests to {self.archive_dir}"
+            )
+        else:
+            console.print(
+                f"Replayed [green]{self.stats['replayed']}[/green] / "
+                f"missed [red]{self.stats['missed']}[/red] requests from {self.archive_dir}"
+            )
+        write_log(f"📼 HAR {self.mode} stats: {self.stats}")
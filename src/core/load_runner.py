@@ -0,0 +1,280 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from rich.console import Console
+from actions.game_actions import capture_screenshot
+from core.browser_manager import BrowserManager
+from core.process_screenshot import load_all_templates, process_screenshot_batch
+from utils.action_latency import mark_action, pop_action_latencies
+from utils.token_pool import TokenPool
+from utils.logger import write_log
+from utils.paths import CAPTURE_DIR
+from utils.response_tracker import (
+    endpoint_stats,
+    set_current_mode,
+    set_game_info,
+    clear_game_info,
+)
+from utils.statistics import percentile
+
+
+LOAD_MODE = "load"
+SPIN_MODE = "btn_spin"
+REPORT_INTERVAL = 10.0  # seconds
+
+
+class LoadMetrics:
+    """Per-window throughput, error rate and latency of a load run"""
+
+    def __init__(self, report_interval: float = REPORT_INTERVAL):
+        self.report_interval = report_interval
+        self.started_at = time.perf_counter()
+        self.windows: List[Dict[str, Any]] = []
+        self.active_sessions = 0
+        self.total_clicks = 0
+        self.session_errors = 0
+        self._window = self._new_window()
+        self._all_latencies: List[float] = []
+
+    def _new_window(self) -> Dict[str, Any]:
+        return {
+            "start": time.perf_counter() - self.started_at,
+            "clicks": 0,
+            "latencies": [],
+            "responses": self._tracked("responses"),
+            "errors": self._tracked("errors"),
+        }
+
+    @staticmethod
+    def _tracked(counter: str) -> int:
+        return sum(stats[counter] for stats in endpoint_stats.values())
+
+    def add_click(self):
+        self._window["clicks"] += 1
+        self.total_clicks += 1
+
+    def add_latencies(self, latencies: List[float]):
+        self._window["latencies"].extend(latencies)
+        self._all_latencies.extend(latencies)
+
+    def close_window(self, console: Console):
+        window = self._window
+        elapsed = max(time.perf_counter() - self.started_at - window["start"], 1e-6)
+        responses = self._tracked("responses") - window["responses"]
+        errors = self._tracked("errors") - window["errors"]
+        latencies = window["latencies"]
+
+        summary = {
+            "start": window["start"],
+            "sessions": self.active_sessions,
+            "clicks_per_s": window["clicks"] / elapsed,
+            "answered_per_s": len(latencies) / elapsed,
+            "error_rate": errors / responses if responses else 0.0,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+        }
+        self.windows.append(summary)
+        self._window = self._new_window()
+
+        console.print(
+            f"[cyan]t+{summary['start']:5.0f}s[/cyan] sessions={summary['sessions']} "
+            f"spins/s={summary['clicks_per_s']:.1f} answered/s={summary['answered_per_s']:.1f} "
+            f"errors={summary['error_rate'] * 100:.1f}% "
+            f"latency p50/p95/p99={summary['p50']:.0f}/{summary['p95']:.0f}/{summary['p99']:.0f} ms"
+        )
+        write_log(f"📈 Load window: {summary}")
+
+    def print_summary(self, console: Console):
+        total_time = time.perf_counter() - self.started_at
+        answered = len(self._all_latencies)
+        responses = sum(stats["responses"] for stats in endpoint_stats.values())
+        errors = sum(stats["errors"] for stats in endpoint_stats.values())
+
+        console.print(f"\n[bold blue]📈 Load Run Summary:[/bold blue]")
+        console.print(
+            f"Duration {total_time:.0f}s: {self.total_clicks} spins sent "
+            f"({self.total_clicks / total_time:.2f}/s), "
+            f"{answered} answered ({answered / total_time:.2f}/s)"
+        )
+        console.print(
+            f"Error rate: {errors / responses * 100 if responses else 0:.2f}% "
+            f"({errors}/{responses} tracked responses)"
+        )
+        if self.session_errors:
+            console.print(
+                f"[red]Sessions failed: {self.session_errors}[/red] "
+                "(token, page or game load errors)"
+            )
+        console.print(
+            "Latency p50/p95/p99: "
+            + " / ".join(
+                f"{percentile(self._all_latencies, p):.0f}" for p in (50, 95, 99)
+            )
+            + " ms"
+        )
+
+
+async def _find_spin_position(
+    page, game_code: str, language: str, token: str, oc: str
+) -> Optional[Tuple[int, int]]:
+    templates_cache = await asyncio.to_thread(load_all_templates, oc, [SPIN_MODE])
+    screenshot_path = await capture_screenshot(
+        page, CAPTURE_DIR / f"{game_code}_{language}_load.png", LOAD_MODE
+    )
+    if not screenshot_path:
+        return None
+
+    # Matching is CPU-bound, off the loop so running sessions keep spinning
+    result = await asyncio.to_thread(
+        process_screenshot_batch,
+        {"code": game_code},
+        token,
+        language,
+        screenshot_path,
+        templates_cache,
+        [SPIN_MODE],
+        oc=oc,
+    )
+    matches = result.get(SPIN_MODE, {}).get("final_matches", [])
+    return matches[0]["center"] if matches else None
+
+
+async def _load_session(
+    session_id: int,
+    browser_manager: BrowserManager,
+    game_url_template: str,
+    game_code: str,
+    oc: str,
+    language: str,
+    currency: str,
+    token_pool: TokenPool,
+    spin_position: Dict[str, Any],
+    spin_rate: float,
+    stop_at: float,
+    metrics: LoadMetrics,
+):
+    page = None
+    spinning = False
+
+    try:
+        token = await asyncio.to_thread(token_pool.get, currency, language)
+        page = await browser_manager.new_page()
+        set_game_info(game_code, f"load session {session_id}", language, token, page)
+        set_current_mode(LOAD_MODE, page)
+
+        game_url = game_url_template.format(
+            gameCode=game_code, oc=oc, token=token, language=language
+        )
+        await page.goto(game_url, wait_until="networkidle", timeout=100_000)
+
+        # The first session locates the spin button, the others reuse it
+        if spin_position.get("center") is None:
+            async with spin_position["lock"]:
+                if spin_position.get("center") is None:
+                    spin_position["center"] = await _find_spin_position(
+                        page, game_code, language, token, oc
+                    )
+        if spin_position.get("center") is None:
+            write_log(f"❌ Load session {session_id}: spin button not found")
+            return
+
+        x, y = spin_position["center"]
+        interval = 1 / spin_rate
+        metrics.active_sessions += 1
+        spinning = True
+        write_log(f"🚀 Load session {session_id} started")
+
+        next_spin = time.perf_counter()
+        while time.perf_counter() < stop_at:
+            mark_action(page)
+            await page.mouse.click(x, y)
+            metrics.add_click()
+
+            next_spin += interval
+            await asyncio.sleep(max(next_spin - time.perf_counter(), 0))
+            metrics.add_latencies(pop_action_latencies(page))
+
+    except Exception as e:
+        metrics.session_errors += 1
+        write_log(f"❌ Load session {session_id} failed: {e}")
+
+    finally:
+        if spinning:
+            metrics.active_sessions -= 1
+        if page is not None:
+            clear_game_info(page)
+            await browser_manager.close_page(page)
+
+
+async def run_load(
+    game_code: str,
+    oc: str,
+    language: str,
+    currency: str,
+    game_url_template: str,
+    operator_target: str,
+    sessions: int,
+    spin_rate: float,
+    duration: float,
+    ramp_up: float = 0.0,
+    browser_options: Optional[Dict[str, Any]] = None,
+):
+    """Drive `sessions` concurrent contexts of one game, each spinning at `spin_rate`/s"""
+    console = Console()
+    metrics = LoadMetrics()
+
+    token_pool = TokenPool(
+        operator_target, [(currency, language)], per_combination=sessions
+    )
+    browser_manager = BrowserManager(**(browser_options or {}))
+    spin_position = {"center": None, "lock": asyncio.Lock()}
+    stop_at = None  # set once the browser is up, sessions read it when they start
+
+    async def start_session(session_id: int):
+        await asyncio.sleep(ramp_up * session_id / sessions)
+        await _load_session(
+            session_id,
+            browser_manager,
+            game_url_template,
+            game_code,
+            oc,
+            language,
+            currency,
+            token_pool,
+            spin_position,
+            spin_rate,
+            stop_at,
+            metrics,
+        )
+
+    async def reporter():
+        while time.perf_counter() < stop_at:
+            await asyncio.sleep(metrics.report_interval)
+            metrics.close_window(console)
+
+    try:
+        # Tokens are provisioned in the background while the browser starts
+        token_pool.start()
+        await browser_manager.launch()
+
+        console.print(
+            f"[bold cyan]📈 Load run: {game_code} x {sessions} sessions at "
+            f"{spin_rate} spins/s for {duration:.0f}s (ramp-up {ramp_up:.0f}s)"
+            "[/bold cyan]"
+        )
+        stop_at = time.perf_counter() + ramp_up + duration
+        report_task = asyncio.create_task(reporter())
+        # A session that fails anyway must not orphan the others
+        await asyncio.gather(
+            *(start_session(i) for i in range(sessions)), return_exceptions=True
+        )
+        report_task.cancel()
+        metrics.close_window(console)
+        metrics.print_summary(console)
+        token_pool.print_report(console)
+    finally:
+        token_pool.close()
+        await browser_manager.close()
+
+    return metrics
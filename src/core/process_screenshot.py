@@ -1,11 +1,17 @@
-import cv2
 import time
-from pathlib import Path
 from typing import List, Dict, Tuple
 from utils.logger import write_log
 from utils.paths import TEMPLATE_DIR, get_output_path
-from utils.opencv_utils import enhanced_template_matching, convert_numpy_types
+from utils.opencv_utils import (
+    enhanced_template_matching,
+    match_template_in_roi,
+)
 from utils.mapping_utils import map_mode_check_display
+from utils import position_cache
+from utils.spans import span, spans
+from utils.lazy_import import lazy_module
+
+cv2 = lazy_module("cv2")
 
 
 TEMPLATE_THRESHOLDS = {
@@ -15,6 +21,10 @@ TEMPLATE_THRESHOLDS = {
     "display_min": 0.50,  # Minimum threshold to display on screenshot
 }
 
+# A cached position is reused when the template still matches this well there
+VERIFY_THRESHOLD = TEMPLATE_THRESHOLDS["high"]
+ROI_MARGIN = 12  # pixels searched around a cached position
+
 
 def get_confidence_level(confidence: float) -> str:
     """Determine confidence level based on threshold values"""
@@ -76,7 +86,8 @@ def load_all_templates(oc: str, modes: List[str]) -> Dict[str, List[Dict]]:
 
             templates_cache[mode] = loaded_templates
             write_log(
-                f"✅ Pre-processed {len(loaded_templates)} templates for mode: {mode}"
+                f"✅ Pre-processed {len(loaded_templates)} templates for mode: {mode}",
+                level="debug",
             )
 
         except Exception as e:
@@ -92,6 +103,16 @@ def load_all_templates(oc: str, modes: List[str]) -> Dict[str, List[Dict]]:
     return templates_cache
 
 
+def template_signature(oc: str, modes: List[str]) -> Tuple[Tuple[str, int, int], ...]:
+    """(path, mtime, size) of every template file; changes when templates do"""
+    signature = []
+    for mode in modes:
+        for template_path in sorted((TEMPLATE_DIR / oc / mode).glob("*.png")):
+            stat = template_path.stat()
+            signature.append((str(template_path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
 def mark_final_matches(img, templates, display_threshold=None, debug=True):
     """Mark matches on image with confidence-based colors and thresholds"""
     if display_threshold is None:
@@ -197,6 +218,61 @@ def mark_final_matches(img, templates, display_threshold=None, debug=True):
     return result_img, final_matches
 
 
+def _match_templates(mode, loaded_templates, screen_gray, display_threshold):
+    """Full sweep: (template, match) pairs, stopping at a near-perfect match"""
+    matches = []
+    best_confidence = 0.0
+    for template_data in loaded_templates:
+        # Early termination optimization
+        if best_confidence > 0.95:
+            break
+
+        match_result = enhanced_template_matching(screen_gray, template_data["gray"])
+        if not match_result:
+            continue
+        write_log(
+            f"🔎 {mode}/{template_data['name']}: "
+            f"{match_result['confidence']:.3f} ({match_result['method']}, "
+            f"scale {match_result['scale']})",
+            level="debug",
+        )
+        matches.append((template_data, match_result))
+        if match_result["confidence"] >= display_threshold:
+            best_confidence = max(best_confidence, match_result["confidence"])
+    return matches
+
+
+def _verify_position(position, loaded_templates, screen_gray):
+    """Match of a cached position's template in a small ROI, or None"""
+    template_data = next(
+        (t for t in loaded_templates if t["name"] == position["template_name"]), None
+    )
+    if template_data is None:
+        return None
+    match_result = match_template_in_roi(
+        screen_gray,
+        template_data["gray"],
+        position["scale"],
+        (position["top_left"], position["bottom_right"]),
+        ROI_MARGIN,
+    )
+    if match_result and match_result["confidence"] >= VERIFY_THRESHOLD:
+        return template_data, match_result
+    return None
+
+
+def _update_position(
+    scope, mode, language, reliable_matches, loaded_templates, screen_gray
+):
+    """Cache a fresh detection for other languages if it would pass verification"""
+    position_cache.drop_position(*scope, mode, language)
+    if not reliable_matches:
+        return
+    best = reliable_matches[0]
+    if _verify_position(best, loaded_templates, screen_gray):
+        position_cache.store_position(*scope, mode, best, language)
+
+
 def process_screenshot_batch(
     game,
     token,
@@ -207,6 +283,8 @@ def process_screenshot_batch(
     template_threshold=None,
     display_threshold=None,
     debug=False,
+    env="",
+    oc="",
 ):
     """Process screenshot with enhanced thresholding system"""
     if template_threshold is None:
@@ -216,6 +294,7 @@ def process_screenshot_batch(
         display_threshold = TEMPLATE_THRESHOLDS["display_min"]
 
     game_code = game.get("code") if isinstance(game, dict) else str(game)
+    position_scope = (env, oc, game_code)  # cached positions of this game
 
     screen_img = cv2.imread(str(screen_path))
     if screen_img is None:
@@ -241,26 +320,38 @@ def process_screenshot_batch(
             continue
 
         templates_found = []
-        best_confidence = 0.0
         confidence_stats = {"high": 0, "medium": 0, "low": 0, "very_low": 0}
 
-        for template_data in loaded_templates:
-            # Early termination optimization
-            if best_confidence > 0.95:
-                break
-
-            match_result = enhanced_template_matching(
-                screen_gray, template_data["gray"]
+        match_start = time.perf_counter()
+        position = None
+        verified = None
+        if position_cache.is_enabled():
+            position = position_cache.get_position(*position_scope, mode, language)
+        if position:
+            verified = _verify_position(position, loaded_templates, screen_gray)
+        if verified:
+            outcome = "reused"
+            matches = [verified]
+            write_log(
+                f"📍 {mode_display}: reused position from {position['language']}",
+                level="debug",
+            )
+        else:
+            outcome = "fallback" if position else "detected"
+            matches = _match_templates(
+                mode, loaded_templates, screen_gray, display_threshold
             )
+        match_end = time.perf_counter()
+        spans.record("match", match_start, match_end, mode_display)
+        if position_cache.is_enabled():
+            position_cache.record_outcome(outcome, match_end - match_start)
 
-            if match_result and match_result["confidence"] >= display_threshold:
+        for template_data, match_result in matches:
+            if match_result["confidence"] >= display_threshold:
                 confidence = match_result["confidence"]
                 confidence_level = get_confidence_level(confidence)
                 confidence_stats[confidence_level.lower()] += 1
 
-                if confidence > best_confidence:
-                    best_confidence = confidence
-
                 x, y = match_result["location"]
                 h, w = match_result["template_size"]
 
@@ -288,6 +379,16 @@ def process_screenshot_batch(
         # Count only matches that meet the main threshold for accuracy
         reliable_matches = [t for t in templates_found if t["meets_threshold"]]
 
+        if position_cache.is_enabled() and outcome != "reused":
+            _update_position(
+                position_scope,
+                mode,
+                language,
+                reliable_matches,
+                loaded_templates,
+                screen_gray,
+            )
+
         dict_result[mode] = {
             "mode": mode_display,
             "final_matches": templates_found,  # All displayable matches
@@ -299,6 +400,7 @@ def process_screenshot_batch(
                 "template_threshold": template_threshold,
                 "display_threshold": display_threshold,
             },
+            "match_ms": (match_end - match_start) * 1000,
         }
 
     # Save screenshot with all displayable matches
@@ -323,7 +425,8 @@ def process_screenshot_batch(
 
         output_path = get_output_path(token, game_code, language) / "screenshot.jpg"
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        success = cv2.imwrite(str(output_path), result_img)
+        with span("artifact", output_path.name):
+            success = cv2.imwrite(str(output_path), result_img)
 
         if not success:
             write_log(f"❌ Failed to write combined image to {output_path}")
@@ -380,7 +483,8 @@ def process_screenshot(
     game_code = game.get("code")
 
     write_log(
-        f"🎯 Processing with template_threshold: {template_threshold:.3f}, display_threshold: {display_threshold:.3f}"
+        f"🎯 Processing with template_threshold: {template_threshold:.3f}, display_threshold: {display_threshold:.3f}",
+        level="debug",
     )
 
     for template_data in loaded_templates:
@@ -449,7 +553,8 @@ def process_screenshot(
         output_path = output_path / filename
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        success = cv2.imwrite(str(output_path), result_img)
+        with span("artifact", output_path.name):
+            success = cv2.imwrite(str(output_path), result_img)
         if not success:
             write_log(f"❌ Failed to write image to {output_path}")
         else:
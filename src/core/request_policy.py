@@ -0,0 +1,186 @@
+from collections import defaultdict
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+from rich.console import Console
+from utils.logger import write_log
+from utils.response_tracker import TRACKED_ENDPOINTS
+
+
+DEFAULT_POLICY = {
+    "enabled": True,
+    "default": "allow",
+    "rules": [
+        {
+            "action": "block",
+            "domains": [
+                "google-analytics.com",
+                "googletagmanager.com",
+                "doubleclick.net",
+                "facebook.net",
+                "facebook.com",
+                "hotjar.com",
+                "segment.io",
+                "mixpanel.com",
+                "sentry.io",
+            ],
+        },
+        {"action": "block", "resourceTypes": ["font", "texttrack", "manifest"]},
+        {
+            "action": "block",
+            "resourceTypes": ["media"],
+            "urlPatterns": ["*.mp4*", "*.webm*", "*.mov*"],
+        },
+    ],
+}
+
+# Resource types that must always load for the game page to render
+ALWAYS_ALLOWED_TYPES = ("document",)
+
+# Typical transfer sizes in bytes, for blocked types never seen loading: the
+# default rules block fonts, text tracks and manifests on every page
+DEFAULT_TYPE_SIZES = {
+    "font": 50_000,
+    "texttrack": 5_000,
+    "manifest": 2_000,
+    "media": 1_000_000,
+    "image": 30_000,
+    "stylesheet": 20_000,
+    "script": 100_000,
+}
+
+
+def _match_domain(host: str, domains: List[str]) -> bool:
+    return any(host == d or host.endswith(f".{d}") for d in domains)
+
+
+class RequestPolicy:
+    """Declarative allow/deny routing with per-game byte counters"""
+
+    def __init__(self, rules: Optional[List[Dict[str, Any]]] = None, **options):
+        self.enabled = options.get("enabled", True)
+        self.default_action = options.get("default", "allow")
+        self.rules = rules if rules is not None else DEFAULT_POLICY["rules"]
+        self.protected_endpoints = list(TRACKED_ENDPOINTS)
+
+        self.game_stats = defaultdict(
+            lambda: {
+                "allowed": 0,
+                "blocked": 0,
+                "allowed_bytes": 0,
+                "blocked_bytes": 0,
+                "load_time": 0.0,
+            }
+        )
+        self._page_games: Dict[Any, str] = {}
+        self._known_sizes: Dict[str, int] = {}
+        self._type_sizes = defaultdict(lambda: [0, 0])  # type -> [bytes, count]
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "RequestPolicy":
+        """Build a policy from the `network.requestPolicy` config section"""
+        policy = {**DEFAULT_POLICY, **(config or {})}
+        return cls(
+            policy.get("rules"),
+            enabled=policy.get("enabled", True),
+            default=policy.get("default", "allow"),
+        )
+
+    def decide(self, url: str, resource_type: str) -> str:
+        """Return "allow" or "block" for a request (first matching rule wins)"""
+        if any(endpoint in url for endpoint in self.protected_endpoints):
+            return "allow"
+        if resource_type in ALWAYS_ALLOWED_TYPES:
+            return "allow"
+
+        host = urlparse(url).hostname or ""
+        for rule in self.rules:
+            types = rule.get("resourceTypes")
+            if types and resource_type not in types:
+                continue
+            domains = rule.get("domains")
+            if domains and not _match_domain(host, domains):
+                continue
+            patterns = rule.get("urlPatterns")
+            if patterns and not any(fnmatch(url, p) for p in patterns):
+                continue
+            return rule.get("action", "allow")
+
+        return self.default_action
+
+    def start_game(self, page, game_code: str):
+        self._page_games[page] = game_code
+        self.game_stats[game_code]  # ensure the game shows up in the report
+
+    def finish_game(self, page, load_time: float):
+        game_code = self._page_games.get(page)
+        if game_code:
+            self.game_stats[game_code]["load_time"] += load_time
+
+    def _game_for(self, request) -> str:
+        try:
+            return self._page_games.get(request.frame.page, "unknown")
+        except Exception:
+            return "unknown"
+
+    def _estimate_size(self, url: str, resource_type: str) -> int:
+        if url in self._known_sizes:
+            return self._known_sizes[url]
+        total, count = self._type_sizes[resource_type]
+        return total // count if count else DEFAULT_TYPE_SIZES.get(resource_type, 0)
+
+    async def handle_route(self, route, request):
+        if self.decide(request.url, request.resource_type) == "block":
+            stats = self.game_stats[self._game_for(request)]
+            stats["blocked"] += 1
+            stats["blocked_bytes"] += self._estimate_size(
+                request.url, request.resource_type
+            )
+            await route.abort("blockedbyclient")
+            return
+
+        await route.fallback()
+
+    async def on_request_finished(self, request):
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+
+        size = sizes.get("responseBodySize", 0) + sizes.get("responseHeadersSize", 0)
+        self._known_sizes[request.url] = size
+        type_sizes = self._type_sizes[request.resource_type]
+        type_sizes[0] += size
+        type_sizes[1] += 1
+
+        stats = self.game_stats[self._game_for(request)]
+        stats["allowed"] += 1
+        stats["allowed_bytes"] += size
+
+    def estimated_savings(self, game_code: str) -> float:
+        """Seconds saved, assuming blocked bytes would load at the observed rate"""
+        stats = self.game_stats[game_code]
+        if not stats["allowed_bytes"] or not stats["load_time"]:
+            return 0.0
+        rate = stats["allowed_bytes"] / stats["load_time"]
+        return stats["blocked_bytes"] / rate
+
+    def print_report(self, console: Console):
+        games = {k: v for k, v in self.game_stats.items() if k != "unknown"}
+        if not self.enabled or not games:
+            return
+
+        console.print(f"\n[bold blue]🚦 Request Policy Report:[/bold blue]")
+        total_saved = 0.0
+        for game_code, stats in games.items():
+            saved = self.estimated_savings(game_code)
+            total_saved += saved
+            console.print(
+                f"🎮 {game_code}: "
+                f"[green]{stats['allowed']} allowed ({stats['allowed_bytes'] / 1e6:.2f} MB)[/green] / "
+                f"[red]{stats['blocked']} blocked (~{stats['blocked_bytes'] / 1e6:.2f} MB)[/red] "
+                f"load {stats['load_time']:.1f}s, est. saved {saved:.1f}s"
+            )
+            write_log(f"🚦 Request policy stats for {game_code}: {stats}")
+
+        console.print(f"[bold]⏱️ Estimated load time saved: {total_saved:.1f}s[/bold]")
@@ -0,0 +1,98 @@
+import heapq
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from rich.console import Console
+from utils.logger import write_log
+
+
+DEFAULT_ESTIMATE = 60.0  # seconds per game when the provider has no history
+
+WorkItem = Tuple[int, Dict[str, Any], List[str]]
+
+
+def predict_makespan(durations: Iterable[float], workers: int) -> float:
+    """Finish time of the last worker when each takes the next game as it frees up"""
+    finish_times = [0.0] * max(workers, 1)
+    for duration in durations:
+        heapq.heappush(finish_times, heapq.heappop(finish_times) + duration)
+    return max(finish_times)
+
+
+class GameScheduler:
+    """Orders the work queue: failing games first, then longest expected first
+
+    Expected durations are the average check time of each game over its latest
+    stored runs, or the provider's average for games without history.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        estimates_ms: Dict[str, float],
+        failing: Optional[Iterable[str]] = None,
+    ):
+        self.workers = workers
+        self.estimates = {code: ms / 1000 for code, ms in estimates_ms.items()}
+        self.failing = set(failing or ())
+        self.fallback = (
+            sum(self.estimates.values()) / len(self.estimates)
+            if self.estimates
+            else DEFAULT_ESTIMATE
+        )
+
+        self.stats = {"history": 0, "fallback": 0, "failing_first": 0}
+        self.predicted = 0.0
+        self.catalog_order_predicted = 0.0
+        self._started_at: Optional[float] = None
+        self.actual = 0.0
+
+    def estimate(self, game_code: str) -> float:
+        return self.estimates.get(game_code, self.fallback)
+
+    def order(self, work: List[WorkItem]) -> List[WorkItem]:
+        for _, game, _ in work:
+            code = game.get("code")
+            self.stats["history" if code in self.estimates else "fallback"] += 1
+            self.stats["failing_first"] += code in self.failing
+
+        ordered = sorted(
+            work,
+            key=lambda item: (
+                item[1].get("code") not in self.failing,
+                -self.estimate(item[1].get("code")),
+            ),
+        )
+        self.predicted = predict_makespan(
+            (self.estimate(game.get("code")) for _, game, _ in ordered), self.workers
+        )
+        self.catalog_order_predicted = predict_makespan(
+            (self.estimate(game.get("code")) for _, game, _ in work), self.workers
+        )
+        write_log(
+            f"🗓️ Scheduled {len(work)} games on {self.workers} workers: "
+            f"predicted makespan {self.predicted:.0f}s "
+            f"(catalog order {self.catalog_order_predicted:.0f}s), {self.stats}"
+        )
+        return ordered
+
+    def start(self):
+        self._started_at = time.perf_counter()
+
+    def finish(self):
+        if self._started_at is not None:
+            self.actual = time.perf_counter() - self._started_at
+
+    def print_report(self, console: Console):
+        console.print(f"\n[bold blue]🗓️ Scheduler:[/bold blue]")
+        console.print(
+            f"Estimates: {self.stats['history']} from history, "
+            f"{self.stats['fallback']} from the provider average "
+            f"({self.fallback:.0f}s); {self.stats['failing_first']} failing games first"
+        )
+        console.print(
+            f"Makespan: predicted {self.predicted:.0f}s, actual {self.actual:.0f}s "
+            f"(catalog order predicted {self.catalog_order_predicted:.0f}s)"
+        )
+        write_log(
+            f"🗓️ Makespan predicted={self.predicted:.1f}s actual={self.actual:.1f}s"
+        )
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from collections import Counter, defaultdict
+from typing import Any, Awaitable, Dict, Optional, Set
+from rich.console import Console
+from utils.logger import write_log
+
+
+# Seconds; 0 disables a deadline class
+DEFAULT_DEADLINES = {
+    "load": 120.0,
+    "mode": 60.0,
+    "game": 300.0,
+}
+
+
+class DeadlineExceeded(Exception):
+    def __init__(self, deadline_class: str, budget: float):
+        super().__init__(f"{deadline_class} deadline ({budget:g}s) exceeded")
+        self.deadline_class = deadline_class
+        self.budget = budget
+
+
+class Watchdog:
+    """Enforces per-game/per-mode deadline budgets and tracks time spent per class"""
+
+    def __init__(self, deadlines: Optional[Dict[str, float]] = None):
+        self.deadlines = {**DEFAULT_DEADLINES, **(deadlines or {})}
+        self.spent = defaultdict(float)
+        self.runs = Counter()
+        self.expired = Counter()
+
+        self._completed_modes: Dict[Any, Set[str]] = defaultdict(set)
+        self._tainted_pages: Set[Any] = set()
+
+    async def run(self, deadline_class: str, awaitable: Awaitable, page=None):
+        """Await within the class budget; on expiry the awaitable is cancelled"""
+        budget = self.deadlines.get(deadline_class) or None
+        start_time = time.perf_counter()
+        try:
+            return await asyncio.wait_for(awaitable, timeout=budget)
+        except asyncio.TimeoutError:
+            self.expired[deadline_class] += 1
+            if page is not None:
+                self._tainted_pages.add(page)
+            write_log(f"⏱️ Watchdog: {deadline_class} deadline ({budget}s) exceeded")
+            raise DeadlineExceeded(deadline_class, budget)
+        finally:
+            self.runs[deadline_class] += 1
+            self.spent[deadline_class] += time.perf_counter() - start_time
+
+    def mark_mode_done(self, page, mode: str):
+        self._completed_modes[page].add(mode)
+
+    def pending_modes(self, page, modes):
+        done = self._completed_modes.get(page, set())
+        return [mode for mode in modes if mode not in done]
+
+    def finish_game(self, page) -> bool:
+        """Reset per-game state, returns True if the page must be replaced"""
+        self._completed_modes.pop(page, None)
+        if page in self._tainted_pages:
+            self._tainted_pages.discard(page)
+            return True
+        return False
+
+    def print_report(self, console: Console):
+        console.print(f"\n[bold blue]⏱️ Watchdog Deadlines:[/bold blue]")
+        for deadline_class, budget in self.deadlines.items():
+            runs = self.runs[deadline_class]
+            if not runs:
+                continue
+            budget_text = f"{budget:g}s" if budget else "off"
+            console.print(
+                f"{deadline_class}: {self.spent[deadline_class]:.1f}s spent over {runs} runs "
+                f"(budget {budget_text}, [red]{self.expired[deadline_class]} expired[/red])"
+            )
+        write_log(f"⏱️ Watchdog: spent={dict(self.spent)} expired={dict(self.expired)}")
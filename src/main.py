@@ -1,19 +1,25 @@
 import asyncio
+import json
+import os
 import time
+from pathlib import Path
 from typing import Any, Dict, List
 from core.process_screenshot import (
     load_all_templates,
     process_screenshot_batch,
+    template_signature,
 )
 from utils.paths import (
     CAPTURE_DIR,
+    DAEMON_SOCKET,
+    HAR_DIR,
     init_workspace,
     get_report_path,
     get_output_path,
     clear_outputs,
 )
 from config import Config
-from utils.logger import write_log, print_banner, set_log_path
+from utils.logger import write_log, print_banner, set_log_level
 from actions.game_actions import (
     capture_game_screenshot,
     click_by_coord,
@@ -21,7 +27,31 @@ from actions.game_actions import (
     capture_screenshot,
 )
 from core.browser_manager import BrowserManager
-from utils.csv_logger import write_csv_log
+from core.request_policy import RequestPolicy
+from core.asset_cache import AssetCache
+from core.har_archive import HarArchive
+from core.context_pool import ContextPool, PoolExhausted
+from core.watchdog import Watchdog, DeadlineExceeded
+from core.load_runner import run_load
+from core.bootstrap import StartupTimer, bootstrap
+from core.daemon import JobServer, ResultStream, submit_job
+from core.change_detector import ChangeDetector, DEFAULT_DRIFT_SAMPLE
+from core.scheduler import GameScheduler
+from utils.checkpoint import Checkpoint
+from utils.results_store import (
+    start_run,
+    record_result,
+    record_load_time,
+    record_game_duration,
+    finish_run,
+    flush_results,
+    failed_checks,
+    stored_checks,
+    game_duration_estimates,
+    print_game_history,
+)
+from cli.args import parse_args
+from cli.run_plan import expand_run_plan, load_run_plan
 from cli.prompts import (
     ask_environment,
     ask_games,
@@ -33,6 +63,9 @@ from cli.prompts import (
     ask_language,
 )
 from utils.statistics import GameStatistics
+from utils.token_pool import TokenPool
+from utils.startup_profile import profile_startup
+from utils.run_analytics import run_analytics
 from utils.mapping_utils import (
     reverse_mode_check,
     map_mode_check_display,
@@ -44,9 +77,25 @@ from utils.metadata_utils import (
     get_all_languages,
 )
 
-from utils.response_tracker import set_current_mode, set_game_info
+from utils.action_latency import pop_action_latencies, reset_action_latencies
+from utils.latency_history import bind_page, unbind_page, save_latency_history
+from utils.spans import span, spans, set_span_game, set_span_worker
+from utils.position_cache import (
+    enable_position_reuse,
+    print_position_report,
+    reset_position_stats,
+    save_positions,
+)
+from utils.response_tracker import (
+    set_current_mode,
+    set_game_info,
+    clear_game_info,
+    print_tracker_report,
+    print_timing_summary,
+    write_game_waterfall,
+    reset_tracking,
+)
 
-from utils.http_utils import get_token_by_operator_target, fetch_games_data
 from rich.markup import escape
 from rich.console import Console
 
@@ -150,7 +199,8 @@ async def _capture_stage_screenshot(
             get_output_path(token, game_code, language) / mode_display / file_name
         )
 
-        await asyncio.sleep(0.5)
+        with span("settle"):
+            await asyncio.sleep(0.5)
 
         await capture_screenshot(page, output_path, f"{mode_display}_{stage}")
         return True
@@ -165,6 +215,7 @@ async def _capture_stage_screenshot(
 async def execute_click(token, language, game_code, mode, result_dict, page):
     mode_display = map_mode_check_display(mode)
     screenshot_captured = False
+    mode_start = time.perf_counter()
 
     try:
         is_add_or_sub = is_mode_add_or_sub(mode)
@@ -214,6 +265,11 @@ async def execute_click(token, language, game_code, mode, result_dict, page):
 
         return "success"
 
+    except asyncio.CancelledError:
+        # Cancelled by the watchdog: don't start new page work on a hung page
+        screenshot_captured = True
+        raise
+
     except Exception as e:
         write_log(f"❌ Error in execute_click: {str(e)}")
         return f"Unexpected error: {e}"
@@ -229,6 +285,7 @@ async def execute_click(token, language, game_code, mode, result_dict, page):
                 write_log(
                     f"❌ Fallback screenshot also failed for mode {mode_display}: {str(e)}"
                 )
+        spans.record("mode", mode_start, time.perf_counter(), mode_display)
 
 
 async def process_single_game(
@@ -243,6 +300,8 @@ async def process_single_game(
     console,
     execution_mode,
     templates_cache,
+    browser_manager=None,
+    watchdog=None,
 ):
     game_code = game.get("code")
     game_name = game.get("name")
@@ -263,9 +322,28 @@ async def process_single_game(
 
         write_log(f"Running Game: {game_name} - code: {game_code}")
 
-        screenshot_path = await _capture_screenshot_with_retry(
+        if browser_manager:
+            browser_manager.start_game(page, game_code)
+
+        set_game_info(game_code, game_name, language, token, page)
+
+        capture = _capture_screenshot_with_retry(
             token, language, page, game, url_templates, oc
         )
+        with span("load"):
+            if watchdog:
+                screenshot_path = await watchdog.run("load", capture, page)
+            else:
+                screenshot_path = await capture
+
+        load_time = time.time() - game_start_time
+        record_load_time(game, load_time * 1000)
+        stats.add_latency("load", load_time * 1000)
+        ready_time = spans.game_totals(game_code).get("ready")
+        if ready_time is not None:
+            stats.add_latency("ready", ready_time * 1000)
+        if browser_manager:
+            browser_manager.record_load_time(page, load_time)
 
         if not screenshot_path:
             write_log(f"❌ Failed to capture screenshot for game {game_code}")
@@ -274,20 +352,25 @@ async def process_single_game(
             )
             return
 
-        set_game_info(
-            game_code, 
-            game_name,
-            language,
-            token,
-            page
-        )
-
         await _process_capture_screenshot(
-            token, language, page, game, modes, templates_cache, screenshot_path, stats
+            token,
+            language,
+            page,
+            game,
+            modes,
+            templates_cache,
+            screenshot_path,
+            stats,
+            watchdog,
         )
 
         _show_game_completion(console, game_name, game_code, game_start_time)
 
+    except DeadlineExceeded as e:
+        write_log(f"⏱️ Game {game_code} timed out: {str(e)}")
+        console.print(f"[red]⏱️ Game {game_code} timed out: {str(e)}[/red]")
+        _record_timeout_results(report_path, game, modes, stats, e)
+
     except Exception as e:
         write_log(f"❌ Critical error processing game {game_code}: {str(e)}")
         console.print(f"[red]❌ Critical error in game {game_code}: {str(e)}[/red]")
@@ -295,6 +378,13 @@ async def process_single_game(
             report_path, game, modes, stats, f"Critical game error: {str(e)}"
         )
 
+    finally:
+        clear_game_info(page)
+        with span("artifact", "waterfall"):
+            write_game_waterfall(token, game_code, language)
+        if browser_manager:
+            browser_manager.finish_game(page)
+
 
 async def _handle_manual_confirmation(game_code: str) -> bool:
     try:
@@ -332,14 +422,25 @@ async def _capture_screenshot_with_retry(
 
 
 async def _process_capture_screenshot(
-    token, language, page, game, modes, templates_cache, screenshot_path, stats
+    token,
+    language,
+    page,
+    game,
+    modes,
+    templates_cache,
+    screenshot_path,
+    stats,
+    watchdog=None,
 ):
     report_path = get_report_path(token, language)
     game_code = game.get("code")
 
     write_log(f"🔍 Processing screenshot for game {game_code} with {len(modes)} modes")
 
-    result_dict = process_screenshot_batch(
+    # Multi-scale matching is CPU-bound; OpenCV releases the GIL, so workers'
+    # matching overlaps and watchdog timers keep firing meanwhile
+    result_dict = await asyncio.to_thread(
+        process_screenshot_batch,
         game,
         token,
         language,
@@ -348,61 +449,110 @@ async def _process_capture_screenshot(
         modes,
         template_threshold=TEMPLATE_THRESHOLD,
         debug=True,
+        env=stats.env,
+        oc=stats.oc,
     )
 
     write_log(f"✅ Screenshot processing completed for game {game_code}")
 
-    for mode in modes:
-        await _handle_single_mode_result(
-            token, language, game, mode, result_dict, page, stats, report_path
+    for n, mode in enumerate(modes):
+        deadline = await _handle_single_mode_result(
+            token, language, game, mode, result_dict, page, stats, report_path, watchdog
         )
+        if deadline:
+            # The page is hung: abandon it so the slot gets recycled
+            remaining = modes[n + 1 :]
+            if remaining:
+                write_log(
+                    f"⏭️ Abandoning page of game {game_code}, "
+                    f"{len(remaining)} modes left unchecked"
+                )
+                _record_timeout_results(report_path, game, remaining, stats, deadline)
+                for remaining_mode in remaining:
+                    watchdog.mark_mode_done(page, remaining_mode)
+            break
 
 
 async def _handle_single_mode_result(
-    token, language, game, mode, result_dict, page, stats, report_path
+    token, language, game, mode, result_dict, page, stats, report_path, watchdog=None
 ):
-    """Handle processing result for a single mode"""
+    """Handle processing result for a single mode
+
+    Returns the DeadlineExceeded of a mode that timed out, None otherwise.
+    A mode is marked done only once its result is recorded, so a mode cancelled
+    by the game deadline is still reported as timed out.
+    """
+
+    def mark_done():
+        if watchdog:
+            watchdog.mark_mode_done(page, mode)
+
     try:
         game_code = game.get("code")
         mode_display = map_mode_check_display(mode)
 
-        set_current_mode(mode_display)
+        set_current_mode(mode_display, page)
 
         result = result_dict.get(mode)
         if result is None:
             write_log(f"⚠️ No result returned for mode {mode_display}, skipping...")
             stats.add_result(mode, "skipped")
-            write_csv_log(
-                report_path,
-                game,
-                mode_display,
-                "⚠️",
-                "No result returned",
-            )
-            return
+            record_result(report_path, game, mode, "skipped", "⚠️", "No result returned")
+            mark_done()
+            return None
 
-        click_result = await execute_click(
-            token, language, game_code, mode, result_dict, page
-        )
+        matches = result.get("final_matches", [])
+        confidence = matches[0]["similarity"] if matches else None
+        if "match_ms" in result:
+            stats.add_latency("match", result["match_ms"], mode)
+
+        click_start = time.perf_counter()
+        click = execute_click(token, language, game_code, mode, result_dict, page)
+        if watchdog:
+            click_result = await watchdog.run("mode", click, page)
+        else:
+            click_result = await click
+        duration_ms = (time.perf_counter() - click_start) * 1000
         icon, status, error_msg = _process_game_result(click_result)
 
+        latencies = pop_action_latencies(page)
+        for latency_ms in latencies:
+            stats.add_action_latency(mode, latency_ms)
+
         stats.add_result(mode, status)
-        write_csv_log(report_path, game, mode_display, icon, error_msg)
+        record_result(
+            report_path,
+            game,
+            mode,
+            status,
+            icon,
+            error_msg,
+            latencies[-1] if latencies else None,
+            confidence,
+            duration_ms,
+        )
+        mark_done()
         write_log(f"{icon} Game {game_code} (mode={mode_display}): {click_result}")
 
+    except DeadlineExceeded as e:
+        write_log(f"⏱️ Mode {mode} for game {game.get('code')} timed out: {str(e)}")
+        # Marks left by the timed-out mode must not count for the next one
+        pop_action_latencies(page)
+        _record_timeout_results(report_path, game, [mode], stats, e)
+        mark_done()
+        return e
+
     except Exception as e:
+        pop_action_latencies(page)
         error_message = f"Mode processing error: {str(e)}"
         write_log(
             f"❌ Error processing mode {mode} for game {game.get('code')}: {str(e)}"
         )
         stats.add_result(mode, "failed")
-        write_csv_log(
-            report_path,
-            game,
-            map_mode_check_display(mode),
-            "❌",
-            error_message,
-        )
+        record_result(report_path, game, mode, "failed", "❌", error_message)
+        mark_done()
+
+    return None
 
 
 def _process_game_result(result: str) -> tuple:
@@ -418,39 +568,182 @@ def _process_game_result(result: str) -> tuple:
 def _record_failed_results(report_path, game, modes, stats, error_message):
     for mode in modes:
         stats.add_result(mode, "failed")
-        write_csv_log(
-            report_path, game, map_mode_check_display(mode), "❌", error_message
-        )
+        record_result(report_path, game, mode, "failed", "❌", error_message)
+
+
+def _record_timeout_results(report_path, game, modes, stats, error):
+    for mode in modes:
+        stats.add_result(mode, "timeout")
+        record_result(report_path, game, mode, "timeout", "⏱️", f"Timeout: {error}")
+
+
+def _build_work_list(games, modes, checkpoint, resume_options, failed=None):
+    """(index, game, modes still to check) for every game that has work left"""
+    start_from = resume_options.get("start_from", 1)
+    only_games = resume_options.get("games")
+    work = []
+    for i, game in enumerate(games, 1):
+        if i < start_from or (only_games and game.get("code") not in only_games):
+            continue
+        game_modes = modes
+        if failed is not None:
+            game_modes = [
+                mode for mode in modes if mode in failed.get(game.get("code"), [])
+            ]
+        if resume_options.get("resume"):
+            game_modes = checkpoint.remaining_modes(game.get("code"), game_modes)
+        if game_modes:
+            work.append((i, game, game_modes))
+    return work
+
+
+def _reset_run_state():
+    """Clear per-run accumulators, as batch and daemon jobs share one process"""
+    spans.reset()
+    reset_tracking()
+    reset_position_stats()
+    reset_action_latencies()
+
 
 def _show_game_completion(console, game_name, game_code, start_time):
     elapsed = time.time() - start_time
     minutes, seconds = divmod(int(elapsed), 60)
+    stages = spans.game_totals(game_code)
+    breakdown = ", ".join(
+        f"{stage} {stages[stage]:.1f}s"
+        for stage in ("load", "match", "mode")
+        if stage in stages
+    )
     console.print(
         f"🏁 [green]Completed Game:[/green] [bold yellow]{game_name}[/bold yellow] "
         f"([cyan]{game_code}[/cyan]) (Runtime: [magenta]{minutes:02d}:{seconds:02d}[/magenta])"
+        f" [dim]{breakdown}[/dim]"
     )
     console.print(PROGRESS_DIVIDER)
 
 
 async def run_all_games(
-    env, token, language, oc, modes, execution_mode, games, url_templates
+    env,
+    language,
+    currency,
+    oc,
+    modes,
+    execution_mode,
+    url_templates,
+    asset_cache=None,
+    har_archive=None,
+    browser_options=None,
+    pool_options=None,
+    deadlines=None,
+    catalog_options=None,
+    startup_timer=None,
+    resume_options=None,
+    change_detector=None,
+    browser_manager=None,
+    pool=None,
+    templates_store=None,
+    token_pool=None,
+    observers=(),
 ):
+    """Check every game of one env/oc/language/currency combination.
+
+    A browser_manager and pool passed in are reused and left running for the
+    caller, as batch runs do across combinations.
+    """
     console = Console()
-    stats = GameStatistics()
+    resume_options = resume_options or {}
+    stats = GameStatistics(env, oc)
+    startup_timer = startup_timer or StartupTimer()
 
-    browser_manager = None
-    browser = None
-    page = None
+    owns_browser = browser_manager is None
+    watchdog = None
+    checkpoint = None
+    scheduler = None
+    trace_path = None
+    _reset_run_state()
 
     try:
-        templates_cache = load_all_templates(oc, modes)
-        if not any(templates_cache.values()):
-            write_log("❌ No templates loaded for any mode, exiting")
+        if owns_browser:
+            request_policy = RequestPolicy.from_config(
+                Config.get("network", "requestPolicy")
+            )
+            browser_manager = BrowserManager(
+                request_policy=request_policy,
+                asset_cache=asset_cache,
+                har_archive=har_archive,
+                change_detector=change_detector,
+                **(browser_options or {}),
+            )
+            pool = ContextPool(browser_manager, **(pool_options or {}))
+        else:
+            browser_manager.change_detector = change_detector
+
+        startup = await bootstrap(
+            startup_timer,
+            env,
+            oc,
+            language,
+            currency,
+            modes,
+            browser_manager,
+            pool,
+            har_archive,
+            catalog_options,
+            console,
+            templates_store,
+            token_pool,
+        )
+        if not startup:
             return
+        token, games, templates_cache = startup
+        trace_path = get_report_path(token, language).with_name("trace.json")
+
+        checkpoint = Checkpoint(env, oc, currency, language)
+        resume = resume_options.get("resume", False)
+        if resume:
+            done = checkpoint.load()
+            stored = stored_checks(env, oc, language, currency, checkpoint.tokens)
+            if done and stored is not None:
+                # Trust only checks whose result actually reached the store
+                unstored = checkpoint.retain(stored)
+                if unstored:
+                    write_log(
+                        f"⚠️ {unstored} checkpointed checks have no stored result, "
+                        "rerunning them"
+                    )
+                    done -= unstored
+            if done:
+                write_log(f"⏭️ Resuming, {done} checks already completed")
+            else:
+                write_log("⚠️ No checkpoint to resume from, running every check")
+        latest_failures = failed_checks(env, oc, language, currency)
+        failed = None
+        if resume_options.get("only_failed"):
+            failed = latest_failures
+            write_log(
+                f"🔁 Rerunning {sum(map(len, failed.values()))} failed checks "
+                f"in {len(failed)} games"
+            )
+        work = _build_work_list(games, modes, checkpoint, resume_options, failed)
+
+        if change_detector and resume_options.get("incremental"):
+            change_detector.load()
+            scheduled = await asyncio.to_thread(
+                change_detector.plan, [game for _, game, _ in work]
+            )
+            work = [item for item in work if item[1].get("code") in scheduled]
 
-        browser_manager = BrowserManager(headless=False)
-        browser = await browser_manager.launch()
-        page = await browser.new_page()
+        scheduler = GameScheduler(
+            pool.size, game_duration_estimates(env, oc), latest_failures
+        )
+        work = scheduler.order(work)
+
+        checkpoint.start(token, resume=resume)
+        observers = [checkpoint, *observers]
+        if change_detector:
+            observers.append(change_detector)
+        start_run(env, oc, language, currency, token, observers)
+        watchdog = Watchdog(deadlines)
 
         # await page.set_viewport_size({"width": 1280, "height": 720})
 
@@ -469,47 +762,116 @@ async def run_all_games(
             f"[bold cyan]📊 Total games to process: {total_games}[/bold cyan]"
         )
 
-        completed_games = 0
-        failed_games = 0
-
-        for i, game in enumerate(games, 1):
-            if i < 5:
-                continue
-            try:
-                console.print(
-                    f"\n[bold blue]📋 Progress: {i}/{total_games}[/bold blue]"
-                )
-
-                await process_single_game(
-                    token,
-                    language,
-                    page,
-                    game,
-                    url_templates,
-                    oc,
-                    modes,
-                    stats,
-                    console,
-                    execution_mode,
-                    templates_cache,
-                )
-                completed_games += 1
+        if len(work) < total_games:
+            console.print(
+                f"[bold cyan]⏭️ Games with checks left to run: {len(work)}[/bold cyan]"
+            )
 
-            except Exception as e:
-                game_code = game.get("code", "unknown")
-                write_log(f"❌ Unhandled error processing game {game_code}: {str(e)}")
-                console.print(
-                    f"[red]❌ Unhandled error in game {game_code}, continuing...[/red]"
-                )
-                failed_games += 1
-                continue
+        game_queue = asyncio.Queue()
+        for item in work:
+            game_queue.put_nowait(item)
+
+        progress = {"completed": 0, "failed": 0}
+
+        async def game_worker(worker):
+            set_span_worker(worker)
+            while not game_queue.empty():
+                i, game, game_modes = game_queue.get_nowait()
+                set_span_game(game.get("code", ""))
+                try:
+                    slot = await pool.acquire()
+                except PoolExhausted as e:
+                    # Record what is left instead of silently dropping it
+                    _record_failed_results(
+                        get_report_path(token, language),
+                        game,
+                        game_modes,
+                        stats,
+                        f"Not run: {e}",
+                    )
+                    progress["failed"] += 1
+                    continue
+                startup_timer.mark_first_game()
+                bind_page(slot.page, env, oc, game.get("code"))
+                broken = False
+                game_start_time = time.perf_counter()
+                try:
+                    console.print(
+                        f"\n[bold blue]📋 Progress: {i}/{total_games}[/bold blue]"
+                    )
+
+                    await watchdog.run(
+                        "game",
+                        process_single_game(
+                            token,
+                            language,
+                            slot.page,
+                            game,
+                            url_templates,
+                            oc,
+                            game_modes,
+                            stats,
+                            console,
+                            execution_mode,
+                            templates_cache,
+                            browser_manager,
+                            watchdog,
+                        ),
+                        slot.page,
+                    )
+                    progress["completed"] += 1
+
+                except DeadlineExceeded as e:
+                    game_code = game.get("code", "unknown")
+                    console.print(f"[red]⏱️ Game {game_code} timed out, moving on[/red]")
+                    _record_timeout_results(
+                        get_report_path(token, language),
+                        game,
+                        watchdog.pending_modes(slot.page, game_modes),
+                        stats,
+                        e,
+                    )
+                    progress["failed"] += 1
+
+                except Exception as e:
+                    game_code = game.get("code", "unknown")
+                    write_log(
+                        f"❌ Unhandled error processing game {game_code}: {str(e)}"
+                    )
+                    console.print(
+                        f"[red]❌ Unhandled error in game {game_code}, continuing...[/red]"
+                    )
+                    progress["failed"] += 1
+                    broken = True
+
+                finally:
+                    # Manual runs include prompt time, which would skew estimates
+                    game_end_time = time.perf_counter()
+                    spans.record("game", game_start_time, game_end_time)
+                    if execution_mode != "manual":
+                        game_ms = (game_end_time - game_start_time) * 1000
+                        record_game_duration(game, game_ms)
+                        stats.add_game_time(game.get("code", "unknown"), game_ms)
+                    unbind_page(slot.page)
+                    broken = watchdog.finish_game(slot.page) or broken
+                    await pool.release(slot, broken=broken)
+
+        scheduler.start()
+        await asyncio.gather(*(game_worker(n) for n in range(1, pool.size + 1)))
+        scheduler.finish()
+        # Observers only see results once stored, so store the last ones now
+        flush_results()
+        # Everything queued has run, so the next run starts from scratch
+        checkpoint.clear()
+        if change_detector:
+            change_detector.save(games)
 
         console.print(
-            f"\n[bold green]📊 Processing Summary: {completed_games}/{total_games} games processed"
+            f"\n[bold green]📊 Processing Summary: {progress['completed']}/{total_games} games processed"
         )
-        if failed_games > 0:
+        if progress["failed"] > 0:
             console.print(
-                f"[bold red]⚠️ {failed_games} games had critical errors[/bold red]"
+                f"[bold red]⚠️ {progress['failed']} games had critical errors[/bold red]"
             )
         console.print("[/bold green]")
 
@@ -518,20 +880,270 @@ async def run_all_games(
         # console.print(f"[red]❌ Critical system error: {str(e)}[/red]")
 
     finally:
-        await _cleanup_resources(browser_manager)
+        if owns_browser:
+            await _cleanup_resources(browser_manager, pool)
+        save_latency_history()
+        save_positions()
+        if trace_path:
+            spans.write_chrome_trace(trace_path)
+        finish_run()
+        if checkpoint:
+            checkpoint.close()
 
     try:
         stats.print_final_summary(console)
+        startup_timer.print_report(console)
+        print_tracker_report(console)
+        print_timing_summary(console)
+        print_position_report(console)
+        spans.print_report(console)
+        if owns_browser:
+            _print_browser_reports(console, browser_manager, pool, asset_cache)
+        if har_archive:
+            har_archive.print_report(console)
+        if watchdog:
+            watchdog.print_report(console)
+        if scheduler:
+            scheduler.print_report(console)
+        if change_detector and resume_options.get("incremental"):
+            change_detector.print_report(console)
     except Exception as e:
         write_log(f"⚠️ Error printing final summary: {str(e)}")
 
 
-async def _cleanup_resources(browser_manager):
+def _print_browser_reports(console, browser_manager, pool, asset_cache):
+    if browser_manager and browser_manager.request_policy:
+        browser_manager.request_policy.print_report(console)
+    if asset_cache:
+        asset_cache.print_report(console)
+    if pool:
+        pool.print_report(console)
+
+
+def _shared_browser(asset_cache, browser_options, pool_options, run_options):
+    """Browser and pool shared by batch and daemon jobs.
+
+    The browser outlives the per-env configs, so it uses the loaded config's policy.
+    """
+    request_policy = RequestPolicy.from_config(Config.get("network", "requestPolicy"))
+    resume_options = run_options.get("resume_options") or {}
+    browser_manager = BrowserManager(
+        request_policy=request_policy,
+        asset_cache=asset_cache,
+        track_bundles=resume_options.get("incremental", False),
+        **(browser_options or {}),
+    )
+    return browser_manager, ContextPool(browser_manager, **(pool_options or {}))
+
+
+async def _run_job(
+    job,
+    browser_manager,
+    pool,
+    templates_store,
+    drift_sample=DEFAULT_DRIFT_SAMPLE,
+    observers=(),
+    token_pools=None,
+    **run_options,
+):
+    """Run one plan job on the shared browser; returns its runtime, None if invalid"""
+    env, oc = job["env"], job["oc"]
+    Config.load(env)
+    game_config = Config.get("game")
+    url_templates = game_config.get("urlTemplates", {})
+    if not validate_configuration(env, oc, job["modes"], game_config, url_templates):
+        return None
+
+    resume_options = dict(run_options.pop("resume_options", None) or {})
+    resume_options["games"] = job.get("games")
+    change_detector = None
+    if resume_options.get("incremental"):
+        change_detector = ChangeDetector(env, oc, drift_sample=drift_sample)
+
+    job_start_time = time.perf_counter()
+    await run_all_games(
+        env,
+        job["language"],
+        job["currency"],
+        oc,
+        job["modes"],
+        "auto",
+        url_templates,
+        startup_timer=StartupTimer(),
+        resume_options=resume_options,
+        change_detector=change_detector,
+        browser_manager=browser_manager,
+        pool=pool,
+        templates_store=templates_store,
+        token_pool=(token_pools or {}).get(env),
+        observers=observers,
+        **run_options,
+    )
+    return time.perf_counter() - job_start_time
+
+
+def _start_token_pools(jobs) -> Dict[str, TokenPool]:
+    """Pre-create a token for every job's currency/language, one pool per env"""
+    token_pools = {}
+    for env in dict.fromkeys(job["env"] for job in jobs):
+        Config.load(env)
+        combinations = [
+            (job["currency"], job["language"]) for job in jobs if job["env"] == env
+        ]
+        token_pools[env] = TokenPool(Config.get("game", "operatorTarget"), combinations)
+        token_pools[env].start()
+    return token_pools
+
+
+def _close_token_pools(token_pools):
+    for token_pool in token_pools.values():
+        token_pool.close()
+
+
+def _job_label(job) -> str:
+    return f"{job['env']}/{job['oc']}/{job['language']}/{job['currency']}"
+
+
+async def run_batch(
+    jobs,
+    asset_cache=None,
+    browser_options=None,
+    pool_options=None,
+    **run_options,
+):
+    """Run every job of a run plan in one process, sharing the browser and caches"""
+    console = Console()
+    browser_manager = None
+    pool = None
+    templates_store = {}
+    token_pools = {}
+    job_times = []
+
+    try:
+        Config.load(jobs[0]["env"])
+        browser_manager, pool = _shared_browser(
+            asset_cache, browser_options, pool_options, run_options
+        )
+        token_pools = _start_token_pools(jobs)
+
+        for n, job in enumerate(jobs, 1):
+            label = _job_label(job)
+            print_banner(console, f"📋 Batch job {n}/{len(jobs)}: {label}")
+            write_log(f"📋 Batch job {n}/{len(jobs)}: {label} ({job['modes']})")
+            elapsed = await _run_job(
+                job,
+                browser_manager,
+                pool,
+                templates_store,
+                token_pools=token_pools,
+                **run_options,
+            )
+            job_times.append((label, elapsed))
+
+    finally:
+        _close_token_pools(token_pools)
+        await _cleanup_resources(browser_manager, pool)
+
+    _print_browser_reports(console, browser_manager, pool, asset_cache)
+    for token_pool in token_pools.values():
+        token_pool.print_report(console)
+    console.print(f"\n[bold blue]📋 Batch Summary:[/bold blue]")
+    if browser_manager and browser_manager.launch_time:
+        console.print(
+            f"Browser launched once in {browser_manager.launch_time:.2f}s, "
+            f"templates loaded for {len(templates_store)} oc/mode pairs"
+        )
+    for label, elapsed in job_times:
+        status = f"{elapsed:.0f}s" if elapsed is not None else "invalid config"
+        console.print(f"{label}: {status}")
+
+
+def _reload_changed_templates(templates_store, signatures):
+    """Drop cached templates whose files changed, so the next job reloads them"""
+    for oc, mode in list(templates_store):
+        signature = template_signature(oc, [mode])
+        if signatures.setdefault((oc, mode), signature) != signature:
+            write_log(f"♻️ Templates changed for {oc}/{mode}, reloading")
+            del templates_store[oc, mode]
+            del signatures[oc, mode]
+
+
+async def run_daemon(
+    providers,
+    languages,
+    currencies,
+    socket_path=DAEMON_SOCKET,
+    asset_cache=None,
+    browser_options=None,
+    pool_options=None,
+    **run_options,
+):
+    """Keep the browser and templates warm and run plan jobs sent over a Unix socket"""
+    browser_manager = None
+    pool = None
+    templates_store = {}
+    signatures = {}
+
+    async def handle_job(plan, emit):
+        jobs = expand_run_plan(plan, providers, languages, currencies, source="job")
+        token_pools = _start_token_pools(jobs)
+        try:
+            for n, job in enumerate(jobs, 1):
+                # Per job: a running job keeps the templates it started with
+                _reload_changed_templates(templates_store, signatures)
+                label = _job_label(job)
+                write_log(f"🛰️ Daemon job {n}/{len(jobs)}: {label} ({job['modes']})")
+                await emit({"event": "job", "job": label, "n": n, "total": len(jobs)})
+                results = ResultStream(emit, job=label)
+                try:
+                    elapsed = await _run_job(
+                        job,
+                        browser_manager,
+                        pool,
+                        templates_store,
+                        observers=[results],
+                        token_pools=token_pools,
+                        **run_options,
+                    )
+                finally:
+                    await results.flush()
+                await emit({"event": "job_done", "job": label, "elapsed": elapsed})
+        finally:
+            _close_token_pools(token_pools)
+
+    try:
+        Config.load()
+        browser_manager, pool = _shared_browser(
+            asset_cache, browser_options, pool_options, run_options
+        )
+
+        # Warm everything a job could need before accepting the first one
+        all_modes = reverse_mode_check(["all"])
+        warmups = [browser_manager.launch()] + [
+            asyncio.to_thread(load_all_templates, oc, all_modes) for oc in providers
+        ]
+        _, *loaded = await asyncio.gather(*warmups)
+        await pool.start()
+        for oc, templates_cache in zip(providers, loaded):
+            for mode, templates in templates_cache.items():
+                templates_store[oc, mode] = templates
+        _reload_changed_templates(templates_store, signatures)
+
+        await JobServer(handle_job, socket_path).serve()
+
+    finally:
+        await _cleanup_resources(browser_manager, pool)
+
+
+async def _cleanup_resources(browser_manager, pool=None):
     cleanup_tasks = []
 
+    if pool:
+        await pool.close()
+
     if browser_manager:
         cleanup_tasks.append(_close_browser(browser_manager))
-    
+
     if cleanup_tasks:
         await asyncio.gather(*cleanup_tasks, return_exceptions=True)
 
@@ -543,9 +1155,8 @@ async def _close_browser(browser_manager):
     except Exception as e:
         write_log(f"⚠️ Error closing browser: {str(e)}")
 
-def validate_configuration(
-    env, oc, modes, game_config, url_templates
-):
+
+def validate_configuration(env, oc, modes, game_config, url_templates):
     validations = [
         (env and oc and modes, "Missing basic configuration"),
         (game_config, "No game config found"),
@@ -579,10 +1190,209 @@ def _get_meta_data():
     return providers, languages, currencies
 
 
+def _run_cache_command(args) -> None:
+    asset_cache = AssetCache(max_size_mb=args.asset_cache_size)
+    asset_cache.load()
+
+    if args.export_cache_manifest:
+        asset_cache.export_manifest(Path(args.export_cache_manifest))
+        write_log(f"✅ Asset cache manifest written to {args.export_cache_manifest}")
+        return
+
+    if args.warm_cache:
+        urls = Path(args.warm_cache).read_text(encoding="utf-8").split()
+    else:
+        urls = list(asset_cache.index)
+    asset_cache.warm(urls)
+
+
+def _apply_log_level(args) -> None:
+    """--log-level, then $LOG_LEVEL, then the environment config's logLevel"""
+    level = args.log_level or os.environ.get("LOG_LEVEL") or Config.get("logLevel")
+    if level:
+        set_log_level(level)
+
+
+def _run_load_command(args) -> None:
+    init_workspace()
+    Config.load(args.env)
+    _apply_log_level(args)
+    game_config = Config.get("game")
+
+    asyncio.run(
+        run_load(
+            game_code=args.load,
+            oc=args.oc,
+            language=args.language,
+            currency=args.currency,
+            game_url_template=args.game_url or game_config["urlTemplates"]["pp"],
+            operator_target=args.operator_target or game_config["operatorTarget"],
+            sessions=args.sessions,
+            spin_rate=args.spin_rate,
+            duration=args.duration,
+            ramp_up=args.ramp_up,
+            browser_options={
+                "headless": not args.headed,
+                "executable_path": args.chrome_path,
+            },
+        )
+    )
+
+
+def _run_options(args, execution_mode: str = "auto") -> Dict[str, Any]:
+    """run_all_games options shared by interactive and batch runs"""
+    return {
+        "browser_options": {
+            "headless": not args.headed,
+            "executable_path": args.chrome_path,
+        },
+        "pool_options": {
+            # Manual mode prompts per game, so it can only use one worker
+            "size": 1 if execution_mode == "manual" else args.workers,
+            "recycle_after": args.recycle_after,
+            "max_memory_mb": args.max_context_memory,
+        },
+        "deadlines": {
+            "load": args.load_deadline,
+            "mode": args.mode_deadline,
+            "game": args.game_deadline,
+        },
+        "catalog_options": {
+            "ttl": args.catalog_ttl,
+            "force_refresh": args.refresh_catalog,
+        },
+        "resume_options": {
+            "resume": args.resume,
+            "start_from": args.start_from,
+            "only_failed": args.only_failed,
+            "incremental": args.incremental,
+        },
+    }
+
+
+def _load_asset_cache(args):
+    if args.asset_cache and args.har == "replay":
+        write_log("⚠️ Asset cache is disabled during HAR replay")
+    elif args.asset_cache:
+        asset_cache = AssetCache(max_size_mb=args.asset_cache_size)
+        asset_cache.load()
+        return asset_cache
+    return None
+
+
+def _run_batch_command(args, providers, languages, currencies) -> None:
+    console = Console()
+    try:
+        jobs = load_run_plan(Path(args.plan), providers, languages, currencies)
+    except (OSError, ValueError) as e:
+        write_log(f"❌ Invalid run plan: {e}")
+        console.print(f"[red]❌ Invalid run plan: {escape(str(e))}[/red]")
+        return
+    if args.har:
+        write_log("⚠️ HAR record/replay is not supported in batch runs, ignoring --har")
+        args.har = None
+
+    Config.load(jobs[0]["env"])
+    _apply_log_level(args)
+    write_log(f"📋 Run plan {args.plan}: {len(jobs)} jobs")
+
+    asyncio.run(
+        run_batch(
+            jobs,
+            _load_asset_cache(args),
+            drift_sample=args.drift_sample,
+            **_run_options(args),
+        )
+    )
+    console.print("\n[bold green]✅ Batch completed![/bold green] 🚀 Exiting... 👋")
+
+
+def _run_daemon_command(args, providers, languages, currencies) -> None:
+    socket_path = Path(args.socket) if args.socket else DAEMON_SOCKET
+    Config.load()
+    _apply_log_level(args)
+    Console().print(
+        f"[bold green]🛰️ Daemon warming up, jobs are accepted on {socket_path}"
+        "[/bold green]"
+    )
+    asyncio.run(
+        run_daemon(
+            providers,
+            languages,
+            currencies,
+            socket_path,
+            _load_asset_cache(args),
+            drift_sample=args.drift_sample,
+            **_run_options(args),
+        )
+    )
+
+
+def _run_submit_command(args) -> None:
+    """Send a run plan to the daemon and print its events as they stream back"""
+    console = Console()
+    socket_path = Path(args.socket) if args.socket else DAEMON_SOCKET
+    with open(args.submit, "r", encoding="utf-8") as f:
+        plan = json.load(f)
+
+    icons = {"success": "✅", "timeout": "⏱️", "skipped": "⚠️"}
+    for event in submit_job(plan, socket_path):
+        kind = event["event"]
+        if kind == "result":
+            icon = icons.get(event["status"], "❌")
+            console.print(
+                f"{icon} {event['job']} {event['game']} {event['mode']}: "
+                f"{event['status']}"
+            )
+        elif kind == "job":
+            console.print(
+                f"[bold blue]📋 Job {event['n']}/{event['total']}: {event['job']}"
+                "[/bold blue]"
+            )
+        elif kind == "done":
+            console.print(
+                f"[bold green]✅ Done in {event['elapsed']:.2f}s[/bold green]"
+            )
+        elif kind == "error":
+            console.print(f"[red]❌ {escape(event['message'])}[/red]")
+        elif kind == "queued":
+            console.print("[yellow]⏳ Waiting for the running job to finish[/yellow]")
+
+
 def main():
     console = Console()
+    args = parse_args()
+    if args.log_level:
+        set_log_level(args.log_level)
+    if args.reuse_positions:
+        enable_position_reuse()
 
     try:
+        if args.profile_startup:
+            profile_startup(console)
+            return
+
+        if args.warm_cache is not None or args.export_cache_manifest:
+            _run_cache_command(args)
+            console.print("[bold green]✅ Asset cache updated[/bold green]")
+            return
+
+        if args.load:
+            _run_load_command(args)
+            return
+
+        if args.submit:
+            _run_submit_command(args)
+            return
+
+        if args.results_history:
+            print_game_history(console, args.results_history)
+            return
+
+        if args.analytics:
+            run_analytics(console, args.analytics, args.since_days)
+            return
+
         # Initialize workspace
         init_workspace()
         write_log("✅ Workspace initialized successfully")
@@ -592,6 +1402,14 @@ def main():
         if not all([providers, languages, currencies]):
             return
 
+        if args.plan:
+            _run_batch_command(args, providers, languages, currencies)
+            return
+
+        if args.daemon:
+            _run_daemon_command(args, providers, languages, currencies)
+            return
+
         # Get user configurations
         output_deletion, env, oc, execution_mode, modes, language, currency = (
             get_user_configurations(providers, languages, currencies)
@@ -604,47 +1422,51 @@ def main():
         if output_deletion is True:
             clear_outputs()
 
+        # Startup stages are timed from here, after the interactive prompts
+        startup_timer = StartupTimer()
+
         # Load config with selected e nv
         Config.load(env)
+        _apply_log_level(args)
         write_log(f"✅ Loaded config for ENV={env}")
 
         game_config = Config.get("game")
 
-        # Get token
-        operator_target = game_config.get("operatorTarget")
-        token = get_token_by_operator_target(
-            operator_target=operator_target,
-            currency=currency,
-            language=language,
-        )
-        
-        if not token:
-            write_log("⚠️ Failed to obtain player token!")
-            return
-
-        set_log_path(token, language)
-        
-        sevice_game_client_target = game_config.get('serviceGameClientTarget')
-        games = fetch_games_data(sevice_game_client_target, oc)
+        har_archive = None
+        if args.har:
+            har_dir = Path(args.har_dir) if args.har_dir else HAR_DIR
+            har_archive = HarArchive(args.har, env, oc, language, har_dir)
 
         url_templates = game_config.get("urlTemplates", {})
 
-        if not validate_configuration(
-            env, oc, modes, game_config, url_templates
-        ):
+        if not validate_configuration(env, oc, modes, game_config, url_templates):
             return
 
+        asset_cache = _load_asset_cache(args)
+
+        # Only incremental runs fingerprint bundles, the first one records the
+        # baseline of every game it checks
+        change_detector = None
+        if args.incremental and args.har == "replay":
+            write_log("⚠️ Incremental mode is disabled during HAR replay")
+        elif args.incremental:
+            change_detector = ChangeDetector(env, oc, drift_sample=args.drift_sample)
+
         # Run optimized game processing
         asyncio.run(
             run_all_games(
                 env,
-                token,
                 language,
+                currency,
                 oc,
                 modes,
                 execution_mode,
-                games,
                 url_templates,
+                asset_cache,
+                har_archive,
+                startup_timer=startup_timer,
+                change_detector=change_detector,
+                **_run_options(args, execution_mode),
             )
         )
 
@@ -0,0 +1,115 @@
+"""Local stand-in for the operator API, game catalog and a spinnable game page.
+
+Lets load mode (and the regular checks) run without a provider:
+
+    python src/tools/standin_server.py --port 8765
+    python src/main.py --load standin --operator-target http://127.0.0.1:8765 \\
+        --game-url "http://127.0.0.1:8765/{gameCode}/?oc={oc}&t={token}&l={language}"
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
+SPIN_IMAGE = TEMPLATE_DIR / "ppdemo" / "btn_spin" / "btn_spin.png"
+
+GAME_PAGE = """<!doctype html>
+<html>
+<body style="margin:0;width:1280px;height:720px;background:#1b1b2f">
+  <img id="spin" src="/assets/btn_spin.png"
+       style="position:absolute;left:600px;top:520px;cursor:pointer">
+  <div id="result" style="color:#fff;font:20px sans-serif;padding:20px"></div>
+  <script>
+    fetch("/playerService/balance").catch(() => {});
+    document.getElementById("spin").addEventListener("click", async () => {
+      const res = await fetch("/gameService/spin", {method: "POST", body: "{}"});
+      document.getElementById("result").textContent = res.status + " " + Date.now();
+    });
+  </script>
+</body>
+</html>
+"""
+
+CATALOG = json.dumps({"data": [{"code": "standin", "name": "Stand-in Game"}]}).encode()
+CATALOG_ETAG = '"' + hashlib.sha1(CATALOG).hexdigest()[:16] + '"'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    latency_ms = 50.0
+    error_rate = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data, status: int = 200):
+        self._send(status, json.dumps(data).encode(), "application/json")
+
+    def _service_call(self):
+        time.sleep(self.latency_ms / 1000)
+        if random.random() < self.error_rate:
+            self._send(500, b"Internal Server Error", "text/plain")
+        else:
+            self._send_json({"ok": True, "win": random.randint(0, 100)})
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+
+        if path == "/api/internal/players/_new":
+            self._send_json({"id": f"standin-{uuid.uuid4().hex[:12]}"})
+        elif path == "/api/v1/available-games":
+            if self.headers.get("If-None-Match") == CATALOG_ETAG:
+                self._send(304, b"", "application/json", {"ETag": CATALOG_ETAG})
+            else:
+                self._send(200, CATALOG, "application/json", {"ETag": CATALOG_ETAG})
+        elif path == "/assets/btn_spin.png":
+            self._send(200, SPIN_IMAGE.read_bytes(), "image/png")
+        elif any(s in path for s in ("gameService", "playerService", "betService")):
+            self._service_call()
+        elif path.endswith("/"):
+            self._send(200, GAME_PAGE.encode(), "text/html; charset=utf-8")
+        else:
+            self._send(404, b"Not Found", "text/plain")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self._service_call()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    StandInHandler.latency_ms = args.latency_ms
+    StandInHandler.error_rate = args.error_rate
+
+    server = ThreadingHTTPServer((args.host, args.port), StandInHandler)
+    print(f"Stand-in server listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from utils.latency_history import record_latency
+
+
+# Server calls that answer a spin/bet action
+ACTION_ENDPOINTS = ["betService", "gameService"]
+
+_pending_actions: Dict[Any, float] = {}  # page -> epoch seconds of the action
+_resolved_latencies: Dict[Any, List[float]] = defaultdict(list)
+
+
+def mark_action(page):
+    """Timestamp a click action; a newer action replaces an unanswered one"""
+    _pending_actions[page] = time.time()
+
+
+def resolve_action(page, response) -> Optional[float]:
+    """Correlate a tracked response with the page's pending action, returns ms"""
+    if not any(endpoint in response.url for endpoint in ACTION_ENDPOINTS):
+        return None
+
+    action_time = _pending_actions.get(page)
+    if action_time is None:
+        return None
+
+    # Prefer the browser's own timing: when the first response byte arrived
+    answered_at = time.time()
+    try:
+        timing = response.request.timing
+        if timing["responseStart"] >= 0:
+            request_start = timing["startTime"] / 1000
+            if request_start < action_time:
+                return None  # request was already in flight before the click
+            answered_at = request_start + timing["responseStart"] / 1000
+    except Exception:
+        pass
+
+    del _pending_actions[page]
+    latency_ms = max(answered_at - action_time, 0.0) * 1000
+    _resolved_latencies[page].append(latency_ms)
+    # The click timeouts are learned from this, not from the idle wait
+    record_latency(page, "click", latency_ms / 1000)
+    return latency_ms
+
+
+def pending_action(page) -> Optional[float]:
+    """Seconds since the page's action if it is still unanswered"""
+    action_time = _pending_actions.get(page)
+    if action_time is None:
+        return None
+    return time.time() - action_time
+
+
+def reset_action_latencies():
+    _pending_actions.clear()
+    _resolved_latencies.clear()
+
+
+def pop_action_latencies(page) -> List[float]:
+    """Latencies resolved since the last call; forgets unanswered actions"""
+    _pending_actions.pop(page, None)
+    return _resolved_latencies.pop(page, [])
@@ -0,0 +1,157 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from rich.console import Console
+from utils.http_utils import fetch_games_data_conditional
+from utils.logger import write_log
+from utils.paths import CATALOG_CACHE_DIR
+
+
+DEFAULT_CATALOG_TTL = 3600  # seconds before the cached catalog is revalidated
+REFRESH_TIMEOUT = 10  # seconds, background refreshes don't block the run
+REFRESH_WAIT = 2  # seconds the run waits for a background refresh to land
+
+
+def diff_catalogs(
+    old_games: List[Dict[str, Any]], new_games: List[Dict[str, Any]]
+) -> Dict[str, List[str]]:
+    """Game codes that are new, removed or changed between two catalogs"""
+    old_by_code = {game.get("code"): game for game in old_games}
+    new_by_code = {game.get("code"): game for game in new_games}
+
+    return {
+        "new": [code for code in new_by_code if code not in old_by_code],
+        "removed": [code for code in old_by_code if code not in new_by_code],
+        "changed": [
+            code
+            for code, game in new_by_code.items()
+            if code in old_by_code and old_by_code[code] != game
+        ],
+    }
+
+
+class CatalogCache:
+    """On-disk game catalog per env and oc, revalidated with ETag/Last-Modified"""
+
+    def __init__(
+        self,
+        env: str,
+        oc: str,
+        service_game_client_url: str,
+        ttl: float = DEFAULT_CATALOG_TTL,
+        cache_dir: Path = CATALOG_CACHE_DIR,
+    ):
+        self.env = env
+        self.oc = oc
+        self.service_game_client_url = service_game_client_url
+        self.ttl = ttl
+        self.cache_file = cache_dir / f"{env}_{oc}.json"
+
+        self.entry: Optional[Dict[str, Any]] = None
+        self.diff: Dict[str, List[str]] = {"new": [], "removed": [], "changed": []}
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        if not self.cache_file.exists():
+            return None
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            write_log(f"⚠️ Catalog cache unreadable, refetching: {e}")
+            return None
+
+    def _save(self, entry: Dict[str, Any]):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        tmp_file.replace(self.cache_file)
+
+    def is_fresh(self) -> bool:
+        return bool(self.entry) and time.time() - self.entry["fetched_at"] < self.ttl
+
+    def refresh(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Conditional fetch; stores the catalog and the diff against the old one"""
+        previous = self.entry or {}
+        games, validators = fetch_games_data_conditional(
+            self.service_game_client_url,
+            self.oc,
+            etag=previous.get("etag"),
+            last_modified=previous.get("last_modified"),
+            timeout=timeout,
+        )
+
+        with self._lock:
+            if games is None:
+                write_log(f"🗂️ Game catalog {self.env}/{self.oc} not modified")
+                entry = dict(previous, fetched_at=time.time())
+            else:
+                old_games = previous.get("games")
+                if old_games is not None:
+                    self.diff = diff_catalogs(old_games, games)
+                entry = {
+                    "fetched_at": time.time(),
+                    "etag": validators["etag"],
+                    "last_modified": validators["last_modified"],
+                    "games": games,
+                    "diff": self.diff,
+                }
+            self.entry = entry
+            self._save(entry)
+            return entry["games"]
+
+    def _background_refresh(self):
+        try:
+            self.refresh(timeout=REFRESH_TIMEOUT)
+        except Exception as e:
+            write_log(f"⚠️ Background catalog refresh failed, using cached copy: {e}")
+
+    def get_games(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """Serve the cached catalog at once, revalidating stale copies in the background"""
+        self.entry = self._load()
+        if self.entry is None:
+            return self.refresh()
+        if force_refresh:
+            try:
+                return self.refresh()
+            except Exception as e:
+                write_log(f"⚠️ Catalog refresh failed, using cached copy: {e}")
+
+        age = time.time() - self.entry["fetched_at"]
+        write_log(
+            f"🗂️ Serving cached game catalog {self.env}/{self.oc} "
+            f"({len(self.entry['games'])} games, {age:.0f}s old)"
+        )
+        if not force_refresh and not self.is_fresh():
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh, name="catalog-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+        return self.entry["games"]
+
+    def latest_games(self, timeout: float = REFRESH_WAIT) -> List[Dict[str, Any]]:
+        """Give a running background refresh `timeout` seconds to land"""
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout)
+        with self._lock:
+            return self.entry["games"]
+
+    def print_diff(self, console: Console):
+        if not any(self.diff.values()):
+            return
+        console.print(f"\n[bold blue]🗂️ Game Catalog Changes ({self.oc}):[/bold blue]")
+        for label, color in (
+            ("new", "green"),
+            ("removed", "red"),
+            ("changed", "yellow"),
+        ):
+            codes = self.diff[label]
+            if codes:
+                console.print(
+                    f"[{color}]{label} ({len(codes)}):[/{color}] {', '.join(codes)}"
+                )
+        write_log(f"🗂️ Game catalog diff: {self.diff}")
@@ -0,0 +1,114 @@
+import json
+import os
+from pathlib import Path
+from typing import IO, List, Optional, Set, Tuple
+from utils.csv_logger import now_utc_iso
+from utils.logger import write_log
+from utils.paths import CHECKPOINT_DIR
+
+
+class Checkpoint:
+    """Append-only record of completed (game, mode) checks for one env/oc/currency/language
+
+    Every check is written and fsynced as one JSON line once its result is
+    stored, so a run that crashes or is interrupted can be resumed without
+    redoing finished work.
+    """
+
+    def __init__(
+        self,
+        env: str,
+        oc: str,
+        currency: str,
+        language: str,
+        checkpoint_dir: Path = CHECKPOINT_DIR,
+    ):
+        self.env = env
+        self.oc = oc
+        self.currency = currency
+        self.language = language
+        self.path = checkpoint_dir / f"{env}_{oc}_{currency}_{language}.jsonl"
+
+        self.completed: Set[Tuple[str, str]] = set()
+        # Tokens of the attempts the loaded checks were run with
+        self.tokens: Set[str] = set()
+        self.token: Optional[str] = None
+        self._file: Optional[IO[str]] = None
+
+    def load(self) -> int:
+        """Read the checks completed by earlier attempts; returns how many"""
+        if not self.path.exists():
+            return 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a crash mid-write
+                    self.completed.add((entry["game"], entry["mode"]))
+                    if entry.get("token"):
+                        self.tokens.add(entry["token"])
+        except OSError as e:
+            write_log(f"⚠️ Checkpoint unreadable, running everything: {e}")
+            self.completed.clear()
+        return len(self.completed)
+
+    def retain(self, stored: Set[Tuple[str, str]]) -> int:
+        """Forget loaded checks without a stored result; returns how many"""
+        missing = self.completed - stored
+        self.completed &= stored
+        return len(missing)
+
+    def start(self, token: str, resume: bool = False):
+        """Open the checkpoint for appending; a fresh run discards the old one"""
+        self.token = token
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not resume:
+            self.completed.clear()
+        torn = resume and self.path.exists() and not self._ends_with_newline()
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        if torn:
+            self._file.write("\n")
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def is_done(self, game_code: str, mode: str) -> bool:
+        return (game_code, mode) in self.completed
+
+    def remaining_modes(self, game_code: str, modes: List[str]) -> List[str]:
+        return [mode for mode in modes if not self.is_done(game_code, mode)]
+
+    def mark_done(self, game_code: str, mode: str, status: str):
+        self.completed.add((game_code, mode))
+        if self._file is None:
+            return
+        entry = {
+            "at": now_utc_iso(),
+            "token": self.token,
+            "game": game_code,
+            "mode": mode,
+            "status": status,
+        }
+        try:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as e:
+            write_log(f"⚠️ Failed to checkpoint {game_code} ({mode}): {e}")
+
+    def close(self):
+        if self._file:
+            self._file.close()
+        self._file = None
+
+    def clear(self):
+        """Drop the checkpoint once every queued check has run"""
+        self.close()
+        self.path.unlink(missing_ok=True)
@@ -1,7 +1,20 @@
 import csv
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Iterable, List
+
+
+CSV_HEADERS = [
+    "Timestamp",
+    "Game name",
+    "Game code",
+    "Mode check",
+    "Status",
+    "Message",
+    "Action latency (ms)",
+    "Confidence",
+    "Duration (ms)",
+]
 
 
 def now_utc_iso() -> str:
@@ -9,33 +22,14 @@ def now_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def write_csv_log(
-    csv_file_path: str,
-    game: Dict[str, str],
-    mode_check: str,
-    status: str,
-    message: str = "",
-):
-    csv_file = csv_file_path.with_suffix(".csv")
-
-    game_code = game["code"]
-    game_name = game["name"]
-
-    csv_headers = [
-        "Timestamp",
-        "Game name" "Game code",
-        "Mode check",
-        "Status",
-        "Message",
-    ]
+def append_csv_rows(csv_file_path: Path, rows: Iterable[List[str]]):
+    """Append rows to a report, writing the header first if the file is new"""
+    csv_file = Path(csv_file_path).with_suffix(".csv")
+    csv_file.parent.mkdir(parents=True, exist_ok=True)
     is_new_file = not csv_file.exists()
 
-    with csv_file.open("a", newline="", encoding="utf-8") as csv_file:
-        csv_writer = csv.writer(csv_file)
-
+    with csv_file.open("a", newline="", encoding="utf-8") as f:
+        csv_writer = csv.writer(f)
         if is_new_file:
-            csv_writer.writerow(csv_headers)
-
-        csv_writer.writerow(
-            [now_utc_iso(), game_name, game_code, mode_check, status.upper(), message]
-        )
+            csv_writer.writerow(CSV_HEADERS)
+        csv_writer.writerows(rows)
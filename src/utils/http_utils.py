@@ -1,15 +1,41 @@
+from __future__ import annotations
+
 import os
-import requests
+import threading
 from urllib.parse import urljoin
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from utils.lazy_import import lazy_module
 from utils.logger import write_log
 
+requests = lazy_module("requests")
+
+
+HTTP_POOL_SIZE = 16
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Shared keep-alive session, so repeated API calls reuse connections"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+            )
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
 
 def get_token_by_operator_target(
     operator_target: str,
     currency: str = "USD",
     language: str = "en",
     balance: int = 100_000_000,
+    session: Optional[requests.Session] = None,
 ) -> str:
     url = urljoin(
         operator_target,
@@ -17,8 +43,10 @@ def get_token_by_operator_target(
     )
     timeout_sec = int(os.environ.get("timeout", "2"))
 
+    session = session or get_http_session()
+
     try:
-        response = requests.get(url, timeout=timeout_sec)
+        response = session.get(url, timeout=timeout_sec)
         response.raise_for_status()
         data = response.json()
         token = data.get("id")
@@ -38,17 +66,65 @@ def get_token_by_operator_target(
         raise
 
 
-def fetch_games_data(
-    service_game_client_url: str, oc: Optional[str] = "ppdemo"
-) -> List[object]:
+def fetch_games_data_conditional(
+    service_game_client_url: str,
+    oc: Optional[str] = "ppdemo",
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Optional[List[object]], Dict[str, str]]:
+    """Revalidating catalog fetch; returns (None, headers) when not modified"""
     url = urljoin(service_game_client_url, f"api/v1/available-games?oc={oc}")
-    timeout_sec = int(os.environ.get("timeout", "2"))
+    timeout_sec = timeout or int(os.environ.get("timeout", "2"))
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
 
     try:
-        response = requests.get(url, timeout=timeout_sec)
+        response = get_http_session().get(url, headers=headers, timeout=timeout_sec)
         response.raise_for_status()
-        return response.json().get("data", [])
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if response.status_code == 304:
+            return None, validators
+        return response.json().get("data", []), validators
 
     except (requests.RequestException, ValueError) as e:
         write_log(f"❌ Failed to fetch game data from {url}: {e}")
         raise
+
+
+def probe_asset(
+    url: str, validators: Dict[str, Optional[str]], timeout: Optional[float] = None
+) -> Dict[str, Optional[str]]:
+    """Conditional GET of an asset without downloading its body.
+
+    Returns the asset's current validators; a 304 means the stored ones still hold.
+    """
+    timeout_sec = timeout or int(os.environ.get("timeout", "2"))
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = get_http_session().get(
+        url, headers=headers, timeout=timeout_sec, stream=True
+    )
+    try:
+        if response.status_code == 304:
+            return dict(validators)
+        response.raise_for_status()
+        return {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_length": response.headers.get("Content-Length"),
+        }
+    finally:
+        response.close()
@@ -0,0 +1,109 @@
+import json
+from typing import Any, Dict, List
+from utils.logger import write_log
+from utils.paths import HISTORY_DIR
+from utils.statistics import percentile
+
+
+LATENCY_HISTORY_FILE = HISTORY_DIR / "latency_history.json"
+MAX_SAMPLES = 50  # per game and metric, oldest dropped first
+MIN_SAMPLES = 3  # below this the fixed defaults are used
+
+DEFAULT_TIMEOUTS = {
+    "goto_timeout": 100_000,  # milliseconds
+    "ready_timeout": 15_000,  # milliseconds
+    "idle_timeout": 2000,  # milliseconds
+    "response_timeout": 5000,  # milliseconds
+    "settle_delay": 4.0,  # seconds
+}
+
+# timeout -> (metric, percentile, multiplier, floor, ceiling); floors and
+# ceilings are in milliseconds, metrics are recorded in seconds. The settle
+# delay isn't learned: no signal tells when a game's animation has finished.
+TIMEOUT_RULES = {
+    "goto_timeout": ("load", 95, 2.0, 15_000, 100_000),
+    "ready_timeout": ("ready", 95, 3.0, 3000, 15_000),
+    "idle_timeout": ("click", 90, 1.5, 500, 2000),
+    "response_timeout": ("click", 95, 2.0, 1500, 5000),
+}
+
+_history: Dict[str, Dict[str, List[float]]] = {}
+_loaded = False
+_page_keys: Dict[Any, str] = {}
+
+
+def _load():
+    global _history, _loaded
+    if _loaded:
+        return
+    _loaded = True
+    if not LATENCY_HISTORY_FILE.exists():
+        return
+    try:
+        with open(LATENCY_HISTORY_FILE, "r", encoding="utf-8") as f:
+            _history = json.load(f)
+    except (OSError, ValueError) as e:
+        write_log(f"⚠️ Latency history unreadable, starting empty: {e}")
+
+
+def save_latency_history():
+    if not _loaded:
+        return
+    LATENCY_HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = LATENCY_HISTORY_FILE.with_suffix(".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(_history, f)
+    tmp_file.replace(LATENCY_HISTORY_FILE)
+
+
+def history_key(env: str, oc: str, game_code: str) -> str:
+    return f"{env}/{oc}/{game_code}"
+
+
+def compute_timeouts(samples: Dict[str, List[float]]) -> Dict[str, float]:
+    timeouts = dict(DEFAULT_TIMEOUTS)
+    for name, (metric, pct, multiplier, floor, ceiling) in TIMEOUT_RULES.items():
+        values = samples.get(metric, [])
+        if len(values) < MIN_SAMPLES:
+            continue
+        value = percentile(values, pct) * multiplier * 1000
+        timeouts[name] = min(max(value, floor), ceiling)
+    return timeouts
+
+
+def bind_page(page, env: str, oc: str, game_code: str):
+    """Attach a game's history to the page it is about to run on"""
+    _load()
+    key = history_key(env, oc, game_code)
+    _page_keys[page] = key
+    if key in _history:
+        write_log(f"⏱️ Adaptive timeouts for {game_code}: {get_timeouts(page)}")
+
+
+def unbind_page(page):
+    _page_keys.pop(page, None)
+
+
+def get_timeouts(page) -> Dict[str, float]:
+    key = _page_keys.get(page)
+    if key is None:
+        return dict(DEFAULT_TIMEOUTS)
+    return compute_timeouts(_history.get(key, {}))
+
+
+def record_latency(page, metric: str, seconds: float):
+    key = _page_keys.get(page)
+    if key is None:
+        return
+    samples = _history.setdefault(key, {}).setdefault(metric, [])
+    samples.append(round(seconds, 3))
+    del samples[:-MAX_SAMPLES]
+
+
+def record_timeout(page, metric: str, budget_ms: float):
+    """Record an expired wait at its budget, a lower bound of the real latency
+
+    Dropping timeouts would bias the history down, so a game that slows down
+    would keep hitting its own shortened timeouts.
+    """
+    record_latency(page, metric, budget_ms / 1000)
@@ -1,14 +1,34 @@
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 from rich.console import Console
 import shutil
 from utils.paths import TEMP_DIR, OUTPUT_DIR
 
+LOG_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+DEFAULT_LOG_LEVEL = os.environ.get("LOG_LEVEL", "debug").lower()
+
+LOG_QUEUE_SIZE = 10_000  # lines buffered before write_log starts waiting
+FLUSH_LINES = 200  # write a batch once this many lines are pending ...
+FLUSH_INTERVAL = 0.5  # ... or this many seconds after its first line
+PUT_TIMEOUT = 1.0  # seconds, a line is dropped if the writer is this far behind
+FLUSH_TIMEOUT = 5.0  # seconds to wait for pending lines on flush
+
+# Messages carry their severity as an emoji prefix; used when no level is given
+_PREFIX_LEVELS = (("❌", "error"), ("⚠️", "warning"))
+
 _LOGGER_STATE = {
     "token": None,
     "language": None,
     "folder": Path(TEMP_DIR),
     "file": Path(TEMP_DIR) / "log_activity.log",
+    "level": LOG_LEVELS.get(DEFAULT_LOG_LEVEL, LOG_LEVELS["debug"]),
 }
 
 _LOGGER_STATE["folder"].mkdir(parents=True, exist_ok=True)
@@ -18,32 +38,145 @@ def now_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+class _LogWriter(threading.Thread):
+    """Background thread appending queued lines to their log files in batches"""
+
+    def __init__(self):
+        super().__init__(name="log-writer", daemon=True)
+        self.queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self.dropped = 0
+        self._file = None
+        self._file_path: Optional[Path] = None
+
+    def run(self):
+        batch: List[Tuple[Path, str]] = []
+        flush_at = 0.0
+
+        while True:
+            timeout = max(flush_at - time.monotonic(), 0) if batch else None
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, threading.Event):
+                self._write(batch)
+                batch = []
+                self._close_file()
+                item.set()
+                continue
+
+            if item is not None:
+                if not batch:
+                    flush_at = time.monotonic() + FLUSH_INTERVAL
+                batch.append(item)
+
+            if batch and (len(batch) >= FLUSH_LINES or time.monotonic() >= flush_at):
+                self._write(batch)
+                batch = []
+
+    def _write(self, batch: List[Tuple[Path, str]]):
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            notice = f"[{now_utc_iso()}] ⚠️ Log queue full, {dropped} lines dropped\n"
+            batch.append((_LOGGER_STATE["file"], notice))
+        try:
+            for log_file, line in batch:
+                if log_file != self._file_path:
+                    self._close_file()
+                    log_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = log_file.open("a", encoding="utf-8")
+                    self._file_path = log_file
+                self._file.write(line)
+            if self._file:
+                self._file.flush()
+        except OSError as e:
+            self._close_file()
+            print(f"⚠️ Failed to write log lines: {e}", file=sys.stderr)
+
+    def _close_file(self):
+        if self._file:
+            self._file.close()
+        self._file = None
+        self._file_path = None
+
+
+_writer: Optional[_LogWriter] = None
+_writer_lock = threading.Lock()
+_path_lock = threading.Lock()
+
+
+def _get_writer() -> Optional[_LogWriter]:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = _LogWriter()
+                _writer.start()
+    return _writer
+
+
+def flush_logs(timeout: float = FLUSH_TIMEOUT):
+    """Block until every queued line is on disk and the log file is closed"""
+    if _writer is None or not _writer.is_alive():
+        return
+    done = threading.Event()
+    _writer.queue.put(done)
+    done.wait(timeout)
+
+
+atexit.register(flush_logs)
+
+
+def set_log_level(level: str):
+    """Drop messages below `level` (debug, info, warning, error)"""
+    if level.lower() not in LOG_LEVELS:
+        raise ValueError(f"Unknown log level: {level}")
+    _LOGGER_STATE["level"] = LOG_LEVELS[level.lower()]
+
+
 def set_log_path(token: str, language: str):
     new_folder = Path(OUTPUT_DIR) / f"{token}_{language}"
     new_folder.mkdir(parents=True, exist_ok=True)
 
-    old_folder = _LOGGER_STATE["folder"]
-    if old_folder.exists():
-        for item in old_folder.iterdir():
-            dest = new_folder / item.name
-            if item.is_file():
-                shutil.copy2(item, dest)
-            elif item.is_dir():
-                shutil.copytree(item, dest, dirs_exist_ok=True)
-        shutil.rmtree(old_folder)
-
-    _LOGGER_STATE["token"] = token
-    _LOGGER_STATE["language"] = language
-    _LOGGER_STATE["folder"] = new_folder
-    _LOGGER_STATE["file"] = new_folder / "log_activity.log"
-
-
-def write_log(message: str):
-    folder = _LOGGER_STATE["folder"]
-    folder.mkdir(parents=True, exist_ok=True)
-    log_file = _LOGGER_STATE["file"]
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(f"[{now_utc_iso()}] {message}\n")
+    with _path_lock:
+        # Lines already queued for the old file must land before it moves
+        flush_logs()
+
+        old_folder = _LOGGER_STATE["folder"]
+        # Only the pre-run temp log moves; a batch run switching to its next
+        # combination keeps the previous combination's outputs in place
+        if old_folder == Path(TEMP_DIR) and old_folder.exists():
+            for item in old_folder.iterdir():
+                dest = new_folder / item.name
+                if item.is_file():
+                    shutil.copy2(item, dest)
+                elif item.is_dir():
+                    shutil.copytree(item, dest, dirs_exist_ok=True)
+            shutil.rmtree(old_folder)
+
+        _LOGGER_STATE["token"] = token
+        _LOGGER_STATE["language"] = language
+        _LOGGER_STATE["folder"] = new_folder
+        _LOGGER_STATE["file"] = new_folder / "log_activity.log"
+
+
+def write_log(message: str, level: Optional[str] = None):
+    if level is None:
+        level = next(
+            (lvl for prefix, lvl in _PREFIX_LEVELS if message.startswith(prefix)),
+            "info",
+        )
+    if LOG_LEVELS[level] < _LOGGER_STATE["level"]:
+        return
+
+    line = f"[{now_utc_iso()}] {message}\n"
+    writer = _get_writer()
+    with _path_lock:
+        try:
+            writer.queue.put((_LOGGER_STATE["file"], line), timeout=PUT_TIMEOUT)
+        except queue.Full:
+            writer.dropped += 1
 
 
 def print_banner(console, message: str, width: int = 80):
@@ -0,0 +1,111 @@
+import csv
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+from utils.statistics import percentile
+
+
+TIMING_PHASES = ["dns", "connect", "ttfb", "download", "total"]
+
+
+def _phase(timing: Dict[str, float], start_key: str, end_key: str) -> float:
+    start, end = timing.get(start_key, -1), timing.get(end_key, -1)
+    if start < 0 or end < 0:
+        return 0.0
+    return max(end - start, 0.0)
+
+
+class TimingBuffer:
+    """Columnar store of request timings; strings are interned to small ints"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+
+        self.game = array("I")
+        self.mode = array("I")
+        self.endpoint = array("I")
+        self.url = array("I")
+        self.started_at = array("d")  # epoch milliseconds
+        self.phases = {phase: array("d") for phase in TIMING_PHASES}
+
+    def _intern(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def __len__(self) -> int:
+        return len(self.started_at)
+
+    def append(self, game: str, mode: str, endpoint: str, url: str, timing: Dict):
+        """Add one request from Playwright's `request.timing` (milliseconds)"""
+        self.game.append(self._intern(game))
+        self.mode.append(self._intern(mode))
+        self.endpoint.append(self._intern(endpoint))
+        self.url.append(self._intern(url.split("?", 1)[0]))
+        self.started_at.append(timing.get("startTime", 0.0))
+        self.phases["dns"].append(
+            _phase(timing, "domainLookupStart", "domainLookupEnd")
+        )
+        self.phases["connect"].append(_phase(timing, "connectStart", "connectEnd"))
+        self.phases["ttfb"].append(_phase(timing, "requestStart", "responseStart"))
+        self.phases["download"].append(_phase(timing, "responseStart", "responseEnd"))
+        self.phases["total"].append(max(timing.get("responseEnd", 0.0), 0.0))
+
+    def write_waterfall(self, game: str, output_file: Path) -> int:
+        """Write one game's requests in start order, returns the row count"""
+        game_id = self._string_ids.get(game)
+        if game_id is None:
+            return 0
+
+        rows = sorted(
+            (i for i, g in enumerate(self.game) if g == game_id),
+            key=lambda i: self.started_at[i],
+        )
+        if not rows:
+            return 0
+
+        first_start = self.started_at[rows[0]]
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with output_file.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["Offset (ms)", "Mode", "Endpoint", "URL"]
+                + [f"{phase} (ms)" for phase in TIMING_PHASES]
+            )
+            for i in rows:
+                writer.writerow(
+                    [
+                        f"{self.started_at[i] - first_start:.1f}",
+                        self._strings[self.mode[i]],
+                        self._strings[self.endpoint[i]],
+                        self._strings[self.url[i]],
+                    ]
+                    + [f"{self.phases[phase][i]:.1f}" for phase in TIMING_PHASES]
+                )
+        return len(rows)
+
+    def endpoint_percentiles(self, pcts=(50, 95, 99)) -> Dict[str, Dict[str, List]]:
+        """Per endpoint and phase: [p50, p95, p99] in milliseconds"""
+        by_endpoint = defaultdict(lambda: defaultdict(list))
+        for i, endpoint_id in enumerate(self.endpoint):
+            for phase in TIMING_PHASES:
+                by_endpoint[endpoint_id][phase].append(self.phases[phase][i])
+
+        return {
+            self._strings[endpoint_id]: {
+                phase: [percentile(values, p) for p in pcts]
+                for phase, values in phases.items()
+            }
+            for endpoint_id, phases in by_endpoint.items()
+        }
+
+
+network_timings = TimingBuffer()
@@ -1,5 +1,7 @@
-import cv2
-import numpy as np
+from utils.lazy_import import lazy_module
+
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
 
 
 def convert_numpy_types(obj):
@@ -60,3 +62,28 @@ def enhanced_template_matching(screen_img, template_img, scales=None):
             )
     best_results.sort(key=lambda x: x["confidence"], reverse=True)
     return best_results[0] if best_results else None
+
+
+def match_template_in_roi(screen_img, template_img, scale, box, margin):
+    """TM_CCOEFF_NORMED match of a scaled template within `margin` px of a box"""
+    t_h, t_w = template_img.shape[:2]
+    scaled_template = cv2.resize(template_img, (int(t_w * scale), int(t_h * scale)))
+    (x1, y1), (x2, y2) = box
+    s_h, s_w = screen_img.shape[:2]
+    left, top = max(x1 - margin, 0), max(y1 - margin, 0)
+    roi = screen_img[top : min(y2 + margin, s_h), left : min(x2 + margin, s_w)]
+    if (
+        scaled_template.shape[0] > roi.shape[0]
+        or scaled_template.shape[1] > roi.shape[1]
+    ):
+        return None
+
+    res = cv2.matchTemplate(roi, scaled_template, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(res)
+    return {
+        "method": "TM_CCOEFF_NORMED",
+        "scale": scale,
+        "confidence": max_val,
+        "location": (left + max_loc[0], top + max_loc[1]),
+        "template_size": scaled_template.shape[:2],
+    }
@@ -7,6 +7,15 @@ TEMPLATE_DIR = BASE_DIR / "templates"
 CAPTURE_DIR = BASE_DIR / "captures"
 OUTPUT_DIR = BASE_DIR / "_output-reports"
 TEMP_DIR = BASE_DIR / "temps"
+CACHE_DIR = BASE_DIR / ".cache"
+ASSET_CACHE_DIR = CACHE_DIR / "assets"
+HAR_DIR = CACHE_DIR / "har"
+CATALOG_CACHE_DIR = CACHE_DIR / "catalog"
+HISTORY_DIR = BASE_DIR / "_history"
+ANALYTICS_DIR = OUTPUT_DIR / "analytics"
+CHECKPOINT_DIR = HISTORY_DIR / "checkpoints"
+FINGERPRINT_DIR = HISTORY_DIR / "fingerprints"
+DAEMON_SOCKET = CACHE_DIR / "daemon.sock"
 
 
 def init_workspace():
@@ -0,0 +1,128 @@
+import json
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from rich.console import Console
+from utils.logger import write_log
+from utils.paths import CACHE_DIR
+
+
+POSITION_CACHE_FILE = CACHE_DIR / "positions.json"
+
+# env/oc/game code -> mode -> language -> best match of the last full detection
+_positions: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+_state = {"enabled": False, "loaded": False}
+_stats = Counter()
+_timings: Dict[str, List[float]] = {"verify": [], "detect": []}
+# Screenshots are matched in worker threads
+_lock = threading.Lock()
+
+
+def enable_position_reuse():
+    """Reuse button positions found for a game in other languages"""
+    _state["enabled"] = True
+
+
+def is_enabled() -> bool:
+    return _state["enabled"]
+
+
+def _load():
+    with _lock:
+        if _state["loaded"]:
+            return
+        _state["loaded"] = True
+        if not POSITION_CACHE_FILE.exists():
+            return
+        try:
+            with open(POSITION_CACHE_FILE, "r", encoding="utf-8") as f:
+                positions = json.load(f)
+        except (OSError, ValueError) as e:
+            write_log(f"⚠️ Position cache unreadable, detecting from scratch: {e}")
+            return
+        # Entries keyed by game code alone predate env/oc scoping
+        _positions.update(
+            {key: modes for key, modes in positions.items() if key.count("/") == 2}
+        )
+
+
+def position_key(env: str, oc: str, game_code: str) -> str:
+    return f"{env}/{oc}/{game_code}"
+
+
+def get_position(
+    env: str, oc: str, game_code: str, mode: str, language: str
+) -> Optional[Dict[str, Any]]:
+    """The language's own position, else one found in another language"""
+    _load()
+    with _lock:
+        by_language = _positions.get(position_key(env, oc, game_code), {}).get(mode)
+        if not by_language:
+            return None
+        return by_language.get(language) or next(iter(by_language.values()))
+
+
+def store_position(
+    env: str,
+    oc: str,
+    game_code: str,
+    mode: str,
+    match: Dict[str, Any],
+    language: str,
+):
+    _load()
+    position = {
+        key: match[key]
+        for key in ("template_name", "scale", "top_left", "bottom_right")
+    }
+    with _lock:
+        modes = _positions.setdefault(position_key(env, oc, game_code), {})
+        modes.setdefault(mode, {})[language] = {**position, "language": language}
+
+
+def drop_position(env: str, oc: str, game_code: str, mode: str, language: str):
+    with _lock:
+        modes = _positions.get(position_key(env, oc, game_code), {})
+        modes.get(mode, {}).pop(language, None)
+
+
+def record_outcome(outcome: str, elapsed: float):
+    """Count a reused, fallback or detected mode; elapsed is its matching time"""
+    with _lock:
+        _stats[outcome] += 1
+        _timings["detect" if outcome != "reused" else "verify"].append(elapsed)
+
+
+def reset_position_stats():
+    """Forget reuse counts and timings; the positions themselves are kept"""
+    _stats.clear()
+    for timings in _timings.values():
+        timings.clear()
+
+
+def save_positions():
+    if not _state["loaded"]:
+        return
+    POSITION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = POSITION_CACHE_FILE.with_suffix(".tmp")
+    with _lock, open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(_positions, f)
+    tmp_file.replace(POSITION_CACHE_FILE)
+
+
+def print_position_report(console: Console):
+    if not _state["enabled"] or not _stats:
+        return
+
+    def average_ms(values: List[float]) -> float:
+        return sum(values) / len(values) * 1000 if values else 0.0
+
+    console.print(f"\n[bold blue]📍 Position Reuse:[/bold blue]")
+    console.print(
+        f"Reused: {_stats['reused']}, verification failed: {_stats['fallback']}, "
+        f"no cached position: {_stats['detected']}"
+    )
+    console.print(
+        f"Matching per mode: verify {average_ms(_timings['verify']):.1f} ms, "
+        f"full detection {average_ms(_timings['detect']):.1f} ms"
+    )
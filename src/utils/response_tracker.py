@@ -1,19 +1,19 @@
 from utils.logger import write_log
+from utils.network_timing import network_timings, TIMING_PHASES
+from utils.action_latency import resolve_action
 from utils.paths import (
     get_output_path,
 )
 
 
-current_game_responses = []
-current_game_info = {
-    "code": "",
-    "name": "",
-    "mode": "",
-    "token": "",
-    "language": "",
-    "page": any,
-}
+# Game currently running on each page, so parallel workers don't overwrite
+# each other's context
+_game_info_by_page = {}
 import asyncio
+import random
+import re
+import time
+from collections import defaultdict
 
 ERROR_PATTERNS = [
     "internal server error",
@@ -22,8 +22,18 @@ ERROR_PATTERNS = [
     "bad gateway",
 ]
 
+ERROR_PATTERN_RE = re.compile(
+    b"|".join(re.escape(p.encode()) for p in ERROR_PATTERNS), re.IGNORECASE
+)
+
 ERROR_STATUS_CODES = [400, 401, 403, 404, 408, 500, 502, 503, 504]
 
+TEXT_CONTENT_TYPES = ["json", "text", "xml", "html"]
+MAX_SCAN_BYTES = 64 * 1024  # only the head of a body is scanned
+BODY_SAMPLE_RATE = 0.25  # share of small text bodies that are scanned
+# Share of bodies above MAX_SCAN_BYTES, or of unknown size, that are read
+LARGE_BODY_SAMPLE_RATE = 0.1
+
 
 TRACKED_ENDPOINTS = [
     "gameService",
@@ -31,73 +41,180 @@ TRACKED_ENDPOINTS = [
     "betService",
 ]
 
+endpoint_stats = defaultdict(
+    lambda: {
+        "responses": 0,
+        "bodies_read": 0,
+        "bytes_inspected": 0,
+        "time_spent": 0.0,
+        "errors": 0,
+    }
+)
+
+
+def reset_tracking():
+    """Forget earlier runs' requests, so waterfalls and reports cover one run"""
+    endpoint_stats.clear()
+    network_timings.reset()
+
 
 def set_game_info(game_code: str, game_name: str, language: str, token: str, page: any):
-    global current_game_info
-    current_game_info["code"] = game_code
-    current_game_info["name"] = game_name
-    current_game_info["language"] = language
-    current_game_info["token"] = token
-    current_game_info["page"] = page
+    _game_info_by_page[page] = {
+        "code": game_code,
+        "name": game_name,
+        "mode": "",
+        "token": token,
+        "language": language,
+        "page": page,
+    }
+
+
+def set_current_mode(mode: str, page: any):
+    info = _game_info_by_page.get(page)
+    if info is not None:
+        info["mode"] = mode
+
 
+def clear_game_info(page: any):
+    _game_info_by_page.pop(page, None)
 
-def set_current_mode(mode: str):
-    global current_game_info
-    current_game_info["mode"] = mode
+
+def _match_endpoint(url: str):
+    for endpoint in TRACKED_ENDPOINTS:
+        if endpoint in url:
+            return endpoint
+    return None
+
+
+def _should_read_body(headers) -> bool:
+    """Decide from headers alone whether a body is worth buffering and scanning"""
+    content_type = headers.get("content-type", "").lower()
+    if not any(t in content_type for t in TEXT_CONTENT_TYPES):
+        return False
+
+    # Chunked responses have no content-length and may be of any size
+    try:
+        content_length = int(headers["content-length"])
+    except (KeyError, ValueError):
+        content_length = None
+
+    if content_length is None or content_length > MAX_SCAN_BYTES:
+        return random.random() < LARGE_BODY_SAMPLE_RATE
+    return random.random() < BODY_SAMPLE_RATE
 
 
 async def on_response(response):
     try:
-        if not any(endpoint in response.url for endpoint in TRACKED_ENDPOINTS):
+        endpoint = _match_endpoint(response.url)
+        if endpoint is None:
             return
 
-        content_type = response.headers.get("content-type", "").lower()
-        body_data = None
-
-        if "application/json" in content_type:
-            try:
-                body_data = await response.json()
-            except Exception:
-                body_data = await response.text()
-        elif any(t in content_type for t in ["text", "xml", "html"]):
-            body_data = await response.text()
-        else:
-            raw = await response.body()
-            body_data = f"[non-text content: {len(raw)} bytes]"
-
-        body_str = str(body_data).lower()
-
-        data = {
-            "url": response.url,
-            "status": response.status,
-            "method": response.request.method,
-            "body": body_data,
-        }
+        page = response.frame.page
+        current_game_info = _game_info_by_page.get(page)
+        if current_game_info is None:
+            return
+
+        resolve_action(page, response)
+
+        inspect_start = time.perf_counter()
+        stats = endpoint_stats[endpoint]
+        stats["responses"] += 1
 
+        # Status first: an error status needs no body to be reported
+        is_error = response.status in ERROR_STATUS_CODES
+        if not is_error and _should_read_body(response.headers):
+            body = await response.body()
+            window = memoryview(body)[:MAX_SCAN_BYTES]
+            stats["bodies_read"] += 1
+            stats["bytes_inspected"] += len(window)
+            is_error = ERROR_PATTERN_RE.search(window) is not None
+
+        stats["time_spent"] += time.perf_counter() - inspect_start
+
+        if not is_error:
+            return
+
+        stats["errors"] += 1
         game_code = current_game_info["code"]
         game_name = current_game_info["name"]
         mode = current_game_info["mode"]
 
-        if response.status in ERROR_STATUS_CODES or any(
-            err in body_str for err in ERROR_PATTERNS
-        ):
-            screenshot_result = await _capture_screenshot_error(
-                token=current_game_info["token"],
-                game_code=game_code,
-                language=current_game_info["language"],
-                mode=mode,
-                page=current_game_info["page"],
-            )
+        await _capture_screenshot_error(
+            token=current_game_info["token"],
+            game_code=game_code,
+            language=current_game_info["language"],
+            mode=mode,
+            page=current_game_info["page"],
+        )
 
-            print(f"❌ Game [{game_code}] {game_name} | Mode [{mode}]")
-            write_log(
-                f"❌ Game [{game_code}] {game_name} | Mode [{mode}] failed with status {response.status}: {response.url}"
-            )
+        write_log(
+            f"❌ Game [{game_code}] {game_name} | Mode [{mode}] failed with status {response.status}: {response.url}"
+        )
 
     except Exception as e:
         write_log(f"⚠️ Error tracking response: {e}")
 
 
+async def on_request_finished(request):
+    """Record DNS/connect/TTFB/download timing of every tracked request"""
+    try:
+        endpoint = _match_endpoint(request.url)
+        if endpoint is None:
+            return
+
+        current_game_info = _game_info_by_page.get(request.frame.page)
+        if current_game_info is None:
+            return
+
+        network_timings.append(
+            current_game_info["code"],
+            current_game_info["mode"] or "load",
+            endpoint,
+            request.url,
+            request.timing,
+        )
+    except Exception as e:
+        write_log(f"⚠️ Error recording request timing: {e}")
+
+
+def write_game_waterfall(token: str, game_code: str, language: str):
+    output_file = get_output_path(token, game_code, language) / "network_waterfall.csv"
+    rows = network_timings.write_waterfall(game_code, output_file)
+    if rows:
+        write_log(f"🌊 Network waterfall saved ({rows} requests): {output_file}")
+
+
+def print_timing_summary(console):
+    if not len(network_timings):
+        return
+
+    console.print(f"\n[bold blue]🌊 Network Timing (p50 / p95 / p99 ms):[/bold blue]")
+    for endpoint, phases in network_timings.endpoint_percentiles().items():
+        console.print(
+            f"{endpoint}: "
+            + ", ".join(
+                f"{phase} {'/'.join(f'{v:.0f}' for v in phases[phase])}"
+                for phase in TIMING_PHASES
+            )
+        )
+
+
+def print_tracker_report(console):
+    if not endpoint_stats:
+        return
+
+    console.print(f"\n[bold blue]📡 Response Tracking:[/bold blue]")
+    for endpoint, stats in endpoint_stats.items():
+        console.print(
+            f"{endpoint}: {stats['responses']} responses, "
+            f"{stats['bodies_read']} bodies scanned "
+            f"({stats['bytes_inspected'] / 1e3:.1f} KB), "
+            f"{stats['time_spent'] * 1000:.0f} ms, "
+            f"[red]{stats['errors']} errors[/red]"
+        )
+    write_log(f"📡 Response tracking stats: {dict(endpoint_stats)}")
+
+
 async def _capture_screenshot_error(token, game_code, language, mode, page):
     from actions.game_actions import capture_screenshot
 
@@ -0,0 +1,384 @@
+import atexit
+import sqlite3
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from rich.console import Console
+from utils.csv_logger import append_csv_rows, now_utc_iso
+from utils.logger import write_log
+from utils.mapping_utils import map_mode_check_display
+from utils.paths import HISTORY_DIR
+
+
+RESULTS_DB = HISTORY_DIR / "results.db"
+FLUSH_ROWS = 50  # buffered results before a flush ...
+FLUSH_INTERVAL = 10.0  # ... or seconds since the last one
+HISTORY_LIMIT = 20
+ESTIMATE_RUNS = 20  # latest runs of an env/oc used for duration estimates
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    env TEXT NOT NULL,
+    oc TEXT NOT NULL,
+    language TEXT,
+    currency TEXT,
+    token TEXT
+);
+CREATE TABLE IF NOT EXISTS games (
+    code TEXT PRIMARY KEY,
+    name TEXT,
+    last_seen_at TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    recorded_at TEXT NOT NULL,
+    game_code TEXT NOT NULL REFERENCES games(code),
+    mode TEXT NOT NULL,
+    status TEXT NOT NULL,
+    message TEXT,
+    confidence REAL,
+    action_latency_ms REAL,
+    duration_ms REAL
+);
+CREATE TABLE IF NOT EXISTS game_loads (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    game_code TEXT NOT NULL REFERENCES games(code),
+    load_ms REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS game_durations (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    game_code TEXT NOT NULL REFERENCES games(code),
+    duration_ms REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_game_mode ON results (game_code, mode, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results (run_id);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results (status);
+CREATE INDEX IF NOT EXISTS idx_runs_env_oc ON runs (env, oc, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_env_started ON runs (env, started_at);
+CREATE INDEX IF NOT EXISTS idx_game_loads_run ON game_loads (run_id);
+CREATE INDEX IF NOT EXISTS idx_game_durations_run ON game_durations (run_id);
+"""
+
+_state: Dict[str, Any] = {
+    "conn": None,
+    "run_id": None,
+    "observers": (),
+    "pending": [],
+    "pending_loads": [],
+    "pending_durations": [],
+    "last_flush": time.monotonic(),
+}
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def start_run(
+    env: str,
+    oc: str,
+    language: str,
+    currency: str,
+    token: str,
+    observers: Sequence[Any] = (),
+    db_path: Path = RESULTS_DB,
+) -> Optional[int]:
+    """Open the results database and register a new run
+
+    Every result is also passed to each observer's mark_done(game_code, mode,
+    status), e.g. the run's checkpoint, once it has been flushed to disk.
+    """
+    _state["observers"] = observers
+    try:
+        conn = _connect(db_path)
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (started_at, env, oc, language, currency, token) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (now_utc_iso(), env, oc, language, currency, token),
+            )
+    except sqlite3.Error as e:
+        write_log(f"⚠️ Results database unavailable, CSV report only: {e}")
+        return None
+
+    _state["conn"] = conn
+    _state["run_id"] = cursor.lastrowid
+    write_log(f"🗃️ Recording results as run {cursor.lastrowid} in {db_path}")
+    return cursor.lastrowid
+
+
+def record_result(
+    report_path: Path,
+    game: Dict[str, str],
+    mode: str,
+    status: str,
+    icon: str,
+    message: str = "",
+    action_latency_ms: Optional[float] = None,
+    confidence: Optional[float] = None,
+    duration_ms: Optional[float] = None,
+):
+    """Buffer one mode's result; flushed to the database and report.csv in batches"""
+    _state["pending"].append(
+        {
+            "report_path": report_path,
+            "recorded_at": now_utc_iso(),
+            "game_code": game["code"],
+            "game_name": game.get("name", ""),
+            "mode": mode,
+            "status": status,
+            "icon": icon,
+            "message": message,
+            "confidence": confidence,
+            "action_latency_ms": action_latency_ms,
+            "duration_ms": duration_ms,
+        }
+    )
+    if (
+        len(_state["pending"]) >= FLUSH_ROWS
+        or time.monotonic() - _state["last_flush"] >= FLUSH_INTERVAL
+    ):
+        flush_results()
+
+
+def record_load_time(game: Dict[str, str], load_ms: float):
+    """Buffer a game's page load time, stored with the next results flush"""
+    _state["pending_loads"].append((game["code"], load_ms))
+
+
+def record_game_duration(game: Dict[str, str], duration_ms: float):
+    """Buffer a game's total check time, stored with the next results flush"""
+    _state["pending_durations"].append((game["code"], duration_ms))
+
+
+def _format_number(value: Optional[float], digits: int = 0) -> str:
+    return f"{value:.{digits}f}" if value is not None else ""
+
+
+def _notify_observers(rows: List[Dict[str, Any]]):
+    # Only after the rows are stored: a checkpoint must not get ahead of them
+    for row in rows:
+        for observer in _state["observers"]:
+            observer.mark_done(row["game_code"], row["mode"], row["status"])
+
+
+def flush_results():
+    pending, _state["pending"] = _state["pending"], []
+    loads, _state["pending_loads"] = _state["pending_loads"], []
+    durations, _state["pending_durations"] = _state["pending_durations"], []
+    _state["last_flush"] = time.monotonic()
+    if not pending and not loads and not durations:
+        return
+
+    rows_by_report = defaultdict(list)
+    for row in pending:
+        rows_by_report[row["report_path"]].append(
+            [
+                row["recorded_at"],
+                row["game_name"],
+                row["game_code"],
+                map_mode_check_display(row["mode"]),
+                row["icon"].upper(),
+                row["message"],
+                _format_number(row["action_latency_ms"]),
+                _format_number(row["confidence"], 3),
+                _format_number(row["duration_ms"]),
+            ]
+        )
+    for report_path, rows in rows_by_report.items():
+        append_csv_rows(report_path, rows)
+
+    conn = _state["conn"]
+    if conn is None:
+        _notify_observers(pending)
+        return
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO games (code, name, last_seen_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(code) DO UPDATE SET "
+                "name = excluded.name, last_seen_at = excluded.last_seen_at",
+                [(r["game_code"], r["game_name"], r["recorded_at"]) for r in pending],
+            )
+            conn.executemany(
+                "INSERT INTO results (run_id, recorded_at, game_code, mode, status, "
+                "message, confidence, action_latency_ms, duration_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        _state["run_id"],
+                        r["recorded_at"],
+                        r["game_code"],
+                        r["mode"],
+                        r["status"],
+                        r["message"],
+                        r["confidence"],
+                        r["action_latency_ms"],
+                        r["duration_ms"],
+                    )
+                    for r in pending
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO game_loads (run_id, game_code, load_ms) VALUES (?, ?, ?)",
+                [(_state["run_id"], code, load_ms) for code, load_ms in loads],
+            )
+            conn.executemany(
+                "INSERT INTO game_durations (run_id, game_code, duration_ms) "
+                "VALUES (?, ?, ?)",
+                [(_state["run_id"], code, ms) for code, ms in durations],
+            )
+    except sqlite3.Error as e:
+        write_log(f"⚠️ Failed to store {len(pending)} results in database: {e}")
+        return
+    _notify_observers(pending)
+
+
+def finish_run():
+    """Flush buffered results and close the run"""
+    flush_results()
+    _state["observers"] = ()
+    conn = _state["conn"]
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute(
+                "UPDATE runs SET finished_at = ? WHERE id = ?",
+                (now_utc_iso(), _state["run_id"]),
+            )
+        conn.close()
+    except sqlite3.Error as e:
+        write_log(f"⚠️ Failed to close results run: {e}")
+    _state["conn"] = None
+    _state["run_id"] = None
+
+
+atexit.register(finish_run)
+
+
+def game_history(
+    game_code: str, limit: int = HISTORY_LIMIT, db_path: Path = RESULTS_DB
+) -> List[sqlite3.Row]:
+    """Latest results of one game across runs, newest first"""
+    if not db_path.exists():
+        return []
+    conn = _connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT runs.started_at, runs.env, runs.oc, runs.language, results.* "
+            "FROM results JOIN runs ON runs.id = results.run_id "
+            "WHERE results.game_code = ? "
+            "ORDER BY results.run_id DESC, results.id DESC LIMIT ?",
+            (game_code, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def failed_checks(
+    env: str, oc: str, language: str, currency: str, db_path: Path = RESULTS_DB
+) -> Dict[str, List[str]]:
+    """Modes per game whose latest stored result for this configuration isn't a pass
+
+    The latest result per check is used rather than only the last run's, so a
+    run that was resumed or a previous failed-only rerun is taken into account.
+    """
+    if not db_path.exists():
+        return {}
+    conn = _connect(db_path)
+    try:
+        # SQLite takes bare columns from the row holding MAX(results.id)
+        rows = conn.execute(
+            "SELECT results.game_code, results.mode, results.status, "
+            "MAX(results.id) FROM results JOIN runs ON runs.id = results.run_id "
+            "WHERE runs.env = ? AND runs.oc = ? AND runs.language = ? "
+            "AND runs.currency = ? GROUP BY results.game_code, results.mode",
+            (env, oc, language, currency),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    failed: Dict[str, List[str]] = defaultdict(list)
+    for row in rows:
+        if row["status"] != "success":
+            failed[row["game_code"]].append(row["mode"])
+    return dict(failed)
+
+
+def stored_checks(
+    env: str,
+    oc: str,
+    language: str,
+    currency: str,
+    tokens: Iterable[str],
+    db_path: Path = RESULTS_DB,
+) -> Optional[Set[Tuple[str, str]]]:
+    """(game, mode) checks stored by the runs using any of these tokens
+
+    None when there is no results database to check against.
+    """
+    tokens = list(tokens)
+    if not db_path.exists():
+        return None
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT DISTINCT results.game_code, results.mode "
+            "FROM results JOIN runs ON runs.id = results.run_id "
+            "WHERE runs.env = ? AND runs.oc = ? AND runs.language = ? "
+            "AND runs.currency = ? "
+            f"AND runs.token IN ({', '.join('?' * len(tokens))})",
+            (env, oc, language, currency, *tokens),
+        ).fetchall()
+    finally:
+        conn.close()
+    return {(row["game_code"], row["mode"]) for row in rows}
+
+
+def game_duration_estimates(
+    env: str, oc: str, runs: int = ESTIMATE_RUNS, db_path: Path = RESULTS_DB
+) -> Dict[str, float]:
+    """Average check time in ms per game over the latest runs of an env/oc"""
+    if not db_path.exists():
+        return {}
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT game_code, AVG(duration_ms) AS duration_ms FROM game_durations "
+            "WHERE run_id IN (SELECT id FROM runs WHERE env = ? AND oc = ? "
+            "ORDER BY id DESC LIMIT ?) GROUP BY game_code",
+            (env, oc, runs),
+        ).fetchall()
+    finally:
+        conn.close()
+    return {row["game_code"]: row["duration_ms"] for row in rows}
+
+
+def print_game_history(console: Console, game_code: str, limit: int = HISTORY_LIMIT):
+    rows = game_history(game_code, limit)
+    console.print(f"\n[bold blue]🗃️ Result History: {game_code}[/bold blue]")
+    if not rows:
+        console.print("[yellow]No recorded results[/yellow]")
+        return
+
+    for row in rows:
+        confidence = _format_number(row["confidence"], 3) or "-"
+        latency = _format_number(row["action_latency_ms"]) or "-"
+        console.print(
+            f"run {row['run_id']} {row['started_at'][:19]} {row['env']}/{row['oc']}/"
+            f"{row['language']} {map_mode_check_display(row['mode'])}: "
+            f"{row['status']} (confidence {confidence}, latency {latency} ms)"
+            + (f" {row['message']}" if row["message"] else "")
+        )
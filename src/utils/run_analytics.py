@@ -0,0 +1,449 @@
+import html
+import sqlite3
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from rich.console import Console
+from utils.logger import write_log
+from utils.mapping_utils import map_mode_check_display
+from utils.paths import ANALYTICS_DIR
+from utils.results_store import RESULTS_DB
+from utils.statistics import percentile
+
+
+DEFAULT_SINCE_DAYS = 7
+PASS_STATUS = "success"
+
+CHANGE_HEADERS = ["OC", "Language", "Currency", "Game", "Mode", "Status", "Message"]
+PROVIDER_HEADERS = [
+    "OC",
+    "Runs",
+    "Checks",
+    "Pass rate",
+    "Trend",
+    "Flake rate",
+    "Load p50 (ms)",
+    "Load p95 (ms)",
+    "Action p95 (ms)",
+]
+MODE_HEADERS = [
+    "Mode",
+    "Checks",
+    "Pass rate",
+    "Trend",
+    "Flake rate",
+    "Action p50/p95/p99 (ms)",
+    "Duration p95 (ms)",
+]
+GAME_HEADERS = [
+    "OC",
+    "Game",
+    "Runs",
+    "Pass rate",
+    "Trend",
+    "Flake rate",
+    "Load p95 (ms)",
+    "Action p95 (ms)",
+]
+
+
+class _Series:
+    """Pass counts, flips and latencies of one group of checks"""
+
+    def __init__(self):
+        self.runs = 0
+        self.checks = 0
+        self.passes = 0
+        self.recent_checks = 0  # second half of the window, for the trend
+        self.recent_passes = 0
+        self.transitions = 0
+        self.flips = 0
+        self.latencies: List[float] = []
+        self.durations: List[float] = []
+
+    def add_counts(self, check: sqlite3.Row):
+        """Fold in one check's (oc, game, mode) counts from `_CHECK_COUNTS`"""
+        self.runs = max(self.runs, check["checks"])  # one result per run
+        self.checks += check["checks"]
+        self.passes += check["passes"]
+        self.recent_checks += check["recent_checks"]
+        self.recent_passes += check["recent_passes"]
+        self.transitions += check["transitions"]
+        self.flips += check["flips"]
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passes / self.checks if self.checks else 0.0
+
+    @property
+    def trend(self) -> Optional[float]:
+        """Pass rate of the recent half minus the older half, in points"""
+        older_checks = self.checks - self.recent_checks
+        if not self.recent_checks or not older_checks:
+            return None
+        older_rate = (self.passes - self.recent_passes) / older_checks
+        return (self.recent_passes / self.recent_checks - older_rate) * 100
+
+    @property
+    def flake_rate(self) -> float:
+        return self.flips / self.transitions if self.transitions else 0.0
+
+
+# Counts per check, aggregated by SQLite. A flip compares a result with the
+# previous run of the same combination, so runs of other languages or
+# currencies in between don't count as flips.
+_CHECK_COUNTS = """
+SELECT oc, game_code, mode,
+    COUNT(*) AS checks,
+    SUM(passed) AS passes,
+    SUM(recent) AS recent_checks,
+    SUM(passed AND recent) AS recent_passes,
+    COUNT(previous) AS transitions,
+    SUM(passed != previous) AS flips
+FROM (
+    SELECT runs.oc, results.game_code, results.mode,
+        results.status = :pass AS passed,
+        runs.started_at >= :midpoint AS recent,
+        LAG(results.status = :pass) OVER (
+            PARTITION BY runs.oc, runs.language, runs.currency,
+                results.game_code, results.mode
+            ORDER BY runs.started_at, runs.id
+        ) AS previous
+    FROM runs JOIN results ON results.run_id = runs.id
+    WHERE runs.env = :env AND runs.started_at >= :since
+)
+GROUP BY oc, game_code, mode
+"""
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _window_runs(conn: sqlite3.Connection, env: str, since: str) -> List[sqlite3.Row]:
+    return conn.execute(
+        "SELECT id, oc, language, currency, started_at FROM runs "
+        "WHERE env = ? AND started_at >= ? ORDER BY started_at",
+        (env, since),
+    ).fetchall()
+
+
+def _regressions(
+    conn: sqlite3.Connection,
+    env: str,
+    oc: str,
+    language: Optional[str],
+    currency: Optional[str],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Checks that broke / got fixed between the last two runs of a combination"""
+    runs = conn.execute(
+        "SELECT id FROM runs WHERE env = ? AND oc = ? "
+        "AND language IS ? AND currency IS ? "
+        "ORDER BY started_at DESC, id DESC LIMIT 2",
+        (env, oc, language, currency),
+    ).fetchall()
+    if len(runs) < 2:
+        return [], []
+
+    latest, previous = (run["id"] for run in runs)
+    statuses = defaultdict(dict)
+    for row in conn.execute(
+        "SELECT run_id, game_code, mode, status, message FROM results "
+        "WHERE run_id IN (?, ?)",
+        (latest, previous),
+    ):
+        statuses[(row["game_code"], row["mode"])][row["run_id"]] = row
+
+    regressed, fixed = [], []
+    for (game_code, mode), by_run in sorted(statuses.items()):
+        if latest not in by_run or previous not in by_run:
+            continue
+        was_passing = by_run[previous]["status"] == PASS_STATUS
+        is_passing = by_run[latest]["status"] == PASS_STATUS
+        entry = {
+            "oc": oc,
+            "language": language or "",
+            "currency": currency or "",
+            "game": game_code,
+            "mode": map_mode_check_display(mode),
+            "status": by_run[latest]["status"],
+            "message": by_run[latest]["message"] or "",
+        }
+        if was_passing and not is_passing:
+            regressed.append(entry)
+        elif is_passing and not was_passing:
+            fixed.append(entry)
+    return regressed, fixed
+
+
+def compute_analytics(
+    env: str, since_days: float = DEFAULT_SINCE_DAYS, db_path: Path = RESULTS_DB
+) -> Optional[Dict[str, Any]]:
+    """Trend, flake and latency tables over the runs of `env` in the window"""
+    if not db_path.exists():
+        return None
+
+    now = datetime.now(timezone.utc)
+    since = (now - timedelta(days=since_days)).isoformat()
+    midpoint = (now - timedelta(days=since_days / 2)).isoformat()
+
+    conn = _connect(db_path)
+    try:
+        runs = _window_runs(conn, env, since)
+        if not runs:
+            return None
+        run_oc = {run["id"]: run["oc"] for run in runs}
+
+        by_game: Dict[Tuple[str, str], _Series] = defaultdict(_Series)
+        by_mode: Dict[str, _Series] = defaultdict(_Series)
+        by_provider: Dict[str, _Series] = defaultdict(_Series)
+        params = {"pass": PASS_STATUS, "midpoint": midpoint, "env": env, "since": since}
+        for check in conn.execute(_CHECK_COUNTS, params):
+            oc, game_code, mode = check["oc"], check["game_code"], check["mode"]
+            for series in (by_game[(oc, game_code)], by_mode[mode], by_provider[oc]):
+                series.add_counts(check)
+        for oc, run_count in Counter(run["oc"] for run in runs).items():
+            by_provider[oc].runs = run_count
+
+        # Percentiles need the values themselves, SQLite has no aggregate for them
+        for oc, game_code, mode, latency, duration in conn.execute(
+            "SELECT runs.oc, results.game_code, results.mode, "
+            "results.action_latency_ms, results.duration_ms "
+            "FROM runs JOIN results ON results.run_id = runs.id "
+            "WHERE runs.env = ? AND runs.started_at >= ? AND "
+            "(results.action_latency_ms IS NOT NULL "
+            "OR results.duration_ms IS NOT NULL)",
+            (env, since),
+        ):
+            for series in (by_game[(oc, game_code)], by_mode[mode], by_provider[oc]):
+                if latency is not None:
+                    series.latencies.append(latency)
+                if duration is not None:
+                    series.durations.append(duration)
+
+        loads: Dict[str, List[float]] = defaultdict(list)
+        game_loads: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        for run_id, game_code, load_ms in conn.execute(
+            "SELECT game_loads.run_id, game_loads.game_code, game_loads.load_ms "
+            "FROM runs JOIN game_loads ON game_loads.run_id = runs.id "
+            "WHERE runs.env = ? AND runs.started_at >= ?",
+            (env, since),
+        ):
+            loads[run_oc[run_id]].append(load_ms)
+            game_loads[(run_oc[run_id], game_code)].append(load_ms)
+
+        regressed, fixed = [], []
+        combinations = {(run["oc"], run["language"], run["currency"]) for run in runs}
+        for oc, language, currency in sorted(
+            combinations, key=lambda combo: tuple(value or "" for value in combo)
+        ):
+            combo_regressed, combo_fixed = _regressions(
+                conn, env, oc, language, currency
+            )
+            regressed.extend(combo_regressed)
+            fixed.extend(combo_fixed)
+    finally:
+        conn.close()
+
+    return {
+        "env": env,
+        "since": since,
+        "generated_at": now.isoformat(),
+        "runs": len(runs),
+        "by_game": by_game,
+        "by_mode": by_mode,
+        "by_provider": by_provider,
+        "loads": loads,
+        "game_loads": game_loads,
+        "regressed": regressed,
+        "fixed": fixed,
+    }
+
+
+def _pct(value: float) -> str:
+    return f"{value * 100:.1f}%"
+
+
+def _trend(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:+.1f} pp"
+
+
+def _ms(values: List[float], p: float) -> str:
+    return f"{percentile(values, p):.0f}" if values else "-"
+
+
+def _tables(analytics: Dict[str, Any]) -> List[Tuple[str, List[str], List[List[str]]]]:
+    """(title, headers, rows) for every section of the summary"""
+    tables = [
+        (
+            "Regressed since the previous run",
+            CHANGE_HEADERS,
+            [list(entry.values()) for entry in analytics["regressed"]],
+        ),
+        (
+            "Fixed since the previous run",
+            CHANGE_HEADERS,
+            [list(entry.values()) for entry in analytics["fixed"]],
+        ),
+    ]
+
+    tables.append(
+        (
+            "Providers",
+            PROVIDER_HEADERS,
+            [
+                [
+                    oc,
+                    str(s.runs),
+                    str(s.checks),
+                    _pct(s.pass_rate),
+                    _trend(s.trend),
+                    _pct(s.flake_rate),
+                    _ms(analytics["loads"][oc], 50),
+                    _ms(analytics["loads"][oc], 95),
+                    _ms(s.latencies, 95),
+                ]
+                for oc, s in sorted(analytics["by_provider"].items())
+            ],
+        )
+    )
+
+    tables.append(
+        (
+            "Modes",
+            MODE_HEADERS,
+            [
+                [
+                    map_mode_check_display(mode),
+                    str(s.checks),
+                    _pct(s.pass_rate),
+                    _trend(s.trend),
+                    _pct(s.flake_rate),
+                    "/".join(_ms(s.latencies, p) for p in (50, 95, 99)),
+                    _ms(s.durations, 95),
+                ]
+                for mode, s in sorted(analytics["by_mode"].items())
+            ],
+        )
+    )
+
+    # Least stable games first
+    games = sorted(
+        analytics["by_game"].items(),
+        key=lambda item: (-item[1].flake_rate, item[1].pass_rate, item[0]),
+    )
+    tables.append(
+        (
+            "Games",
+            GAME_HEADERS,
+            [
+                [
+                    oc,
+                    game_code,
+                    str(s.runs),
+                    _pct(s.pass_rate),
+                    _trend(s.trend),
+                    _pct(s.flake_rate),
+                    _ms(analytics["game_loads"][(oc, game_code)], 95),
+                    _ms(s.latencies, 95),
+                ]
+                for (oc, game_code), s in games
+            ],
+        )
+    )
+    return tables
+
+
+def _title(analytics: Dict[str, Any]) -> str:
+    return (
+        f"Run analytics: {analytics['env']} since {analytics['since'][:10]} "
+        f"({analytics['runs']} runs)"
+    )
+
+
+def render_markdown(analytics: Dict[str, Any]) -> str:
+    lines = [f"# {_title(analytics)}", "", f"Generated {analytics['generated_at']}"]
+    for title, headers, rows in _tables(analytics):
+        lines += ["", f"## {title}", ""]
+        if not rows:
+            lines.append("_None_")
+            continue
+        lines.append("| " + " | ".join(headers) + " |")
+        lines.append("|" + "---|" * len(headers))
+        for row in rows:
+            cells = (str(cell).replace("|", "\\|") for cell in row)
+            lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def render_html(analytics: Dict[str, Any]) -> str:
+    parts = [
+        "<!doctype html><html><head><meta charset='utf-8'>",
+        f"<title>{html.escape(_title(analytics))}</title>",
+        "<style>body{font-family:sans-serif;margin:24px}"
+        "table{border-collapse:collapse;margin-bottom:24px}"
+        "th,td{border:1px solid #ccc;padding:4px 8px;text-align:left}"
+        "th{background:#f0f0f0}</style></head><body>",
+        f"<h1>{html.escape(_title(analytics))}</h1>",
+        f"<p>Generated {html.escape(analytics['generated_at'])}</p>",
+    ]
+    for title, headers, rows in _tables(analytics):
+        parts.append(f"<h2>{html.escape(title)}</h2>")
+        if not rows:
+            parts.append("<p><em>None</em></p>")
+            continue
+        parts.append(
+            "<table><tr>"
+            + "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+            + "</tr>"
+        )
+        for row in rows:
+            parts.append(
+                "<tr>"
+                + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row)
+                + "</tr>"
+            )
+        parts.append("</table>")
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def run_analytics(
+    console: Console,
+    env: str,
+    since_days: float = DEFAULT_SINCE_DAYS,
+    output_dir: Path = ANALYTICS_DIR,
+    db_path: Path = RESULTS_DB,
+) -> Optional[Path]:
+    """Write Markdown and HTML summaries of `env`'s recent runs"""
+    start_time = time.perf_counter()
+    analytics = compute_analytics(env, since_days, db_path)
+    if analytics is None:
+        console.print(
+            f"[yellow]No stored runs for {env} in the last {since_days:g} days[/yellow]"
+        )
+        return None
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{env}_{analytics['generated_at'][:10]}"
+    markdown_file = output_dir / f"{stem}.md"
+    markdown_file.write_text(render_markdown(analytics), encoding="utf-8")
+    html_file = output_dir / f"{stem}.html"
+    html_file.write_text(render_html(analytics), encoding="utf-8")
+
+    elapsed = time.perf_counter() - start_time
+    console.print(
+        f"[bold green]📊 Analytics for {analytics['runs']} {env} runs written to "
+        f"{output_dir / stem}.{{md,html}} in {elapsed:.1f}s[/bold green]"
+    )
+    if analytics["regressed"]:
+        console.print(
+            f"[red]{len(analytics['regressed'])} checks regressed "
+            "since the previous run[/red]"
+        )
+    write_log(f"📊 Run analytics for {env} written to {markdown_file}")
+    return markdown_file
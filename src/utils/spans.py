@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from array import array
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List
+from rich.console import Console
+from utils.logger import write_log
+
+
+SPAN_CAPACITY = 1 << 17  # spans kept per run, later ones are counted as dropped
+
+# Set by each game worker and game, so nested calls don't pass them around
+_worker: ContextVar[int] = ContextVar("span_worker", default=0)
+_game: ContextVar[str] = ContextVar("span_game", default="")
+
+
+def set_span_worker(worker: int):
+    _worker.set(worker)
+
+
+def set_span_game(game_code: str):
+    _game.set(game_code)
+
+
+class SpanBuffer:
+    """Preallocated columnar store of timed stages, strings interned to small ints"""
+
+    def __init__(self, capacity: int = SPAN_CAPACITY):
+        self.capacity = capacity
+        self.name = array("I", [0]) * capacity
+        self.game = array("I", [0]) * capacity
+        self.detail = array("I", [0]) * capacity
+        self.worker = array("I", [0]) * capacity
+        self.start = array("d", [0.0]) * capacity  # seconds since the run started
+        self.duration = array("d", [0.0]) * capacity
+        # Screenshot matching records spans from worker threads
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._game_totals = defaultdict(lambda: defaultdict(float))
+        self.count = 0
+        self.dropped = 0
+        self.epoch = time.perf_counter()
+        self.trace_file = None
+        self._intern("")  # an empty detail is id 0
+
+    def _intern(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, name: str, start: float, end: float, detail: str = ""):
+        """Add one span; start and end are `time.perf_counter()` values"""
+        game = _game.get()
+        worker = _worker.get()
+        with self._lock:
+            self._game_totals[game][name] += end - start
+            i = self.count
+            if i >= self.capacity:
+                self.dropped += 1
+                return
+            self.name[i] = self._intern(name)
+            self.game[i] = self._intern(game)
+            self.detail[i] = self._intern(detail)
+            self.worker[i] = worker
+            self.start[i] = start - self.epoch
+            self.duration[i] = end - start
+            self.count = i + 1
+
+    def game_totals(self, game_code: str) -> Dict[str, float]:
+        """Seconds spent in each stage of one game"""
+        return dict(self._game_totals.get(game_code, {}))
+
+    def write_chrome_trace(self, output_file: Path) -> int:
+        """Write the run as Chrome trace-event JSON, returns the span count
+
+        Each worker is a thread, so stages of concurrent games show side by side
+        in chrome://tracing or Perfetto.
+        """
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": worker,
+                "args": {"name": f"worker {worker}"},
+            }
+            for worker in sorted(set(self.worker[: self.count]))
+        ]
+        for i in range(self.count):
+            args = {"game": self._strings[self.game[i]]}
+            if self.detail[i]:
+                args["detail"] = self._strings[self.detail[i]]
+            events.append(
+                {
+                    "name": self._strings[self.name[i]],
+                    "cat": "game",
+                    "ph": "X",
+                    "ts": round(self.start[i] * 1e6),
+                    "dur": round(self.duration[i] * 1e6),
+                    "pid": 1,
+                    "tid": self.worker[i],
+                    "args": args,
+                }
+            )
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with output_file.open("w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        self.trace_file = output_file
+        if self.dropped:
+            write_log(f"⚠️ Span buffer full, {self.dropped} spans not traced")
+        return self.count
+
+    def print_report(self, console: Console):
+        if not self.trace_file:
+            return
+        totals = defaultdict(float)
+        for stages in self._game_totals.values():
+            for name, seconds in stages.items():
+                totals[name] += seconds
+
+        console.print(f"\n[bold blue]🧵 Stage Timings:[/bold blue]")
+        console.print(
+            ", ".join(
+                f"{name} {seconds:.1f}s"
+                for name, seconds in sorted(totals.items(), key=lambda t: -t[1])
+            )
+        )
+        console.print(
+            f"Trace of {self.count} spans: {self.trace_file} "
+            "(open in chrome://tracing or ui.perfetto.dev)"
+        )
+
+
+spans = SpanBuffer()
+
+
+@contextmanager
+def span(name: str, detail: str = ""):
+    """Time a stage of the current game on the current worker"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        spans.record(name, start, time.perf_counter(), detail)
@@ -0,0 +1,77 @@
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+from rich.console import Console
+
+
+SRC_DIR = Path(__file__).parent.parent
+STARTUP_TARGET_MS = 400  # interpreter start to first interactive prompt
+HEAVY_MODULES = ["cv2", "numpy", "playwright", "requests"]
+TOP_IMPORTS = 15
+
+# Everything the interactive run does before showing its first prompt
+FIRST_PROMPT_PROBE = (
+    "import main; "
+    "main._get_meta_data(); "
+    "from cli import prompts; "
+    "prompts.questionary.select"
+)
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _parse_import_times(stderr: str) -> List[Tuple[str, int, float, float]]:
+    """(module, depth, self ms, cumulative ms) from `-X importtime` output"""
+    rows = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            depth = len(indent) // 2
+            rows.append((module, depth, int(self_us) / 1000, int(cumulative_us) / 1000))
+    return rows
+
+
+def profile_startup(console: Console, target_ms: float = STARTUP_TARGET_MS) -> bool:
+    """Time a fresh interpreter up to the first prompt; True when within target"""
+    start_time = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", FIRST_PROMPT_PROBE],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+    )
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+    if result.returncode != 0:
+        console.print(f"[red]❌ Startup probe failed:[/red]\n{result.stderr[-2000:]}")
+        return False
+
+    rows = _parse_import_times(result.stderr)
+    loaded = {module for module, _, _, _ in rows}
+
+    console.print(f"\n[bold blue]🚦 Startup Import Profile:[/bold blue]")
+    top_level = sorted(
+        (row for row in rows if row[1] == 1), key=lambda row: row[3], reverse=True
+    )
+    for module, _, self_ms, cumulative_ms in top_level[:TOP_IMPORTS]:
+        console.print(f"{cumulative_ms:8.1f} ms  (self {self_ms:6.1f} ms)  {module}")
+
+    eager = [module for module in HEAVY_MODULES if module in loaded]
+    if eager:
+        console.print(
+            f"[yellow]⚠️ Loaded before the first prompt: {', '.join(eager)}[/yellow]"
+        )
+    else:
+        console.print(f"Heavy modules deferred: {', '.join(HEAVY_MODULES)}")
+
+    within_target = elapsed_ms <= target_ms
+    color = "green" if within_target else "red"
+    console.print(
+        f"[{color}]Time to first prompt: {elapsed_ms:.0f} ms "
+        f"(target {target_ms:.0f} ms)[/{color}]"
+    )
+    return within_target
@@ -1,13 +1,88 @@
+import heapq
+import math
 from utils.mapping_utils import map_mode_check_display
 from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
 from rich.console import Console
 
 
-class GameStatistics:
-    """Track test results by mode across all games"""
+# Bucket bounds grow by 2^(1/8) (~9%) from 1 ms, up to ~9 hours in 200 buckets
+HISTOGRAM_MIN_MS = 1.0
+BUCKETS_PER_DOUBLING = 8
+HISTOGRAM_BUCKETS = 200
+SUMMARY_PERCENTILES = (50, 90, 99)
+SLOWEST_GAMES = 10
+
+# Per-game latencies are recorded with this mode
+ALL_MODES = ""
+LATENCY_METRICS = ["load", "ready", "match", "click", "total"]
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile (pct in 0-100) of unsorted values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class LatencyHistogram:
+    """Fixed log-scale buckets of millisecond latencies, so memory stays constant
+
+    Percentiles are the geometric middle of their bucket, within ~5% of the
+    exact value. Histograms of parallel workers add up bucket by bucket.
+    """
 
     def __init__(self):
+        self.counts = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.max = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, value_ms: float):
+        value_ms = max(value_ms, HISTOGRAM_MIN_MS)
+        index = int(math.log2(value_ms / HISTOGRAM_MIN_MS) * BUCKETS_PER_DOUBLING)
+        self.counts[min(index, HISTOGRAM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.max = max(self.max, value_ms)
+
+    def merge(self, other: "LatencyHistogram"):
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(self.count * pct / 100), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                middle = HISTOGRAM_MIN_MS * 2 ** ((index + 0.5) / BUCKETS_PER_DOUBLING)
+                return min(middle, self.max)
+        return self.max
+
+
+class GameStatistics:
+    """Track test results by mode and latency histograms across all games"""
+
+    def __init__(self, env: str = "", oc: str = ""):
+        self.env = env
+        self.oc = oc
         self.results_by_mode = defaultdict(lambda: {"success": 0, "failed": 0})
+        # (metric, oc, mode) -> latencies in ms; per-game metrics use ALL_MODES
+        self.latencies: Dict[Tuple[str, str, str], LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+        # min-heap of (total ms, game code, oc) holding the slowest games
+        self.slowest: List[Tuple[float, str, str]] = []
 
     def add_result(self, mode: str, status: str):
         """Add a test result for a specific mode"""
@@ -16,6 +91,35 @@ class GameStatistics:
         else:
             self.results_by_mode[mode]["failed"] += 1
 
+    def add_action_latency(self, mode: str, latency_ms: float):
+        """Record how long betService/gameService took to answer a click"""
+        self.add_latency("click", latency_ms, mode)
+
+    def add_latency(self, metric: str, latency_ms: float, mode: str = ALL_MODES):
+        self.latencies[(metric, self.oc, mode)].record(latency_ms)
+
+    def add_game_time(self, game_code: str, total_ms: float):
+        """Record a game's total check time, keeping only the slowest games"""
+        self.add_latency("total", total_ms)
+        entry = (total_ms, game_code, self.oc)
+        if len(self.slowest) < SLOWEST_GAMES:
+            heapq.heappush(self.slowest, entry)
+        else:
+            heapq.heappushpop(self.slowest, entry)
+
+    def merge(self, other: "GameStatistics"):
+        """Add another worker's or run's results and latencies to these"""
+        for mode, results in other.results_by_mode.items():
+            for status, count in results.items():
+                self.results_by_mode[mode][status] += count
+        for key, histogram in other.latencies.items():
+            self.latencies[key].merge(histogram)
+        for entry in other.slowest:
+            if len(self.slowest) < SLOWEST_GAMES:
+                heapq.heappush(self.slowest, entry)
+            else:
+                heapq.heappushpop(self.slowest, entry)
+
     def print_final_summary(self, console: Console):
         console.print(f"\n[bold blue]📊 Final Results Summary:[/bold blue]")
 
@@ -30,3 +134,33 @@ class GameStatistics:
                 f"[red]{results['failed']} ❌[/red] "
                 f"({success_rate:.1f}% success rate)"
             )
+
+        self.print_latency_summary(console)
+
+    def print_latency_summary(self, console: Console):
+        if not self.latencies:
+            return
+
+        console.print(
+            f"\n[bold blue]⚡ Latency by stage "
+            f"(p50 / p90 / p99 ms, {self.env or '-'}):[/bold blue]"
+        )
+        ordered = sorted(
+            self.latencies.items(),
+            key=lambda item: (LATENCY_METRICS.index(item[0][0]), item[0][1:]),
+        )
+        for (metric, oc, mode), histogram in ordered:
+            p50, p90, p99 = (histogram.percentile(p) for p in SUMMARY_PERCENTILES)
+            scope = f"{oc or '-'}"
+            if mode != ALL_MODES:
+                scope += f" / {map_mode_check_display(mode)}"
+            console.print(
+                f"🔧 {metric} {scope}: {p50:.0f} / {p90:.0f} / {p99:.0f} "
+                f"({len(histogram)} samples)"
+            )
+
+        if self.slowest:
+            console.print(f"\n[bold blue]🐢 Slowest Games:[/bold blue]")
+        for total_ms, game_code, oc in sorted(self.slowest, reverse=True):
+            minutes, seconds = divmod(int(total_ms / 1000), 60)
+            console.print(f"{game_code} ({oc or '-'}): {minutes:02d}:{seconds:02d}")
@@ -0,0 +1,142 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+from rich.console import Console
+from utils.http_utils import get_http_session, get_token_by_operator_target
+from utils.logger import write_log
+from utils.statistics import percentile
+
+
+DEFAULT_RATE_LIMIT = 5.0  # token requests per second toward the operator API
+DEFAULT_PROVISION_WORKERS = 4
+GET_TIMEOUT = 30  # seconds to wait for a pre-provisioned token
+
+Combination = Tuple[str, str]  # (currency, language)
+
+# Queued in place of a token whose provisioning failed, so a waiting get()
+# fetches one right away instead of waiting out its timeout
+PROVISION_FAILED = object()
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads"""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class TokenPool:
+    """Pre-creates player tokens for a currency/language matrix in the background"""
+
+    def __init__(
+        self,
+        operator_target: str,
+        combinations: Iterable[Combination],
+        per_combination: int = 1,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        workers: int = DEFAULT_PROVISION_WORKERS,
+    ):
+        self.operator_target = operator_target
+        self.combinations = list(dict.fromkeys(combinations))
+        self.per_combination = per_combination
+        self.limiter = RateLimiter(rate_limit)
+        self.session = get_http_session()
+
+        self._tokens: Dict[Combination, queue.Queue] = {
+            combination: queue.Queue() for combination in self.combinations
+        }
+        self._pending: Dict[Combination, int] = dict.fromkeys(self.combinations, 0)
+        self._stats_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="token-pool"
+        )
+        self.latencies: List[float] = []
+        self.failures = 0
+        self.handed_out = 0
+
+    def start(self):
+        """Queue background provisioning for every combination"""
+        for combination in self.combinations:
+            for _ in range(self.per_combination):
+                with self._stats_lock:
+                    self._pending[combination] += 1
+                self._executor.submit(self._provision_into_pool, combination)
+        write_log(
+            f"🎟️ Provisioning {len(self.combinations) * self.per_combination} tokens "
+            f"for {len(self.combinations)} currency/language combinations"
+        )
+
+    def _provision(self, combination: Combination) -> str:
+        currency, language = combination
+        self.limiter.acquire()
+        start_time = time.perf_counter()
+        try:
+            return get_token_by_operator_target(
+                operator_target=self.operator_target,
+                currency=currency,
+                language=language,
+                session=self.session,
+            )
+        finally:
+            with self._stats_lock:
+                self.latencies.append(time.perf_counter() - start_time)
+
+    def _provision_into_pool(self, combination: Combination):
+        try:
+            self._tokens[combination].put(self._provision(combination))
+        except Exception as e:
+            with self._stats_lock:
+                self.failures += 1
+            write_log(f"⚠️ Token provisioning failed for {combination}: {e}")
+            self._tokens[combination].put(PROVISION_FAILED)
+        finally:
+            with self._stats_lock:
+                self._pending[combination] -= 1
+
+    def get(self, currency: str, language: str, timeout: float = GET_TIMEOUT) -> str:
+        """Hand out a pre-created token, provisioning on demand if none is ready"""
+        combination = (currency, language)
+        try:
+            if combination not in self._tokens:
+                raise queue.Empty
+            tokens = self._tokens[combination]
+            # Only wait when a background request can still fill the queue
+            if self._pending[combination] > 0:
+                token = tokens.get(timeout=timeout)
+            else:
+                token = tokens.get_nowait()
+        except queue.Empty:
+            token = PROVISION_FAILED
+        if token is PROVISION_FAILED:
+            token = self._provision(combination)
+        with self._stats_lock:
+            self.handed_out += 1
+        return token
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def print_report(self, console: Console):
+        console.print(f"\n[bold blue]🎟️ Token Pool:[/bold blue]")
+        console.print(
+            f"Provisioned {len(self.latencies)} tokens ({self.failures} failed), "
+            f"handed out {self.handed_out}; latency p50/p95: "
+            f"{percentile(self.latencies, 50) * 1000:.0f}/"
+            f"{percentile(self.latencies, 95) * 1000:.0f} ms"
+        )
+        write_log(
+            f"🎟️ Token pool: provisioned={len(self.latencies)} failed={self.failures} "
+            f"handed_out={self.handed_out}"
+        )